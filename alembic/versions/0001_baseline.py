@@ -0,0 +1,26 @@
+"""Baseline: the schema as Base.metadata.create_all built it
+
+Databases created before migrations existed are stamped at this revision
+(alembic stamp 0001_baseline) and upgraded from here. create_all still
+creates missing tables on startup; later revisions retrofit the columns
+and indexes it never adds to tables that already exist.
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = "0001_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    pass
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,68 @@
+"""Fetch pipeline columns on existing tables
+
+Adaptive scheduling and the circuit breaker on sources, per-run progress
+on fetch_logs, and the expiry counter on daily_tender_stats. Each column
+is only added when missing, so databases whose tables were created from
+the current models upgrade as a no-op.
+
+Revision ID: 0002_fetch_pipeline_columns
+Revises: 0001_baseline
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0002_fetch_pipeline_columns"
+down_revision = "0001_baseline"
+branch_labels = None
+depends_on = None
+
+# (table, column, index name or None)
+COLUMNS = [
+    ("sources", sa.Column("fetch_interval_minutes", sa.Integer()), None),
+    ("sources", sa.Column("next_fetch_at", sa.DateTime()), "ix_sources_next_fetch_at"),
+    ("sources", sa.Column(
+        "breaker_state",
+        sa.Enum("CLOSED", "OPEN", "HALF_OPEN", name="breakerstate")
+    ), None),
+    ("sources", sa.Column("breaker_opened_until", sa.DateTime()), None),
+    ("sources", sa.Column("breaker_cooldown_minutes", sa.Integer()), None),
+    ("fetch_logs", sa.Column("pages_fetched", sa.Integer(), server_default="0"), None),
+    ("fetch_logs", sa.Column("run_id", sa.String(32)), "ix_fetch_logs_run_id"),
+    ("daily_tender_stats", sa.Column(
+        "expired_tenders", sa.Integer(), nullable=False, server_default="0"
+    ), None),
+]
+
+
+def _columns(inspector, table: str) -> set:
+    if not inspector.has_table(table):
+        return set()
+    return {column["name"] for column in inspector.get_columns(table)}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    for table, column, index in COLUMNS:
+        # Missing tables are created whole by create_all on startup
+        if not inspector.has_table(table) or column.name in _columns(inspector, table):
+            continue
+
+        op.add_column(table, column)
+        if index:
+            op.create_index(index, table, [column.name])
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    for table, column, index in reversed(COLUMNS):
+        if column.name not in _columns(inspector, table):
+            continue
+
+        if index:
+            op.drop_index(index, table_name=table)
+        op.drop_column(table, column.name)
@@ -0,0 +1,79 @@
+"""Composite indexes for the hot query shapes
+
+Covers the filter + keyset order (created_at, id) of the tender,
+notification and fetch log listings, plus the earlier single-purpose
+indexes (search, expiry sweep, retention, analytics) that create_all
+never added to existing tables. Each index is created only when missing.
+InnoDB builds secondary indexes online, without blocking writes.
+
+Check the resulting plans with `python -m app.core.query_plan`.
+
+Revision ID: 0003_query_indexes
+Revises: 0002_fetch_pipeline_columns
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0003_query_indexes"
+down_revision = "0002_fetch_pipeline_columns"
+branch_labels = None
+depends_on = None
+
+# (name, table, columns, dialect options)
+INDEXES = [
+    # Listings: filter, then keyset pages on (created_at, id)
+    ("ix_tenders_deleted_created", "tenders", ["is_deleted", "created_at", "id"], {}),
+    ("ix_tenders_status_created", "tenders", ["status", "created_at", "id"], {}),
+    ("ix_tenders_source_created", "tenders", ["source_id", "created_at", "id"], {}),
+    ("ix_notifications_user_created", "notifications", ["user_id", "created_at", "id"], {}),
+    (
+        "ix_notifications_user_read_created", "notifications",
+        ["user_id", "is_read", "created_at", "id"], {}
+    ),
+    ("ix_fetch_logs_status_created", "fetch_logs", ["status", "created_at", "id"], {}),
+    ("ix_fetch_logs_source_created", "fetch_logs", ["source_id", "created_at", "id"], {}),
+
+    # Search, expiry sweep, retention and analytics
+    (
+        "ft_tenders_search", "tenders",
+        ["title", "reference_id", "agency_name", "description"],
+        {"mysql_prefix": "FULLTEXT"}
+    ),
+    ("ix_tenders_status_deadline", "tenders", ["status", "deadline_date"], {}),
+    ("ix_tenders_updated_at", "tenders", ["updated_at"], {}),
+    ("ix_refresh_tokens_expires_at", "refresh_tokens", ["expires_at"], {}),
+    (
+        "ix_tender_keyword_matches_created_keyword", "tender_keyword_matches",
+        ["created_at", "keyword_id"], {}
+    ),
+]
+
+
+def _indexes(inspector, table: str) -> set:
+    if not inspector.has_table(table):
+        return set()
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    mysql = op.get_bind().dialect.name == "mysql"
+
+    for name, table, columns, options in INDEXES:
+        if not inspector.has_table(table) or name in _indexes(inspector, table):
+            continue
+        if options.get("mysql_prefix") and not mysql:
+            continue
+
+        op.create_index(name, table, columns, **options)
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    for name, table, columns, options in reversed(INDEXES):
+        if name in _indexes(inspector, table):
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,50 @@
+"""Persist silent-hours deferral on notifications
+
+notifications.deliver_after holds a deferred notification until the end
+of the recipient's silent hours, replacing the in-process queue that lost
+them on restart. Added only when missing.
+
+Revision ID: 0004_notification_deliver_after
+Revises: 0003_query_indexes
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0004_notification_deliver_after"
+down_revision = "0003_query_indexes"
+branch_labels = None
+depends_on = None
+
+TABLE = "notifications"
+COLUMN = "deliver_after"
+INDEX = "ix_notifications_deliver_after"
+
+
+def _columns(inspector) -> set:
+    if not inspector.has_table(TABLE):
+        return set()
+    return {column["name"] for column in inspector.get_columns(TABLE)}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    # A missing table is created whole by create_all on startup
+    if not inspector.has_table(TABLE) or COLUMN in _columns(inspector):
+        return
+
+    op.add_column(TABLE, sa.Column(COLUMN, sa.DateTime(), nullable=True))
+    op.create_index(INDEX, TABLE, [COLUMN])
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if COLUMN not in _columns(inspector):
+        return
+
+    op.drop_index(INDEX, table_name=TABLE)
+    op.drop_column(TABLE, COLUMN)
@@ -0,0 +1,53 @@
+"""Make released notifications visible to the stream relay
+
+notifications.available_at is when a notification may be pushed to live
+streams: its creation, or its release from silent hours. The relay polls
+it instead of created_at, so deferred rows reach streams when they are
+released rather than when they are created. Existing rows are backfilled
+from created_at. Added only when missing.
+
+Revision ID: 0005_notification_available_at
+Revises: 0004_notification_deliver_after
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0005_notification_available_at"
+down_revision = "0004_notification_deliver_after"
+branch_labels = None
+depends_on = None
+
+TABLE = "notifications"
+COLUMN = "available_at"
+INDEX = "ix_notifications_available_at"
+
+
+def _columns(inspector) -> set:
+    if not inspector.has_table(TABLE):
+        return set()
+    return {column["name"] for column in inspector.get_columns(TABLE)}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    # A missing table is created whole by create_all on startup
+    if not inspector.has_table(TABLE) or COLUMN in _columns(inspector):
+        return
+
+    op.add_column(TABLE, sa.Column(COLUMN, sa.DateTime(), nullable=True))
+    op.execute(f"UPDATE {TABLE} SET {COLUMN} = created_at")
+    op.create_index(INDEX, TABLE, [COLUMN])
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if COLUMN not in _columns(inspector):
+        return
+
+    op.drop_index(INDEX, table_name=TABLE)
+    op.drop_column(TABLE, COLUMN)
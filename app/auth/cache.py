@@ -0,0 +1,131 @@
+import hashlib
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.core.security import decode_access_token
+from app.models.user import User
+
+MAX_ENTRIES = 10000
+
+
+class AuthCache:
+    """
+    Short-lived cache of verified token claims and user records.
+
+    Claims are keyed by a hash of the token and never outlive the token's
+    own expiry. Users are stored as column snapshots, never as live ORM
+    objects, and re-attached to the request's session with
+    merge(load=False), so a cache hit costs no query and handlers can
+    still modify and commit the user as before.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._claims: Dict[str, Tuple[float, dict]] = {}
+        self._users: Dict[str, Tuple[float, dict]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _token_key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    @staticmethod
+    def _prune(entries: Dict, now: float):
+        if len(entries) > MAX_ENTRIES:
+            for key in [k for k, (expires, _) in entries.items() if expires <= now]:
+                del entries[key]
+
+    def get_claims(self, token: str) -> Optional[dict]:
+        """Decoded token payload, or None if the token is invalid or expired"""
+        key = self._token_key(token)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._claims.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+
+        payload = decode_access_token(token)
+        if payload is None:
+            return None
+
+        ttl = self.ttl_seconds
+        if payload.get("exp"):
+            ttl = min(ttl, payload["exp"] - time.time())
+
+        if ttl > 0:
+            with self._lock:
+                self._claims[key] = (now + ttl, payload)
+                self._prune(self._claims, now)
+
+        return payload
+
+    async def get_user(self, db: AsyncSession, email: str) -> Optional[User]:
+        """User for an email, attached to `db`; cached between requests"""
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._users.get(email)
+            snapshot = entry[1] if entry and entry[0] > now else None
+
+        if snapshot is not None:
+            user = User(**snapshot)
+            make_transient_to_detached(user)
+            return await db.merge(user, load=False)
+
+        result = await db.execute(select(User).where(User.email == email))
+        user = result.scalar_one_or_none()
+
+        if user is not None:
+            snapshot = {
+                column.key: getattr(user, column.key)
+                for column in inspect(User).column_attrs
+            }
+            with self._lock:
+                self._users[email] = (now + self.ttl_seconds, snapshot)
+                self._prune(self._users, now)
+
+        return user
+
+    def invalidate_user(self, email: Optional[str] = None, user_id: Optional[int] = None):
+        """
+        Forget a user's record and every cached token claim for them.
+
+        Call after logout, password or email changes and deactivation.
+        """
+        with self._lock:
+            emails = set()
+            if email:
+                emails.add(email)
+            if user_id is not None:
+                emails.update(
+                    e for e, (_, snapshot) in self._users.items() if snapshot.get("id") == user_id
+                )
+
+            for e in emails:
+                self._users.pop(e, None)
+
+            for key in [k for k, (_, claims) in self._claims.items() if claims.get("sub") in emails]:
+                del self._claims[key]
+
+    def clear(self):
+        with self._lock:
+            self._claims.clear()
+            self._users.clear()
+
+
+# SINGLE INSTANCE
+auth_cache = AuthCache(ttl_seconds=settings.AUTH_CACHE_TTL_SECONDS)
+
+
+@event.listens_for(User.is_active, "set")
+def _on_user_active_changed(target, value, oldvalue, initiator):
+    # Deactivation must take effect on the next request, whichever code path did it
+    if not inspect(target).transient and value != oldvalue:
+        auth_cache.invalidate_user(email=target.email, user_id=target.id)
@@ -1,9 +1,8 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from app.core.database import get_db
-from app.core.security import decode_access_token
+from app.auth.cache import auth_cache
 from app.models.user import User
 
 security = HTTPBearer()
@@ -28,8 +27,8 @@ async def get_current_user(
     """
     token = credentials.credentials
 
-    # Decode token
-    payload = decode_access_token(token)
+    # Decode token (verified claims are cached briefly)
+    payload = auth_cache.get_claims(token)
     if not payload:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -45,9 +44,7 @@ async def get_current_user(
             detail="Invalid token payload"
         )
 
-    query = select(User).where(User.email == email)
-    result = await db.execute(query)
-    user = result.scalar_one_or_none()
+    user = await auth_cache.get_user(db, email)
 
     if not user:
         raise HTTPException(
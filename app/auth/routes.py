@@ -4,8 +4,8 @@ from sqlalchemy import select
 from datetime import timedelta
 from app.core.database import get_db
 from app.core.security import (
-    verify_password,
-    get_password_hash,
+    verify_password_async,
+    get_password_hash_async,
     create_access_token
 )
 from app.core.config import settings
@@ -56,7 +56,7 @@ async def login(
     user = result.scalar_one_or_none()
 
     # Verify user and password
-    if not user or not verify_password(login_data.password, user.hashed_password):
+    if not user or not await verify_password_async(login_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
@@ -118,7 +118,7 @@ async def register(
     user = User(
         email=register_data.email,
         full_name=register_data.full_name,
-        hashed_password=get_password_hash(register_data.password),
+        hashed_password=await get_password_hash_async(register_data.password),
         is_active=True,
         is_superuser=False
     )
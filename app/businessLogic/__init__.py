@@ -3,11 +3,27 @@ from app.businessLogic.keyword_service import KeywordService
 from app.businessLogic.source_service import SourceService
 from app.businessLogic.notification_service import NotificationService
 from app.businessLogic.change_detection_service import ChangeDetectionService
+from app.businessLogic.subscription_service import SubscriptionService
+from app.businessLogic.search_service import SearchService
+from app.businessLogic.stats_service import StatsService
+from app.businessLogic.fetch_job_service import FetchJobService
+from app.businessLogic.fetch_run_service import FetchRunService
+from app.businessLogic.retention_service import RetentionService
+from app.businessLogic.archive_service import ArchiveService
+from app.businessLogic.status_transition_service import StatusTransitionService
 
 __all__ = [
     "TenderService",
     "KeywordService",
     "SourceService",
     "NotificationService",
-    "ChangeDetectionService"
+    "ChangeDetectionService",
+    "SubscriptionService",
+    "SearchService",
+    "StatsService",
+    "FetchJobService",
+    "FetchRunService",
+    "RetentionService",
+    "ArchiveService",
+    "StatusTransitionService"
 ]
\ No newline at end of file
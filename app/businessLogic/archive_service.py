@@ -0,0 +1,162 @@
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import select, insert, delete, update, union_all, func, literal, DateTime
+from typing import Callable, Dict, Optional
+from datetime import date, datetime, timedelta
+import logging
+
+from app.core.config import settings
+from app.core.cache import response_cache, TENDERS
+from app.models.archive import TenderArchive, TenderKeywordMatchArchive
+from app.models.keyword import TenderKeywordMatch
+from app.models.notification import Notification
+from app.models.tender import Tender
+
+logger = logging.getLogger(__name__)
+
+_TENDER_COLUMNS = [column.name for column in Tender.__table__.columns]
+_MATCH_COLUMNS = [column.name for column in TenderKeywordMatch.__table__.columns]
+
+
+class ArchiveService:
+    """
+    Moves long-expired tenders (and their keyword matches) out of the hot
+    tables so listings, search and sweeps only touch live data.
+    """
+
+    @staticmethod
+    def cutoff(today: Optional[date] = None) -> date:
+        """Tenders with a deadline before this date are archived"""
+        return (today or date.today()) - timedelta(days=settings.ARCHIVE_AFTER_DAYS)
+
+    @staticmethod
+    def candidates(cutoff: date, chunk_size: Optional[int] = None):
+        """Ids of the next chunk of tenders with deadline_date < cutoff"""
+        return select(Tender.id).where(
+            Tender.deadline_date < cutoff,
+            Tender.is_deleted == False
+        ).order_by(Tender.id).limit(chunk_size or settings.ARCHIVE_CHUNK_SIZE)
+
+    @staticmethod
+    def archive_chunk(db: Session, cutoff: date, chunk_size: Optional[int] = None) -> int:
+        """
+        Move up to `chunk_size` tenders with deadline_date < cutoff into the
+        archive tables in one transaction: copy with INSERT ... SELECT,
+        unlink notifications, then delete from the hot tables.
+
+        Returns:
+            Tenders archived; fewer than `chunk_size` means none are left
+        """
+        chunk_size = chunk_size or settings.ARCHIVE_CHUNK_SIZE
+
+        try:
+            ids = db.execute(
+                ArchiveService.candidates(cutoff, chunk_size).with_for_update()
+            ).scalars().all()
+
+            if not ids:
+                db.rollback()
+                return 0
+
+            now = datetime.utcnow()
+
+            db.execute(
+                insert(TenderArchive).from_select(
+                    _TENDER_COLUMNS + ["archived_at"],
+                    select(
+                        *[Tender.__table__.c[name] for name in _TENDER_COLUMNS],
+                        literal(now, DateTime)
+                    ).where(Tender.id.in_(ids))
+                )
+            )
+            db.execute(
+                insert(TenderKeywordMatchArchive).from_select(
+                    _MATCH_COLUMNS + ["archived_at"],
+                    select(
+                        *[TenderKeywordMatch.__table__.c[name] for name in _MATCH_COLUMNS],
+                        literal(now, DateTime)
+                    ).where(TenderKeywordMatch.tender_id.in_(ids))
+                )
+            )
+
+            # notifications.tender_id has no ON DELETE; users keep the notification
+            db.execute(
+                update(Notification).where(
+                    Notification.tender_id.in_(ids)
+                ).values(tender_id=None)
+            )
+
+            db.execute(delete(TenderKeywordMatch).where(TenderKeywordMatch.tender_id.in_(ids)))
+            db.execute(delete(Tender).where(Tender.id.in_(ids)))
+
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        response_cache.invalidate(TENDERS)
+
+        return len(ids)
+
+    @staticmethod
+    def archive_expired(
+            db: Session,
+            today: Optional[date] = None,
+            pause: Optional[Callable[[], None]] = None
+    ) -> int:
+        """Archive every tender past the cutoff, chunk by chunk, calling `pause` between chunks"""
+        cutoff = ArchiveService.cutoff(today)
+        chunk_size = settings.ARCHIVE_CHUNK_SIZE
+        total = 0
+
+        while True:
+            moved = ArchiveService.archive_chunk(db, cutoff, chunk_size)
+            total += moved
+            if moved < chunk_size:
+                break
+            if pause:
+                pause()
+
+        if total:
+            logger.info(f"Archived {total} tenders with deadlines before {cutoff}")
+
+        return total
+
+    @staticmethod
+    def tender_entity(include_archived: bool = False):
+        """
+        Tender, or (with `include_archived`) Tender mapped over
+        tenders UNION ALL tenders_archive, so the same query code reads both.
+        Rows loaded this way are read-only.
+        """
+        if not include_archived:
+            return Tender
+
+        hot = select(*[Tender.__table__.c[name] for name in _TENDER_COLUMNS])
+        cold = select(*[TenderArchive.__table__.c[name] for name in _TENDER_COLUMNS])
+
+        return aliased(Tender, union_all(hot, cold).subquery("tenders_all"))
+
+    @staticmethod
+    def is_archived(db: Session, reference_id: str, source_id: int) -> bool:
+        """Whether a scraped tender was already archived (so it isn't re-created)"""
+        return db.query(TenderArchive.id).filter(
+            TenderArchive.reference_id == reference_id,
+            TenderArchive.source_id == source_id
+        ).first() is not None
+
+    @staticmethod
+    def get_archived(db: Session, tender_id: int) -> Optional[Tender]:
+        """An archived tender as a (transient, read-only) Tender"""
+        row = db.query(TenderArchive).filter(TenderArchive.id == tender_id).first()
+        if not row:
+            return None
+
+        return Tender(**{name: getattr(row, name) for name in _TENDER_COLUMNS})
+
+    @staticmethod
+    def counts(db: Session) -> Dict[str, int]:
+
+        return {
+            "archived_tenders": db.query(func.count(TenderArchive.id)).scalar() or 0,
+            "archived_matches": db.query(func.count(TenderKeywordMatchArchive.id)).scalar() or 0
+        }
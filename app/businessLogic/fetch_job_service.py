@@ -0,0 +1,211 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+import logging
+
+from app.core.config import settings
+from app.models.fetch_job import FetchJob, FetchJobStatus
+from app.businessLogic.fetch_run_service import FetchRunService
+
+logger = logging.getLogger(__name__)
+
+# A job whose worker vanished is retried this many times in total
+MAX_ATTEMPTS = 3
+
+PENDING = (FetchJobStatus.QUEUED, FetchJobStatus.RUNNING)
+
+
+class FetchJobService:
+
+    @staticmethod
+    def enqueue(
+            db: Session,
+            source_id: int,
+            force: bool = False,
+            requested_by: Optional[int] = None,
+            run_id: Optional[str] = None
+    ) -> FetchJob:
+        """
+        Queue a fetch for a source, or return the job already queued or
+        running for it so repeated requests don't pile up. A queued job
+        taken over by a manual request moves to the manual run.
+        """
+        existing = db.query(FetchJob).filter(
+            FetchJob.source_id == source_id,
+            FetchJob.status.in_(PENDING)
+        ).order_by(FetchJob.id).first()
+
+        if existing:
+            if requested_by is not None and existing.status == FetchJobStatus.QUEUED:
+                existing.force = existing.force or force
+                existing.requested_by = requested_by
+                existing.run_id = run_id or existing.run_id
+                db.commit()
+            return existing
+
+        job = FetchJob(
+            source_id=source_id,
+            force=force,
+            requested_by=requested_by,
+            run_id=run_id,
+            status=FetchJobStatus.QUEUED
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+
+        return job
+
+    @staticmethod
+    def enqueue_many(
+            db: Session,
+            source_ids: List[int],
+            force: bool = False,
+            requested_by: Optional[int] = None,
+            run_id: Optional[str] = None
+    ) -> List[FetchJob]:
+
+        return [
+            FetchJobService.enqueue(db, source_id, force, requested_by, run_id)
+            for source_id in source_ids
+        ]
+
+    @staticmethod
+    def run_jobs(db: Session, run_id: str) -> List[FetchJob]:
+
+        return db.query(FetchJob).filter(FetchJob.run_id == run_id).all()
+
+    @staticmethod
+    def queued_query(db: Session, limit: int):
+        """Oldest queued jobs first, as claim() takes them"""
+        return db.query(FetchJob).filter(
+            FetchJob.status == FetchJobStatus.QUEUED
+        ).order_by(
+            FetchJob.created_at, FetchJob.id
+        ).limit(limit)
+
+    @staticmethod
+    def claim(db: Session, worker_id: str, limit: int) -> List[Dict]:
+        """
+        Take up to `limit` queued jobs, oldest first.
+
+        SELECT ... FOR UPDATE SKIP LOCKED lets several workers poll the
+        same table without handing out a job twice or waiting on each
+        other's locks.
+        """
+        if limit <= 0:
+            return []
+
+        jobs = FetchJobService.queued_query(db, limit).with_for_update(skip_locked=True).all()
+
+        now = datetime.utcnow()
+        for job in jobs:
+            job.status = FetchJobStatus.RUNNING
+            job.worker_id = worker_id
+            job.started_at = now
+            job.attempts = (job.attempts or 0) + 1
+
+        claimed = [
+            {"id": job.id, "source_id": job.source_id, "force": bool(job.force), "run_id": job.run_id}
+            for job in jobs
+        ]
+        db.commit()
+
+        return claimed
+
+    @staticmethod
+    def finish(db: Session, job_id: int, result: Optional[Dict]):
+        """Record the outcome of SourceService.fetch_from_source (None = skipped)"""
+        job = db.query(FetchJob).filter(FetchJob.id == job_id).first()
+        if not job:
+            return
+
+        job.status = FetchJobStatus.SKIPPED if result is None else FetchJobStatus.DONE
+        # The traceback already lives in the fetch log
+        job.result = {k: v for k, v in (result or {}).items() if k != "error"}
+        job.finished_at = datetime.utcnow()
+        db.commit()
+
+        FetchRunService.finish_if_complete(db, job.run_id)
+
+    @staticmethod
+    def fail(db: Session, job_id: int, error: str):
+
+        job = db.query(FetchJob).filter(FetchJob.id == job_id).first()
+        if not job:
+            return
+
+        job.status = FetchJobStatus.FAILED
+        job.error = error
+        job.finished_at = datetime.utcnow()
+        db.commit()
+
+        FetchRunService.finish_if_complete(db, job.run_id)
+
+    @staticmethod
+    def retry(db: Session, job_id: int, error: str):
+        """Put a job back in the queue (e.g. its process died), failing it after MAX_ATTEMPTS"""
+        job = db.query(FetchJob).filter(FetchJob.id == job_id).first()
+        if not job:
+            return
+
+        job.error = error
+        if (job.attempts or 0) >= MAX_ATTEMPTS:
+            job.status = FetchJobStatus.FAILED
+            job.finished_at = datetime.utcnow()
+        else:
+            job.status = FetchJobStatus.QUEUED
+            job.worker_id = None
+        db.commit()
+
+        FetchRunService.finish_if_complete(db, job.run_id)
+
+    @staticmethod
+    def requeue_stale(db: Session) -> int:
+        """
+        Put back jobs left RUNNING by a worker that died, failing them for
+        good after MAX_ATTEMPTS.
+        """
+        cutoff = datetime.utcnow() - timedelta(minutes=settings.FETCH_JOB_TIMEOUT_MINUTES)
+
+        stale = db.query(FetchJob).filter(
+            FetchJob.status == FetchJobStatus.RUNNING,
+            FetchJob.started_at < cutoff
+        ).with_for_update(skip_locked=True).all()
+
+        for job in stale:
+            if (job.attempts or 0) >= MAX_ATTEMPTS:
+                job.status = FetchJobStatus.FAILED
+                job.error = f"Timed out on {job.worker_id}"
+                job.finished_at = datetime.utcnow()
+            else:
+                job.status = FetchJobStatus.QUEUED
+                job.worker_id = None
+
+        if stale:
+            db.commit()
+            logger.warning(f"Requeued or failed {len(stale)} stale fetch jobs")
+
+            for run_id in {job.run_id for job in stale if job.status == FetchJobStatus.FAILED}:
+                FetchRunService.finish_if_complete(db, run_id)
+
+        return len(stale)
+
+    @staticmethod
+    def get_job(db: Session, job_id: int) -> Optional[FetchJob]:
+
+        return db.query(FetchJob).filter(FetchJob.id == job_id).first()
+
+    @staticmethod
+    def queue_counts(db: Session) -> Dict[str, int]:
+
+        rows = db.query(FetchJob.status, func.count(FetchJob.id)).filter(
+            FetchJob.status.in_(PENDING)
+        ).group_by(FetchJob.status).all()
+
+        counts = {status.value: 0 for status in PENDING}
+        for status, count in rows:
+            counts[status.value] = count
+
+        return counts
@@ -0,0 +1,115 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from typing import List, Optional
+from datetime import datetime, timedelta
+import logging
+
+from app.core.config import settings
+from app.models.fetch_job import FetchJob, FetchJobStatus
+from app.models.fetch_run import FetchRunRecord, MANUAL_SLOT
+
+logger = logging.getLogger(__name__)
+
+
+class FetchRunService:
+
+    @staticmethod
+    def start(
+            db: Session,
+            run_id: str,
+            source_ids: List[int],
+            trigger: str,
+            requested_by: Optional[int] = None
+    ) -> bool:
+        """
+        Record a new run. A manual run takes the manual slot; returns False
+        (nothing recorded) if another manual run holds it.
+        """
+        manual = trigger == "manual"
+
+        FetchRunService._finish_stale(db)
+
+        db.add(FetchRunRecord(
+            run_id=run_id,
+            trigger=trigger,
+            requested_by=requested_by,
+            source_ids=list(source_ids),
+            manual_slot=MANUAL_SLOT if manual else None,
+            finished_at=None if source_ids else datetime.utcnow()
+        ))
+
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return False
+
+        return True
+
+    @staticmethod
+    def _finish_stale(db: Session):
+        # A process that died mid-run never finished it (nor freed the manual slot)
+        cutoff = datetime.utcnow() - timedelta(minutes=settings.FETCH_JOB_TIMEOUT_MINUTES)
+
+        stale = db.query(FetchRunRecord).filter(
+            FetchRunRecord.finished_at.is_(None),
+            FetchRunRecord.started_at < cutoff
+        ).update({
+            FetchRunRecord.manual_slot: None,
+            FetchRunRecord.finished_at: datetime.utcnow()
+        }, synchronize_session=False)
+
+        if stale:
+            db.commit()
+            logger.warning(f"Closed {stale} stale fetch runs")
+
+    @staticmethod
+    def finish(db: Session, run_id: Optional[str]):
+        if not run_id:
+            return
+
+        db.query(FetchRunRecord).filter(
+            FetchRunRecord.run_id == run_id,
+            FetchRunRecord.finished_at.is_(None)
+        ).update({
+            FetchRunRecord.manual_slot: None,
+            FetchRunRecord.finished_at: datetime.utcnow()
+        }, synchronize_session=False)
+        db.commit()
+
+    @staticmethod
+    def finish_if_complete(db: Session, run_id: Optional[str]):
+        """Finish a worker-handled run once none of its jobs is queued or running"""
+        if not run_id:
+            return
+
+        pending = db.query(FetchJob.id).filter(
+            FetchJob.run_id == run_id,
+            FetchJob.status.in_((FetchJobStatus.QUEUED, FetchJobStatus.RUNNING))
+        ).first()
+
+        if pending is None:
+            FetchRunService.finish(db, run_id)
+
+    @staticmethod
+    def get(db: Session, run_id: str) -> Optional[FetchRunRecord]:
+
+        return db.query(FetchRunRecord).filter(FetchRunRecord.run_id == run_id).first()
+
+    @staticmethod
+    def latest(db: Session) -> Optional[FetchRunRecord]:
+        """The newest in-flight run, else the newest run"""
+        active = db.query(FetchRunRecord).filter(
+            FetchRunRecord.finished_at.is_(None)
+        ).order_by(FetchRunRecord.started_at.desc()).first()
+
+        return active or db.query(FetchRunRecord).order_by(
+            FetchRunRecord.started_at.desc()
+        ).first()
+
+    @staticmethod
+    def any_active(db: Session) -> bool:
+
+        return db.query(FetchRunRecord.id).filter(
+            FetchRunRecord.finished_at.is_(None)
+        ).first() is not None
@@ -2,12 +2,20 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 import re
 import logging
+from datetime import datetime
 
-from app.models.keyword import Keyword
+from app.models.keyword import Keyword, TenderKeywordMatch
+from app.models.tender import Tender
+from app.businessLogic.stats_service import StatsService
 
 logger = logging.getLogger(__name__)
 
 
+def _pattern(keyword: Keyword) -> str:
+    # Word boundary pattern for whole word matching
+    return r'\b' + re.escape(keyword.keyword.lower()) + r'\b'
+
+
 class KeywordService:
 
     @staticmethod
@@ -26,10 +34,7 @@ class KeywordService:
         matched = []
 
         for keyword in keywords:
-            # Create word boundary pattern for whole word matching
-            pattern = r'\b' + re.escape(keyword.keyword.lower()) + r'\b'
-
-            if re.search(pattern, content):
+            if re.search(_pattern(keyword), content):
                 matched.append(keyword)
                 logger.debug(f"Keyword matched: {keyword.keyword}")
 
@@ -39,6 +44,62 @@ class KeywordService:
 
         return matched
 
+    @staticmethod
+    def save_matches(
+            db: Session,
+            tender: Tender,
+            keywords: List[Keyword],
+            late: bool = False
+    ) -> List[Keyword]:
+        """
+        Record matched keywords for a flushed tender: one TenderKeywordMatch
+        per keyword not matched before, the keyword's match counters and the
+        daily keyword analytics. Not committed.
+
+        `late` is for matches found after the tender was created (re-matching,
+        the keyword matching job): a tender's first match then also counts
+        it as matched on its creation day, the same day StatsService.rebuild
+        attributes it to. Fetches count matched new tenders themselves.
+
+        Returns:
+            The keywords that were newly matched
+        """
+        if not keywords:
+            return []
+
+        already = {
+            keyword_id for (keyword_id,) in db.query(TenderKeywordMatch.keyword_id).filter(
+                TenderKeywordMatch.tender_id == tender.id
+            ).all()
+        }
+
+        title = (tender.title or "").lower()
+        now = datetime.utcnow()
+        new = []
+
+        for keyword in keywords:
+            if keyword.id in already:
+                continue
+
+            db.add(TenderKeywordMatch(
+                tender_id=tender.id,
+                keyword_id=keyword.id,
+                match_location="title" if re.search(_pattern(keyword), title) else "description"
+            ))
+            keyword.match_count = (keyword.match_count or 0) + 1
+            keyword.last_match_date = now
+            new.append(keyword)
+
+        if new:
+            StatsService.record_keyword_matches(db, [k.id for k in new])
+
+            if late and not already:
+                StatsService.record(
+                    db, tender.source_id, matched=1, day=tender.created_at.date()
+                )
+
+        return new
+
     @staticmethod
     def get_keywords_by_category(db: Session, category: str) -> List[Keyword]:
 
@@ -1,18 +1,25 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import and_, case, literal
+from typing import Dict, List, Optional
+from collections import defaultdict
 import logging
 from datetime import datetime
 
-from app.models.notification import Notification, NotificationType, NotificationChannel
+from app.models.notification import Notification, NotificationType, NotificationChannel, DeadlineReminder
 from app.models.tender import Tender
-from app.models.keyword import Keyword
+from app.models.keyword import Keyword, TenderKeywordMatch
 from app.models.user import User
-from app.notifications.email import EmailNotificationService
-from app.notifications.desktop import DesktopNotificationService
+from app.notifications.dispatcher import notification_dispatcher
+from app.businessLogic.subscription_service import SubscriptionService
+from app.businessLogic.preference_service import PreferenceService
+from app.schemas.notification_schema import NotificationSettings
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Deferred notifications released per run of the release job
+RELEASE_BATCH_SIZE = 1000
+
 
 class NotificationService:
 
@@ -22,13 +29,29 @@ class NotificationService:
             tender: Tender,
             matched_keywords: List[Keyword]
     ):
-        users = db.query(User).filter(User.is_active == True).all()
+        # Only users subscribed to one of the matched keywords
+        subscriber_ids = SubscriptionService.get_subscribers(db, matched_keywords)
 
-        email_service = EmailNotificationService()
-        desktop_service = DesktopNotificationService()
+        if not subscriber_ids:
+            logger.info(f"No subscribers for keyword matches on tender {tender.reference_id}")
+            return
 
-        for user in users:
-            notification = Notification(
+        preferences = PreferenceService.get_many(db, subscriber_ids)
+        recipient_ids = [
+            user_id for user_id in subscriber_ids
+            if PreferenceService.accepts(preferences[user_id], NotificationType.KEYWORD_MATCH)
+        ]
+
+        if not recipient_ids:
+            return
+
+        users = db.query(User).filter(
+            User.id.in_(recipient_ids),
+            User.is_active == True
+        ).all()
+
+        notifications = [
+            Notification(
                 user_id=user.id,
                 tender_id=tender.id,
                 type=NotificationType.KEYWORD_MATCH,
@@ -40,37 +63,19 @@ class NotificationService:
                     f"Deadline: {tender.deadline_date.strftime('%Y-%m-%d') if tender.deadline_date else 'N/A'}"
                 )
             )
-
-            db.add(notification)
-            db.flush()
-
-            # EMAIL
-            if settings.ENABLE_EMAIL_NOTIFICATIONS:
-                try:
-                    email_service.send_new_tender_notification(
-                        tender=tender,
-                        matched_keywords=matched_keywords,
-                        recipients=[user.email]
-                    )
-                    notification.email_sent = True
-                except Exception as e:
-                    logger.error(f"Email failed: {e}")
-                    notification.error_message = str(e)
-
-            # DESKTOP
-            if settings.ENABLE_DESKTOP_NOTIFICATIONS:
-                try:
-                    desktop_service.send_notification(
-                        title=notification.title,
-                        message=notification.message
-                    )
-                    notification.desktop_sent = True
-                except Exception as e:
-                    logger.error(f"Desktop notification failed: {e}")
-
-            notification.is_sent = notification.email_sent or notification.desktop_sent
-            if notification.is_sent:
-                notification.sent_at = datetime.utcnow()
+            for user in users
+        ]
+
+        db.add_all(notifications)
+        db.flush()
+
+        NotificationService.deliver(
+            db,
+            notifications,
+            {user.id: user for user in users},
+            subject=f"🎯 New Tender Match: {tender.title[:50]}...",
+            preferences=preferences
+        )
 
         db.commit()
 
@@ -104,93 +109,193 @@ class NotificationService:
         db.commit()
 
     @staticmethod
-    def send_deadline_approaching_notification(
-            db: Session,
-            tender: Tender,
-            days_remaining: int
-    ):
-        users = db.query(User).filter(User.is_active == True).all()
+    def check_approaching_deadlines(db: Session) -> int:
 
-        email_service = EmailNotificationService()
-        desktop_service = DesktopNotificationService()
+        from datetime import date, timedelta
 
-        for user in users:
-            notification = Notification(
-                user_id=user.id,
-                tender_id=tender.id,
-                type=NotificationType.DEADLINE_APPROACHING,
-                channel=NotificationChannel.BOTH,
-                title=f"Deadline Approaching: {tender.title[:50]}...",
-                message=(
-                    f"{days_remaining} days remaining until deadline. "
-                    f"Deadline: {tender.deadline_date.strftime('%Y-%m-%d')}"
-                )
+        today = date.today()
+        thresholds = sorted(set(settings.DEADLINE_REMINDER_DAYS))
+
+        if not thresholds:
+            return 0
+
+        # Smallest threshold that still covers the remaining days
+        if len(thresholds) > 1:
+            threshold = case(
+                *[
+                    (Tender.deadline_date <= today + timedelta(days=days), days)
+                    for days in thresholds[:-1]
+                ],
+                else_=thresholds[-1]
+            )
+        else:
+            threshold = literal(thresholds[0])
+
+        # Anti-join: tenders in a reminder window with no reminder for that window yet
+        due = db.query(Tender, threshold.label("threshold_days")).outerjoin(
+            DeadlineReminder,
+            and_(
+                DeadlineReminder.tender_id == Tender.id,
+                DeadlineReminder.threshold_days == threshold
             )
+        ).filter(
+            Tender.deadline_date <= today + timedelta(days=thresholds[-1]),
+            Tender.deadline_date >= today,
+            Tender.status != "expired",
+            Tender.is_deleted == False,
+            DeadlineReminder.id.is_(None)
+        ).all()
 
-            db.add(notification)
-            db.flush()
-
-            # Urgent → send immediately
-            if days_remaining <= 7:
-
-                # EMAIL
-                if settings.ENABLE_EMAIL_NOTIFICATIONS:
-                    try:
-                        email_service.send_deadline_alert(
-                            tender=tender,
-                            recipients=[user.email],
-                            days_remaining=days_remaining
-                        )
-                        notification.email_sent = True
-                    except Exception as e:
-                        logger.error(f"Deadline email failed: {e}")
-                        notification.error_message = str(e)
-
-                # DESKTOP
-                if settings.ENABLE_DESKTOP_NOTIFICATIONS:
-                    try:
-                        desktop_service.send_notification(
-                            title=notification.title,
-                            message=notification.message
-                        )
-                        notification.desktop_sent = True
-                    except Exception as e:
-                        logger.error(f"Desktop deadline alert failed: {e}")
-
-                notification.is_sent = notification.email_sent or notification.desktop_sent
-                if notification.is_sent:
-                    notification.sent_at = datetime.utcnow()
+        if not due:
+            logger.info("No tenders entered a deadline reminder window")
+            return 0
+
+        # Record reminders first so the sweep is idempotent per (tender, threshold)
+        db.add_all([
+            DeadlineReminder(tender_id=tender.id, threshold_days=days)
+            for tender, days in due
+        ])
+
+        # Matched keywords for every due tender in one query
+        keyword_rows = db.query(TenderKeywordMatch.tender_id, Keyword).join(
+            Keyword, Keyword.id == TenderKeywordMatch.keyword_id
+        ).filter(
+            TenderKeywordMatch.tender_id.in_([tender.id for tender, _ in due])
+        ).all()
 
-        db.commit()
+        keywords_by_tender = defaultdict(list)
+        for tender_id, keyword in keyword_rows:
+            keywords_by_tender[tender_id].append(keyword)
+
+        # Tenders without matches still reach catch-all subscribers
+        recipients_by_tender = {
+            tender.id: SubscriptionService.get_subscribers(db, keywords_by_tender[tender.id])
+            for tender, _ in due
+        }
+
+        all_user_ids = set().union(*recipients_by_tender.values())
+        preferences = PreferenceService.get_many(db, all_user_ids)
+        all_user_ids = {
+            user_id for user_id in all_user_ids
+            if PreferenceService.accepts(preferences[user_id], NotificationType.DEADLINE_APPROACHING)
+        }
+        users = {
+            user.id: user
+            for user in db.query(User).filter(
+                User.id.in_(all_user_ids),
+                User.is_active == True
+            ).all()
+        } if all_user_ids else {}
+
+        notifications = []
+        for tender, days in due:
+            days_remaining = (tender.deadline_date - today).days
 
-    @staticmethod
-    def check_approaching_deadlines(db: Session):
+            for user_id in recipients_by_tender[tender.id]:
+                if user_id not in users:
+                    continue
+
+                notifications.append(Notification(
+                    user_id=user_id,
+                    tender_id=tender.id,
+                    type=NotificationType.DEADLINE_APPROACHING,
+                    channel=NotificationChannel.BOTH,
+                    title=f"Deadline Approaching: {tender.title[:50]}...",
+                    message=(
+                        f"{days_remaining} days remaining until deadline. "
+                        f"Deadline: {tender.deadline_date.strftime('%Y-%m-%d')}"
+                    )
+                ))
 
-        from datetime import date, timedelta
+        db.add_all(notifications)
+        db.flush()
 
-        today = date.today()
-        deadline_7days = today + timedelta(days=7)
+        NotificationService.deliver(
+            db,
+            notifications,
+            users,
+            subject="⏰ Tender Deadline Alerts",
+            preferences=preferences
+        )
 
-        # Find tenders with deadlines in next 7 days
-        tenders = db.query(Tender).filter(
-            Tender.deadline_date <= deadline_7days,
-            Tender.deadline_date >= today,
-            Tender.status != "expired",
-            Tender.is_deleted == False
-        ).all()
+        db.commit()
 
-        for tender in tenders:
-            days_remaining = (tender.deadline_date - today).days
+        logger.info(
+            f"Deadline sweep: {len(due)} tenders entered a reminder window, "
+            f"{len(notifications)} notifications created"
+        )
 
-            # Check if notification already sent
-            existing = db.query(Notification).filter(
-                Notification.tender_id == tender.id,
-                Notification.type == NotificationType.DEADLINE_APPROACHING
-            ).first()
+        return len(notifications)
 
-            if not existing:
-                NotificationService.send_deadline_approaching_notification(
-                    db, tender, days_remaining
-                )
+    @staticmethod
+    def deliver(
+            db: Session,
+            notifications: List[Notification],
+            users: Dict[int, User],
+            subject: str,
+            preferences: Optional[Dict[int, NotificationSettings]] = None
+    ) -> int:
+        """
+        Send flushed notifications now, or defer them to the end of the
+        recipient's silent hours by setting deliver_after (committed by the
+        caller, so deferrals survive restarts and leader changes).
+
+        Returns:
+            Number of notifications sent immediately
+        """
+        if preferences is None:
+            preferences = PreferenceService.get_many(db, users.keys())
+
+        now = PreferenceService.local_now()
+        immediate = []
+
+        for notification in notifications:
+            user_settings = preferences.get(notification.user_id)
+            release_at = PreferenceService.silent_until(user_settings, now) if user_settings else None
+
+            if release_at:
+                notification.deliver_after = PreferenceService.to_utc(release_at)
+            else:
+                immediate.append(notification)
+
+        deferred = len(notifications) - len(immediate)
+        if deferred:
+            logger.info(f"Deferred {deferred} notifications until end of silent hours")
+
+        return notification_dispatcher.dispatch(immediate, users, subject, preferences)
+
+    @staticmethod
+    def release_deferred(db: Session) -> int:
+        """Deliver deferred notifications whose silent window has ended, in one batch"""
+
+        notifications = db.query(Notification).filter(
+            Notification.deliver_after <= datetime.utcnow()
+        ).order_by(Notification.deliver_after).limit(RELEASE_BATCH_SIZE).all()
+
+        if not notifications:
+            return 0
+
+        # available_at lets the stream relay pick the released rows up
+        now = datetime.utcnow()
+        for notification in notifications:
+            notification.deliver_after = None
+            notification.available_at = now
+
+        user_ids = {n.user_id for n in notifications}
+        users = {
+            user.id: user
+            for user in db.query(User).filter(User.id.in_(user_ids)).all()
+        } if user_ids else {}
+
+        sent = notification_dispatcher.dispatch(
+            notifications,
+            users,
+            subject="🔔 Alerts held during silent hours",
+            preferences=PreferenceService.get_many(db, user_ids)
+        )
+
+        db.commit()
+
+        logger.info(f"Released {len(notifications)} deferred notifications")
 
-        logger.info(f"Checked {len(tenders)} tenders for approaching deadlines")
\ No newline at end of file
+        return sent
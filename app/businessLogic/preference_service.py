@@ -0,0 +1,197 @@
+from sqlalchemy.orm import Session
+from typing import Dict, Iterable, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+import logging
+import threading
+import time
+
+from app.core.config import settings
+from app.models.notification import NotificationType
+from app.models.notification_preference import NotificationPreference
+from app.schemas.notification_schema import NotificationSettings
+
+logger = logging.getLogger(__name__)
+
+# Cached settings are re-read after this long
+PREFERENCE_CACHE_TTL_SECONDS = 60
+
+# Notification type -> per-trigger toggle on NotificationSettings
+TRIGGER_FIELDS = {
+    NotificationType.NEW_TENDER: "new_tender_published",
+    NotificationType.KEYWORD_MATCH: "keyword_match_found",
+    NotificationType.DEADLINE_APPROACHING: "deadline_approaching",
+    NotificationType.SYSTEM_ERROR: "system_errors",
+}
+
+
+class PreferenceCache:
+    """
+    In-memory cache of NotificationSettings keyed by user ID.
+
+    Entries expire after PREFERENCE_CACHE_TTL_SECONDS, so changes saved
+    through one replica reach the others and the scrape workers.
+    """
+
+    def __init__(self, ttl_seconds: int = PREFERENCE_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._settings: Dict[int, Tuple[float, NotificationSettings]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[NotificationSettings]:
+        with self._lock:
+            entry = self._settings.get(user_id)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl_seconds:
+                del self._settings[user_id]
+                return None
+            return entry[1]
+
+    def set(self, user_id: int, value: NotificationSettings):
+        with self._lock:
+            self._settings[user_id] = (time.monotonic(), value)
+
+    def invalidate(self, user_id: Optional[int] = None):
+        with self._lock:
+            if user_id is None:
+                self._settings.clear()
+            else:
+                self._settings.pop(user_id, None)
+
+
+# SINGLE INSTANCE
+preference_cache = PreferenceCache()
+
+
+class PreferenceService:
+
+    @staticmethod
+    def _to_settings(preference: Optional[NotificationPreference]) -> NotificationSettings:
+        if preference is None:
+            return NotificationSettings()
+
+        return NotificationSettings(
+            enable_desktop=preference.enable_desktop,
+            enable_email=preference.enable_email,
+            email_recipients=preference.email_recipients or [],
+            new_tender_published=preference.new_tender_published,
+            keyword_match_found=preference.keyword_match_found,
+            deadline_approaching=preference.deadline_approaching,
+            system_errors=preference.system_errors,
+            enable_silent_hours=preference.enable_silent_hours,
+            silent_start_time=preference.silent_start_time,
+            silent_end_time=preference.silent_end_time
+        )
+
+    @staticmethod
+    def get_many(db: Session, user_ids: Iterable[int]) -> Dict[int, NotificationSettings]:
+        """
+        Get settings for several users, loading cache misses in one query.
+
+        Users without a stored row get the defaults.
+        """
+        result = {}
+        missing = []
+
+        for user_id in set(user_ids):
+            cached = preference_cache.get(user_id)
+            if cached is not None:
+                result[user_id] = cached
+            else:
+                missing.append(user_id)
+
+        if missing:
+            rows = {
+                p.user_id: p
+                for p in db.query(NotificationPreference).filter(
+                    NotificationPreference.user_id.in_(missing)
+                ).all()
+            }
+            for user_id in missing:
+                value = PreferenceService._to_settings(rows.get(user_id))
+                preference_cache.set(user_id, value)
+                result[user_id] = value
+
+        return result
+
+    @staticmethod
+    def get_settings(db: Session, user_id: int) -> NotificationSettings:
+
+        return PreferenceService.get_many(db, [user_id])[user_id]
+
+    @staticmethod
+    def update_settings(db: Session, user_id: int, update_data: Dict) -> NotificationSettings:
+
+        preference = db.query(NotificationPreference).filter(
+            NotificationPreference.user_id == user_id
+        ).first()
+
+        if not preference:
+            preference = NotificationPreference(
+                user_id=user_id,
+                **NotificationSettings().dict()
+            )
+            db.add(preference)
+
+        for field, value in update_data.items():
+            setattr(preference, field, value)
+
+        # Stored as JSON; keep plain strings
+        preference.email_recipients = [str(e) for e in (preference.email_recipients or [])]
+
+        db.commit()
+        db.refresh(preference)
+
+        value = PreferenceService._to_settings(preference)
+        preference_cache.set(user_id, value)
+
+        return value
+
+    @staticmethod
+    def accepts(user_settings: NotificationSettings, notification_type: NotificationType) -> bool:
+
+        field = TRIGGER_FIELDS.get(notification_type)
+        return getattr(user_settings, field) if field else True
+
+    @staticmethod
+    def local_now() -> datetime:
+        """Current wall-clock time in the configured timezone (naive)"""
+        return datetime.now(ZoneInfo(settings.SCHEDULER_TIMEZONE)).replace(tzinfo=None)
+
+    @staticmethod
+    def to_utc(local: datetime) -> datetime:
+        """Naive local time (as from local_now) -> naive UTC"""
+        aware = local.replace(tzinfo=ZoneInfo(settings.SCHEDULER_TIMEZONE))
+        return aware.astimezone(timezone.utc).replace(tzinfo=None)
+
+    @staticmethod
+    def silent_until(user_settings: NotificationSettings, now: datetime) -> Optional[datetime]:
+        """
+        Get the end of the silent window containing `now`.
+
+        Returns:
+            Release time if `now` is inside silent hours, else None
+        """
+        start = user_settings.silent_start_time
+        end = user_settings.silent_end_time
+
+        if not user_settings.enable_silent_hours or start is None or end is None or start == end:
+            return None
+
+        current = now.time()
+
+        if start < end:
+            inside = start <= current < end
+        else:
+            # Window wraps midnight, e.g. 22:00 -> 07:00
+            inside = current >= start or current < end
+
+        if not inside:
+            return None
+
+        release_at = datetime.combine(now.date(), end)
+        if release_at <= now:
+            release_at += timedelta(days=1)
+
+        return release_at
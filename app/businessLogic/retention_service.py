@@ -0,0 +1,188 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, update, and_, or_
+from sqlalchemy.sql import ClauseElement
+from typing import Callable, Dict, List, Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+
+from app.core.config import settings
+from app.models.fetch_log import FetchLog
+from app.models.fetch_job import FetchJob, FetchJobStatus
+from app.models.fetch_run import FetchRunRecord
+from app.models.notification import Notification
+from app.models.refresh_token import RefreshToken
+from app.models.tender import Tender
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """
+    Rows of `model` matching `condition(cutoff)` are deleted, where
+    cutoff = now - `days`. `before_delete` runs on each chunk's ids first
+    (e.g. to detach rows that reference them without ON DELETE).
+    """
+    name: str
+    model: type
+    days: int
+    condition: Callable[[datetime], ClauseElement]
+    before_delete: Optional[Callable[[Session, List[int]], None]] = None
+
+
+def _detach_tender_notifications(db: Session, tender_ids: List[int]):
+    # Users keep the notification; it just no longer links to the tender
+    db.execute(
+        update(Notification).where(
+            Notification.tender_id.in_(tender_ids)
+        ).values(tender_id=None)
+    )
+
+
+def _policies() -> Dict[str, RetentionPolicy]:
+    policies = [
+        RetentionPolicy(
+            name="fetch_logs",
+            model=FetchLog,
+            days=settings.RETENTION_FETCH_LOG_DAYS,
+            condition=lambda cutoff: FetchLog.created_at < cutoff
+        ),
+        RetentionPolicy(
+            name="notifications",
+            model=Notification,
+            days=settings.RETENTION_READ_NOTIFICATION_DAYS,
+            condition=lambda cutoff: and_(
+                Notification.is_read == True,
+                Notification.created_at < cutoff
+            )
+        ),
+        RetentionPolicy(
+            name="refresh_tokens",
+            model=RefreshToken,
+            days=settings.RETENTION_REFRESH_TOKEN_DAYS,
+            condition=lambda cutoff: or_(
+                RefreshToken.expires_at < cutoff,
+                and_(RefreshToken.revoked == True, RefreshToken.created_at < cutoff)
+            )
+        ),
+        RetentionPolicy(
+            name="deleted_tenders",
+            model=Tender,
+            days=settings.RETENTION_DELETED_TENDER_DAYS,
+            # Soft delete bumps updated_at, so it doubles as deleted-at
+            condition=lambda cutoff: and_(
+                Tender.is_deleted == True,
+                Tender.updated_at < cutoff
+            ),
+            before_delete=_detach_tender_notifications
+        ),
+        RetentionPolicy(
+            name="fetch_jobs",
+            model=FetchJob,
+            days=settings.RETENTION_FETCH_JOB_DAYS,
+            condition=lambda cutoff: and_(
+                FetchJob.status.in_([FetchJobStatus.DONE, FetchJobStatus.SKIPPED, FetchJobStatus.FAILED]),
+                FetchJob.finished_at < cutoff
+            )
+        ),
+        RetentionPolicy(
+            name="fetch_runs",
+            model=FetchRunRecord,
+            days=settings.RETENTION_FETCH_JOB_DAYS,
+            condition=lambda cutoff: FetchRunRecord.finished_at < cutoff
+        ),
+    ]
+    return {policy.name: policy for policy in policies}
+
+
+class RetentionService:
+
+    @staticmethod
+    def policies() -> Dict[str, RetentionPolicy]:
+
+        return _policies()
+
+    @staticmethod
+    def chunk_query(policy: RetentionPolicy, cutoff: datetime, chunk_size: Optional[int] = None):
+        """Primary keys of the next chunk of expired rows"""
+        pk = policy.model.__table__.c.id
+        return select(pk).where(policy.condition(cutoff)).order_by(pk).limit(
+            chunk_size or settings.RETENTION_CHUNK_SIZE
+        )
+
+    @staticmethod
+    def purge_chunk(
+            db: Session,
+            policy: RetentionPolicy,
+            cutoff: datetime,
+            chunk_size: Optional[int] = None
+    ) -> int:
+        """
+        Delete at most `chunk_size` expired rows in one short transaction.
+
+        On MySQL (without a before_delete hook) this is a single
+        DELETE ... WHERE ... LIMIT n; otherwise the chunk's primary keys
+        are selected first and deleted by id.
+
+        Returns:
+            Rows deleted; fewer than `chunk_size` means nothing is left
+        """
+        chunk_size = chunk_size or settings.RETENTION_CHUNK_SIZE
+        table = policy.model.__table__
+        pk = table.c.id
+        condition = policy.condition(cutoff)
+
+        try:
+            if db.get_bind().dialect.name == "mysql" and policy.before_delete is None:
+                result = db.execute(
+                    delete(table).where(condition).with_dialect_options(mysql_limit=chunk_size)
+                )
+                deleted = result.rowcount
+            else:
+                ids = [
+                    row[0] for row in db.execute(
+                        RetentionService.chunk_query(policy, cutoff, chunk_size)
+                    )
+                ]
+                if not ids:
+                    db.rollback()
+                    return 0
+
+                if policy.before_delete:
+                    policy.before_delete(db, ids)
+
+                deleted = db.execute(delete(table).where(pk.in_(ids))).rowcount
+
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        return deleted
+
+    @staticmethod
+    def purge(
+            db: Session,
+            policy: RetentionPolicy,
+            now: Optional[datetime] = None,
+            chunk_size: Optional[int] = None,
+            pause: Optional[Callable[[], None]] = None
+    ) -> int:
+        """Delete every expired row for a policy, chunk by chunk, calling `pause` between chunks"""
+        chunk_size = chunk_size or settings.RETENTION_CHUNK_SIZE
+        cutoff = (now or datetime.utcnow()) - timedelta(days=policy.days)
+        total = 0
+
+        while True:
+            deleted = RetentionService.purge_chunk(db, policy, cutoff, chunk_size)
+            total += deleted
+            if deleted < chunk_size:
+                break
+            if pause:
+                pause()
+
+        if total:
+            logger.info(f"Retention {policy.name}: deleted {total} rows older than {cutoff}")
+
+        return total
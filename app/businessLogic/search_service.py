@@ -0,0 +1,72 @@
+from sqlalchemy.orm import Session, Query
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy import or_
+from typing import List, Optional, Tuple
+import re
+import logging
+
+from app.models.tender import Tender
+
+logger = logging.getLogger(__name__)
+
+# Columns covered by the ft_tenders_search FULLTEXT index (same order)
+SEARCH_COLUMNS = (Tender.title, Tender.reference_id, Tender.agency_name, Tender.description)
+
+# InnoDB ignores tokens shorter than innodb_ft_min_token_size (default 3)
+MIN_TOKEN_LENGTH = 3
+MAX_TERMS = 10
+
+# Anything that is not a word character is a token separator for InnoDB,
+# which also strips boolean-mode operators out of user input
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class SearchService:
+
+    @staticmethod
+    def tokenize(search: str) -> List[str]:
+
+        tokens = []
+        for token in _TOKEN_RE.findall(search.lower()):
+            if len(token) >= MIN_TOKEN_LENGTH and token not in tokens:
+                tokens.append(token)
+
+        return tokens[:MAX_TERMS]
+
+    @staticmethod
+    def boolean_query(tokens: List[str]) -> str:
+        """
+        Build a BOOLEAN MODE expression where every term is required and
+        prefix-matched, e.g. "road const" -> "+road* +const*"
+        """
+        return " ".join(f"+{token}*" for token in tokens)
+
+    @staticmethod
+    def apply_search(db: Session, query: Query, search: str, entity=Tender) -> Tuple[Query, Optional[object]]:
+        """
+        Restrict a Tender query to rows matching `search`.
+
+        On MySQL this uses the FULLTEXT index and returns the relevance
+        expression so the caller can rank by it. Other dialects, searches
+        made only of tokens too short to be indexed, and aliased entities
+        (e.g. tenders including the archive, which have no FULLTEXT index)
+        fall back to ILIKE.
+
+        Returns:
+            (filtered query, relevance expression or None)
+        """
+        tokens = SearchService.tokenize(search)
+
+        if tokens and entity is Tender and db.get_bind().dialect.name == "mysql":
+            relevance = match(
+                *SEARCH_COLUMNS,
+                against=SearchService.boolean_query(tokens)
+            ).in_boolean_mode()
+
+            return query.filter(relevance > 0), relevance
+
+        columns = [getattr(entity, column.key) for column in SEARCH_COLUMNS]
+        search_term = f"%{search.strip()}%"
+        return query.filter(
+            or_(*(column.ilike(search_term) for column in columns))
+        ), None
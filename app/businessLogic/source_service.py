@@ -4,11 +4,17 @@ import logging
 from datetime import datetime
 import traceback
 
-from app.models.source import Source, SourceStatus
+from app.models.source import Source, SourceStatus, BreakerState
 from app.models.fetch_log import FetchLog, FetchStatus
 from app.businessLogic.tender_service import TenderService
+from app.businessLogic.stats_service import StatsService
+from app.businessLogic.archive_service import ArchiveService
+from app.core.cache import response_cache, TENDERS, SOURCES, KEYWORDS
+from app.core.fetch_runs import fetch_runs, FETCHING, DONE, FAILED, SKIPPED
+from app.scheduler.adaptive import AdaptiveFetchPlanner
 from app.scraping.implementations.html_scraper import HTMLScraper
 from app.scraping.implementations.pdf_scraper import PDFScraper
+from app.scraping.utils.circuit_breaker import CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
@@ -16,23 +22,82 @@ logger = logging.getLogger(__name__)
 class SourceService:
 
     @staticmethod
-    def fetch_from_source(db: Session, source_id: int) -> Dict:
-
-
+    def fetch_from_source(
+            db: Session,
+            source_id: int,
+            force: bool = False,
+            run_id: Optional[str] = None
+    ) -> Dict:
+        """
+        Scrape one source and store its tenders.
+
+        Skipped while the source's circuit breaker is open unless `force`d
+        (manual fetches); a half-open breaker is probed before scraping.
+        Progress is reported to the fetch run `run_id`, if any.
+        """
         source = db.query(Source).filter(Source.id == source_id).first()
 
         if not source:
             logger.error(f"Source {source_id} not found")
+            fetch_runs.update(run_id, source_id, state=FAILED, message="Source not found")
             return {"success": False, "message": "Source not found"}
 
         if not source.is_active:
             logger.warning(f"Source {source.name} is not active")
+            fetch_runs.update(run_id, source_id, state=SKIPPED, message="Source is not active")
             return {"success": False, "message": "Source is not active"}
 
         started_at = datetime.utcnow()
+        fetch_runs.update(run_id, source_id, source_name=source.name)
+
+        if not CircuitBreaker.allow_request(source, started_at, force=force):
+            logger.info(f"Skipping {source.name}: circuit open until {source.breaker_opened_until}")
+            source.next_fetch_at = source.breaker_opened_until
+            db.commit()
+            fetch_runs.update(run_id, source_id, state=SKIPPED, message="Circuit open")
+            return {
+                "success": False,
+                "skipped": True,
+                "message": f"Source unavailable, next attempt at {source.breaker_opened_until}"
+            }
+
+        if CircuitBreaker.state(source) == BreakerState.HALF_OPEN and not CircuitBreaker.probe(source):
+            # Still down: reopen with a longer cooldown without paying for a full scrape
+            source.last_fetch_at = started_at
+            CircuitBreaker.record_failure(source, started_at)
+            source.next_fetch_at = source.breaker_opened_until
+
+            db.add(FetchLog(
+                source_id=source.id,
+                source_name=source.name,
+                status=FetchStatus.WARNING,
+                message=f"Probe failed, retrying in {source.breaker_cooldown_minutes} min",
+                started_at=started_at,
+                completed_at=datetime.utcnow(),
+                duration_seconds=0,
+                run_id=run_id
+            ))
+            db.commit()
+
+            response_cache.invalidate(SOURCES)
+            fetch_runs.update(run_id, source_id, state=SKIPPED, message="Probe failed")
+
+            return {
+                "success": False,
+                "skipped": True,
+                "message": f"Source unavailable, next attempt at {source.breaker_opened_until}"
+            }
+
+        pages_fetched = 0
+
+        def on_page():
+            nonlocal pages_fetched
+            pages_fetched += 1
+            fetch_runs.increment(run_id, source_id, "pages_fetched")
 
         try:
             logger.info(f"Starting fetch from {source.name}")
+            fetch_runs.update(run_id, source_id, state=FETCHING)
 
             # Update last fetch time
             source.last_fetch_at = started_at
@@ -43,11 +108,14 @@ class SourceService:
                 scraper = PDFScraper(source)
             else:
                 scraper = HTMLScraper(source)
+            scraper.on_page = on_page
 
             # Fetch tenders
             tenders_data = scraper.scrape()
+            fetch_runs.update(run_id, source_id, rows_parsed=len(tenders_data))
 
             new_count = 0
+            matched_count = 0
             updated_count = 0
 
             for tender_data in tenders_data:
@@ -65,16 +133,24 @@ class SourceService:
                     # Update if content changed
                     TenderService.update_tender(db, existing, tender_data)
                     updated_count += 1
+                elif ArchiveService.is_archived(db, tender_data['reference_id'], source.id):
+                    # Long expired and moved out; sources keep listing old tenders
+                    continue
                 else:
                     # Create new tender
-                    TenderService.create_tender(db, tender_data)
+                    tender = TenderService.create_tender(db, tender_data)
                     new_count += 1
+                    if getattr(tender, "matched_keywords", None):
+                        matched_count += 1
+
+                fetch_runs.increment(run_id, source_id, "rows_upserted")
 
             # Update source stats
             source.total_tenders += new_count
             source.last_success_at = datetime.utcnow()
             source.status = SourceStatus.ACTIVE
             source.consecutive_failures = 0
+            CircuitBreaker.record_success(source)
 
             completed_at = datetime.utcnow()
             duration = (completed_at - started_at).seconds
@@ -88,15 +164,34 @@ class SourceService:
                 tenders_found=len(tenders_data),
                 new_tenders=new_count,
                 updated_tenders=updated_count,
+                pages_fetched=pages_fetched,
                 started_at=started_at,
                 completed_at=completed_at,
-                duration_seconds=duration
+                duration_seconds=duration,
+                run_id=run_id
             )
 
             db.add(log)
+            db.flush()
+
+            # Next run from the change rate, including this fetch
+            AdaptiveFetchPlanner.reschedule(db, source, completed_at)
+
+            # Dashboard rollup, committed with the log
+            StatsService.record(
+                db,
+                source.id,
+                new=new_count,
+                matched=matched_count,
+                updated=updated_count
+            )
             db.commit()
 
+            # New tenders, source status and keyword match counts all changed
+            response_cache.invalidate(TENDERS, SOURCES, KEYWORDS)
+
             logger.info(f"Fetch completed: {source.name} - {new_count} new, {updated_count} updated")
+            fetch_runs.update(run_id, source_id, state=DONE, message=log.message)
 
             return {
                 "success": True,
@@ -131,14 +226,26 @@ class SourceService:
                 status=FetchStatus.ERROR,
                 message=f"Failed to fetch: {error_msg}",
                 error_details=error_details,
+                pages_fetched=pages_fetched,
                 started_at=started_at,
                 completed_at=completed_at,
-                duration_seconds=duration
+                duration_seconds=duration,
+                run_id=run_id
             )
 
             db.add(log)
+
+            CircuitBreaker.record_failure(source, completed_at)
+            if CircuitBreaker.is_open(source, completed_at):
+                source.next_fetch_at = source.breaker_opened_until
+            else:
+                AdaptiveFetchPlanner.postpone(source, completed_at)
+
             db.commit()
 
+            response_cache.invalidate(SOURCES)
+            fetch_runs.update(run_id, source_id, state=FAILED, message=error_msg)
+
             return {
                 "success": False,
                 "message": error_msg,
@@ -0,0 +1,350 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy import func, distinct
+from typing import Dict, Iterable, List, Optional
+from datetime import date, datetime, timedelta
+from collections import Counter
+import logging
+
+from app.models.stats import DailyTenderStats, KeywordDailyMatch
+from app.models.tender import Tender
+from app.models.keyword import Keyword, KeywordCategory, TenderKeywordMatch
+from app.models.fetch_log import FetchLog
+
+logger = logging.getLogger(__name__)
+
+
+class StatsService:
+
+    @staticmethod
+    def today() -> date:
+        # Same clock as Tender.created_at
+        return datetime.utcnow().date()
+
+    @staticmethod
+    def record(
+            db: Session,
+            source_id: int,
+            new: int = 0,
+            matched: int = 0,
+            updated: int = 0,
+            expired: int = 0,
+            day: Optional[date] = None
+    ):
+        """
+        Add to a source's counters for a day. Does not commit.
+
+        On MySQL this is a single INSERT ... ON DUPLICATE KEY UPDATE so
+        concurrent fetches increment the same row safely.
+        """
+        if not (new or matched or updated or expired):
+            return
+
+        day = day or StatsService.today()
+
+        if db.get_bind().dialect.name == "mysql":
+            stmt = mysql_insert(DailyTenderStats).values(
+                day=day,
+                source_id=source_id,
+                new_tenders=new,
+                matched_tenders=matched,
+                updated_tenders=updated,
+                expired_tenders=expired,
+                updated_at=datetime.utcnow()
+            )
+            stmt = stmt.on_duplicate_key_update(
+                new_tenders=DailyTenderStats.new_tenders + new,
+                matched_tenders=DailyTenderStats.matched_tenders + matched,
+                updated_tenders=DailyTenderStats.updated_tenders + updated,
+                expired_tenders=DailyTenderStats.expired_tenders + expired,
+                updated_at=stmt.inserted.updated_at
+            )
+            db.execute(stmt)
+            return
+
+        row = db.query(DailyTenderStats).filter(
+            DailyTenderStats.day == day,
+            DailyTenderStats.source_id == source_id
+        ).with_for_update().first()
+
+        if not row:
+            row = DailyTenderStats(
+                day=day,
+                source_id=source_id,
+                new_tenders=0,
+                matched_tenders=0,
+                updated_tenders=0,
+                expired_tenders=0
+            )
+            db.add(row)
+
+        row.new_tenders += new
+        row.matched_tenders += matched
+        row.updated_tenders += updated
+        row.expired_tenders += expired
+
+    @staticmethod
+    def totals_by_day(db: Session, days: List[date]) -> Dict[date, Dict[str, int]]:
+        """Counters summed over all sources for each requested day (zeros when absent)"""
+        rows = db.query(
+            DailyTenderStats.day,
+            func.sum(DailyTenderStats.new_tenders),
+            func.sum(DailyTenderStats.matched_tenders),
+            func.sum(DailyTenderStats.updated_tenders),
+            func.sum(DailyTenderStats.expired_tenders)
+        ).filter(
+            DailyTenderStats.day.in_(days)
+        ).group_by(DailyTenderStats.day).all()
+
+        result = {d: {"new": 0, "matched": 0, "updated": 0, "expired": 0} for d in days}
+        for day, new, matched, updated, expired in rows:
+            result[day] = {
+                "new": int(new or 0),
+                "matched": int(matched or 0),
+                "updated": int(updated or 0),
+                "expired": int(expired or 0)
+            }
+
+        return result
+
+    @staticmethod
+    def by_source(db: Session, day: date) -> Dict[int, DailyTenderStats]:
+
+        rows = db.query(DailyTenderStats).filter(DailyTenderStats.day == day).all()
+        return {row.source_id: row for row in rows}
+
+    @staticmethod
+    def rebuild(db: Session, since: date) -> int:
+        """
+        Recompute the rollup from source tables for days >= since.
+
+        Used to backfill after deploying the table or to repair drift:
+        new tenders come from tenders.created_at, matched from
+        tender_keyword_matches by tender creation day (as counted live),
+        updated from fetch log totals. Expiry counts have no source table,
+        so the recorded ones are kept, as are matched counts for days
+        before the first recorded keyword match.
+        """
+        start = datetime.combine(since, datetime.min.time())
+        counters: Dict[tuple, Dict[str, int]] = {}
+
+        def bump(day, source_id, field, value):
+            if source_id is None:
+                return
+            entry = counters.setdefault(
+                (day, source_id), {"new": 0, "matched": 0, "updated": 0, "expired": 0}
+            )
+            entry[field] += int(value or 0)
+
+        created_day = func.date(Tender.created_at)
+
+        for day, source_id, count in db.query(
+                created_day, Tender.source_id, func.count(Tender.id)
+        ).filter(
+            Tender.created_at >= start,
+            Tender.is_deleted == False
+        ).group_by(created_day, Tender.source_id):
+            bump(day, source_id, "new", count)
+
+        for day, source_id, count in db.query(
+                created_day, Tender.source_id, func.count(distinct(Tender.id))
+        ).join(
+            TenderKeywordMatch, TenderKeywordMatch.tender_id == Tender.id
+        ).filter(
+            Tender.created_at >= start,
+            Tender.is_deleted == False
+        ).group_by(created_day, Tender.source_id):
+            bump(day, source_id, "matched", count)
+
+        log_day = func.date(FetchLog.created_at)
+
+        for day, source_id, count in db.query(
+                log_day, FetchLog.source_id, func.sum(FetchLog.updated_tenders)
+        ).filter(
+            FetchLog.created_at >= start
+        ).group_by(log_day, FetchLog.source_id):
+            bump(day, source_id, "updated", count)
+
+        for day, source_id, count in db.query(
+                DailyTenderStats.day, DailyTenderStats.source_id, DailyTenderStats.expired_tenders
+        ).filter(
+            DailyTenderStats.day >= since,
+            DailyTenderStats.expired_tenders > 0
+        ):
+            bump(day, source_id, "expired", count)
+
+        first_match = db.query(func.min(TenderKeywordMatch.created_at)).scalar()
+        matches_from = first_match.date() if first_match else None
+
+        recorded_matched = db.query(
+            DailyTenderStats.day, DailyTenderStats.source_id, DailyTenderStats.matched_tenders
+        ).filter(
+            DailyTenderStats.day >= since,
+            DailyTenderStats.matched_tenders > 0
+        )
+        if matches_from:
+            recorded_matched = recorded_matched.filter(DailyTenderStats.day < matches_from)
+
+        for day, source_id, count in recorded_matched:
+            bump(day, source_id, "matched", count)
+
+        db.query(DailyTenderStats).filter(
+            DailyTenderStats.day >= since
+        ).delete(synchronize_session=False)
+
+        db.add_all([
+            DailyTenderStats(
+                day=day if isinstance(day, date) else date.fromisoformat(str(day)),
+                source_id=source_id,
+                new_tenders=values["new"],
+                matched_tenders=values["matched"],
+                updated_tenders=values["updated"],
+                expired_tenders=values["expired"]
+            )
+            for (day, source_id), values in counters.items()
+        ])
+        db.commit()
+
+        logger.info(f"Rebuilt daily tender stats since {since}: {len(counters)} rows")
+
+        return len(counters)
+
+    # ---------------- KEYWORD ANALYTICS ----------------
+
+    @staticmethod
+    def record_keyword_matches(db: Session, keyword_ids: Iterable[int], day: Optional[date] = None):
+        """
+        Count one match for each keyword ID (repeats count again). Does not commit.
+        """
+        counts = Counter(keyword_ids)
+        if not counts:
+            return
+
+        day = day or StatsService.today()
+
+        if db.get_bind().dialect.name == "mysql":
+            stmt = mysql_insert(KeywordDailyMatch).values([
+                {"day": day, "keyword_id": keyword_id, "match_count": count}
+                for keyword_id, count in counts.items()
+            ])
+            stmt = stmt.on_duplicate_key_update(
+                match_count=KeywordDailyMatch.match_count + stmt.inserted.match_count
+            )
+            db.execute(stmt)
+            return
+
+        existing = {
+            row.keyword_id: row
+            for row in db.query(KeywordDailyMatch).filter(
+                KeywordDailyMatch.day == day,
+                KeywordDailyMatch.keyword_id.in_(list(counts))
+            ).with_for_update()
+        }
+
+        for keyword_id, count in counts.items():
+            row = existing.get(keyword_id)
+            if not row:
+                row = KeywordDailyMatch(day=day, keyword_id=keyword_id, match_count=0)
+                db.add(row)
+            row.match_count += count
+
+    @staticmethod
+    def top_keywords_query(
+            db: Session,
+            days: int = 30,
+            category: Optional[KeywordCategory] = None,
+            limit: int = 5
+    ):
+        since = StatsService.today() - timedelta(days=days - 1)
+        total = func.sum(KeywordDailyMatch.match_count).label("match_count")
+
+        query = db.query(
+            Keyword.id,
+            Keyword.keyword,
+            Keyword.category,
+            Keyword.priority,
+            total
+        ).join(
+            Keyword, Keyword.id == KeywordDailyMatch.keyword_id
+        ).filter(
+            KeywordDailyMatch.day >= since
+        )
+
+        if category:
+            query = query.filter(Keyword.category == category)
+
+        return query.group_by(
+            Keyword.id, Keyword.keyword, Keyword.category, Keyword.priority
+        ).order_by(total.desc()).limit(limit)
+
+    @staticmethod
+    def top_keywords(
+            db: Session,
+            days: int = 30,
+            category: Optional[KeywordCategory] = None,
+            limit: int = 5
+    ) -> List[Dict]:
+        """Keywords with the most matches over the last `days` days (today included)"""
+        rows = StatsService.top_keywords_query(db, days, category, limit).all()
+
+        return [
+            {
+                "keyword_id": keyword_id,
+                "keyword": keyword,
+                "category": category.value if category else None,
+                "priority": priority.value if priority else None,
+                "matches": int(matches or 0)
+            }
+            for keyword_id, keyword, category, priority, matches in rows
+        ]
+
+    @staticmethod
+    def rebuild_keyword_matches(db: Session, since: date) -> int:
+        """
+        Recompute keyword_daily_matches for days >= since from
+        tender_keyword_matches (one row per match, written with the live
+        counters by KeywordService.save_matches).
+
+        Days before the first stored match have nothing to recompute from
+        and keep their recorded counts.
+        """
+        first_match = db.query(func.min(TenderKeywordMatch.created_at)).scalar()
+        if first_match is None:
+            logger.info("No keyword matches stored; keyword daily matches left as recorded")
+            return 0
+
+        since = max(since, first_match.date())
+        start = datetime.combine(since, datetime.min.time())
+        match_day = func.date(TenderKeywordMatch.created_at)
+
+        rows = db.query(
+            match_day, TenderKeywordMatch.keyword_id, func.count(TenderKeywordMatch.id)
+        ).filter(
+            TenderKeywordMatch.created_at >= start,
+            TenderKeywordMatch.keyword_id.isnot(None)
+        ).group_by(match_day, TenderKeywordMatch.keyword_id).all()
+
+        db.query(KeywordDailyMatch).filter(
+            KeywordDailyMatch.day >= since
+        ).delete(synchronize_session=False)
+
+        db.add_all([
+            KeywordDailyMatch(
+                day=day if isinstance(day, date) else date.fromisoformat(str(day)),
+                keyword_id=keyword_id,
+                match_count=count
+            )
+            for day, keyword_id, count in rows
+        ])
+        db.commit()
+
+        logger.info(f"Rebuilt keyword daily matches since {since}: {len(rows)} rows")
+
+        return len(rows)
+
+    @staticmethod
+    def percent_change(current: int, previous: int) -> float:
+
+        if previous > 0:
+            return round(((current - previous) / previous) * 100, 1)
+        return 100 if current > 0 else 0
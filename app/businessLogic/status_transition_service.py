@@ -0,0 +1,213 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import true
+from typing import Callable, List, Optional
+from dataclasses import dataclass
+from collections import Counter
+from datetime import date, datetime, timedelta
+import logging
+
+from app.core.config import settings
+from app.core.cache import response_cache, TENDERS
+from app.models.job_state import JobState
+from app.models.notification import DeadlineReminder
+from app.models.tender import Tender
+from app.businessLogic.stats_service import StatsService
+
+logger = logging.getLogger(__name__)
+
+EXPIRED = "expired"
+
+# Statuses a tender can expire from. Listed explicitly (instead of
+# status != 'expired') so the sweep is a range scan on (status, deadline_date).
+ACTIVE_STATUSES = ("new", "viewed", "saved")
+
+EXPIRY_SWEEP_JOB = "tender_expiry_sweep"
+
+# The next sweep re-reads this far behind the previous one's start, so
+# tenders written by a transaction still open at that moment (a fetch can
+# run this long) are not skipped
+SWEEP_WATERMARK_MARGIN = timedelta(minutes=settings.FETCH_JOB_TIMEOUT_MINUTES)
+
+
+@dataclass(frozen=True)
+class StatusTransition:
+    tender_id: int
+    source_id: int
+    from_status: str
+    to_status: str
+    at: datetime
+
+
+TransitionListener = Callable[[Session, List[StatusTransition]], None]
+
+_listeners: List[TransitionListener] = []
+
+
+def on_transition(listener: TransitionListener) -> TransitionListener:
+    """
+    Register a listener for status transitions.
+
+    Listeners run inside the transaction that changed the statuses, after
+    the UPDATE and before the commit, so whatever they write commits (or
+    rolls back) together with the transitions. They must not commit.
+    """
+    _listeners.append(listener)
+    return listener
+
+
+class StatusTransitionService:
+
+    @staticmethod
+    def get_watermark(db: Session, name: str) -> Optional[datetime]:
+
+        state = db.query(JobState).filter(JobState.name == name).first()
+        return state.watermark if state else None
+
+    @staticmethod
+    def set_watermark(db: Session, name: str, value: datetime):
+        """Does not commit"""
+        state = db.query(JobState).filter(JobState.name == name).first()
+        if state is None:
+            state = JobState(name=name)
+            db.add(state)
+        state.watermark = value
+
+    @staticmethod
+    def emit(db: Session, transitions: List[StatusTransition]):
+
+        for listener in _listeners:
+            listener(db, transitions)
+
+    @staticmethod
+    def expiry_query(db: Session, today: date, condition=None, chunk_size: Optional[int] = None):
+        """The next chunk of active tenders whose deadline is before `today`"""
+        return db.query(Tender.id, Tender.source_id, Tender.status).filter(
+            Tender.status.in_(ACTIVE_STATUSES),
+            Tender.deadline_date < today,
+            Tender.is_deleted == False,
+            condition if condition is not None else true()
+        ).order_by(Tender.id).limit(chunk_size or settings.EXPIRY_SWEEP_CHUNK_SIZE)
+
+    @staticmethod
+    def expire_chunk(db: Session, today: date, condition=None, chunk_size: Optional[int] = None) -> int:
+        """
+        Expire up to `chunk_size` active tenders whose deadline is before
+        `today` (and that match `condition`) in one short transaction.
+
+        Returns:
+            Tenders expired; fewer than `chunk_size` means none are left
+        """
+        chunk_size = chunk_size or settings.EXPIRY_SWEEP_CHUNK_SIZE
+
+        try:
+            rows = StatusTransitionService.expiry_query(
+                db, today, condition, chunk_size
+            ).with_for_update().all()
+
+            if not rows:
+                db.rollback()
+                return 0
+
+            db.query(Tender).filter(
+                Tender.id.in_([row.id for row in rows])
+            ).update({"status": EXPIRED}, synchronize_session=False)
+
+            now = datetime.utcnow()
+            StatusTransitionService.emit(db, [
+                StatusTransition(
+                    tender_id=row.id,
+                    source_id=row.source_id,
+                    from_status=row.status,
+                    to_status=EXPIRED,
+                    at=now
+                )
+                for row in rows
+            ])
+
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        response_cache.invalidate(TENDERS)
+
+        return len(rows)
+
+    @staticmethod
+    def sweep_passes(db: Session) -> list:
+        """
+        Conditions for the tenders that can have expired since the last
+        sweep: deadlines from the last sweep's day onwards, plus anything
+        written since (late-scraped or edited tenders with old deadlines).
+        The first sweep has no watermark and covers everything.
+        """
+        last_sweep = StatusTransitionService.get_watermark(db, EXPIRY_SWEEP_JOB)
+
+        if last_sweep is None:
+            return [None]
+
+        # A day of overlap absorbs the UTC watermark vs local-date deadline
+        return [
+            Tender.deadline_date >= last_sweep.date() - timedelta(days=1),
+            Tender.updated_at >= last_sweep
+        ]
+
+    @staticmethod
+    def finish_sweep(db: Session, started_at: datetime):
+
+        StatusTransitionService.set_watermark(
+            db, EXPIRY_SWEEP_JOB, started_at - SWEEP_WATERMARK_MARGIN
+        )
+        db.commit()
+
+    @staticmethod
+    def sweep_expired(
+            db: Session,
+            today: Optional[date] = None,
+            pause: Optional[Callable[[], None]] = None
+    ) -> int:
+        """
+        Expire every tender whose deadline passed since the last sweep,
+        chunk by chunk, calling `pause` between full chunks.
+        """
+        started_at = datetime.utcnow()
+        today = today or date.today()
+        chunk_size = settings.EXPIRY_SWEEP_CHUNK_SIZE
+        total = 0
+
+        for condition in StatusTransitionService.sweep_passes(db):
+            while True:
+                expired = StatusTransitionService.expire_chunk(db, today, condition, chunk_size)
+                total += expired
+                if expired < chunk_size:
+                    break
+                if pause:
+                    pause()
+
+        StatusTransitionService.finish_sweep(db, started_at)
+
+        if total:
+            logger.info(f"Marked {total} tenders as expired")
+
+        return total
+
+
+# ---------------- LISTENERS ----------------
+
+@on_transition
+def _record_expiry_stats(db: Session, transitions: List[StatusTransition]):
+    # Dashboard rollup: expirations per source per day
+    per_source = Counter(t.source_id for t in transitions if t.to_status == EXPIRED)
+    for source_id, count in per_source.items():
+        StatsService.record(db, source_id, expired=count)
+
+
+@on_transition
+def _drop_pending_reminders(db: Session, transitions: List[StatusTransition]):
+    # Expired tenders get no more deadline reminders; their markers are dead weight
+    expired_ids = [t.tender_id for t in transitions if t.to_status == EXPIRED]
+    if expired_ids:
+        db.query(DeadlineReminder).filter(
+            DeadlineReminder.tender_id.in_(expired_ids)
+        ).delete(synchronize_session=False)
+
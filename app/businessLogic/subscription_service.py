@@ -0,0 +1,206 @@
+from sqlalchemy import exists
+from sqlalchemy.orm import Session
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import logging
+import threading
+import time
+
+from app.models.subscription import NotificationSubscription
+from app.models.keyword import Keyword
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Lower rank = more important (same ordering as KeywordService.match_keywords)
+PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+
+# Each process rebuilds its index this often, so subscriptions changed
+# through another replica or worker take effect within this delay
+SUBSCRIPTION_INDEX_TTL_SECONDS = 60
+
+
+def _value(enum_or_str) -> Optional[str]:
+    return getattr(enum_or_str, "value", enum_or_str)
+
+
+class SubscriptionIndex:
+    """
+    In-memory inverted index of notification subscriptions.
+
+    Buckets are keyed by scope - ("keyword", id), ("category", name) or
+    ("all", None) - and map user_id to the lowest priority rank the user
+    accepts. Resolving subscribers for a matched tender only touches the
+    buckets of its matched keywords.
+
+    Active users without any subscription get every alert, as before
+    subscriptions existed: they are indexed as implicit ("all", None)
+    subscribers until they create their first one.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, object], Dict[int, int]] = {}
+        self._defaults: Set[int] = set()
+        self._loaded_at: Optional[float] = None
+
+    @staticmethod
+    def _scope(subscription: NotificationSubscription) -> Tuple[str, object]:
+        if subscription.keyword_id is not None:
+            return ("keyword", subscription.keyword_id)
+        if subscription.category is not None:
+            return ("category", _value(subscription.category))
+        return ("all", None)
+
+    @staticmethod
+    def _max_rank(subscription: NotificationSubscription) -> int:
+        if subscription.min_priority is None:
+            return max(PRIORITY_RANK.values())
+        return PRIORITY_RANK[_value(subscription.min_priority)]
+
+    def _fresh(self) -> bool:
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < SUBSCRIPTION_INDEX_TTL_SECONDS
+        )
+
+    def ensure_loaded(self, db: Session):
+        """Build the index from the database on first use and once it expires"""
+        if self._fresh():
+            return
+
+        subscriptions = db.query(NotificationSubscription).all()
+
+        default_user_ids = [
+            row.id for row in db.query(User.id).filter(
+                User.is_active == True,
+                ~exists().where(NotificationSubscription.user_id == User.id)
+            ).all()
+        ]
+
+        with self._lock:
+            self._buckets = {}
+            self._defaults = set(default_user_ids)
+            for subscription in subscriptions:
+                self._add_locked(subscription)
+
+            everything = self._buckets.setdefault(("all", None), {})
+            for user_id in self._defaults:
+                everything[user_id] = max(PRIORITY_RANK.values())
+
+            self._loaded_at = time.monotonic()
+
+        logger.info(
+            f"Loaded {len(subscriptions)} notification subscriptions and "
+            f"{len(default_user_ids)} default subscribers into index"
+        )
+
+    def _add_locked(self, subscription: NotificationSubscription):
+        if subscription.user_id in self._defaults:
+            # First explicit subscription replaces the implicit one
+            self._defaults.discard(subscription.user_id)
+            self._buckets.get(("all", None), {}).pop(subscription.user_id, None)
+
+        bucket = self._buckets.setdefault(self._scope(subscription), {})
+        rank = self._max_rank(subscription)
+        # Several subscriptions on one scope: keep the most permissive
+        bucket[subscription.user_id] = max(rank, bucket.get(subscription.user_id, -1))
+
+    def add(self, subscription: NotificationSubscription):
+        with self._lock:
+            if self._loaded_at is not None:
+                self._add_locked(subscription)
+
+    def invalidate(self):
+        """Drop the index; it is rebuilt on the next lookup"""
+        with self._lock:
+            self._buckets = {}
+            self._defaults = set()
+            self._loaded_at = None
+
+    def subscribers_for(self, keywords: Iterable[Keyword]) -> Set[int]:
+        """
+        Get user IDs subscribed to any of the given keywords. With no
+        keywords (e.g. a tender that matched none), the users subscribed to
+        everything without a priority filter.
+
+        Args:
+            keywords: Matched Keyword objects (id, category and priority are read)
+
+        Returns:
+            Set of subscribed user IDs
+        """
+        user_ids: Set[int] = set()
+        keywords = list(keywords)
+
+        with self._lock:
+            if not keywords:
+                lowest = max(PRIORITY_RANK.values())
+                return {
+                    user_id for user_id, max_rank in self._buckets.get(("all", None), {}).items()
+                    if max_rank == lowest
+                }
+
+            for keyword in keywords:
+                rank = PRIORITY_RANK.get(_value(keyword.priority), max(PRIORITY_RANK.values()))
+
+                for scope in (
+                    ("keyword", keyword.id),
+                    ("category", _value(keyword.category)),
+                    ("all", None),
+                ):
+                    for user_id, max_rank in self._buckets.get(scope, {}).items():
+                        if rank <= max_rank:
+                            user_ids.add(user_id)
+
+        return user_ids
+
+
+# SINGLE INSTANCE
+subscription_index = SubscriptionIndex()
+
+
+class SubscriptionService:
+
+    @staticmethod
+    def get_user_subscriptions(db: Session, user_id: int) -> List[NotificationSubscription]:
+
+        return db.query(NotificationSubscription).filter(
+            NotificationSubscription.user_id == user_id
+        ).order_by(NotificationSubscription.created_at.desc()).all()
+
+    @staticmethod
+    def find_duplicate(db: Session, user_id: int, data: dict) -> Optional[NotificationSubscription]:
+
+        return db.query(NotificationSubscription).filter(
+            NotificationSubscription.user_id == user_id,
+            NotificationSubscription.keyword_id == data.get("keyword_id"),
+            NotificationSubscription.category == data.get("category"),
+            NotificationSubscription.min_priority == data.get("min_priority")
+        ).first()
+
+    @staticmethod
+    def create_subscription(db: Session, user_id: int, data: dict) -> NotificationSubscription:
+
+        subscription = NotificationSubscription(user_id=user_id, **data)
+        db.add(subscription)
+        db.commit()
+        db.refresh(subscription)
+
+        subscription_index.add(subscription)
+
+        return subscription
+
+    @staticmethod
+    def delete_subscription(db: Session, subscription: NotificationSubscription):
+
+        db.delete(subscription)
+        db.commit()
+
+        # Removal may widen another subscription's bucket entry; rebuild lazily
+        subscription_index.invalidate()
+
+    @staticmethod
+    def get_subscribers(db: Session, keywords: List[Keyword]) -> Set[int]:
+
+        subscription_index.ensure_loaded(db)
+        return subscription_index.subscribers_for(keywords)
@@ -1,3 +1,4 @@
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
 from typing import List, Dict, Optional
 import hashlib
@@ -5,7 +6,7 @@ import logging
 from datetime import datetime
 
 from app.models.tender import Tender
-from app.models.keyword import Keyword
+from app.models.keyword import Keyword, TenderKeywordMatch
 from app.businessLogic.keyword_service import KeywordService
 from app.businessLogic.notification_service import NotificationService
 
@@ -38,11 +39,9 @@ class TenderService:
 
         if matched_keywords:
             tender.matched_keywords = [k.id for k in matched_keywords]
-            tender.keyword_match_count = len(matched_keywords)
 
-            # Update keyword match counts
-            for keyword in matched_keywords:
-                keyword.match_count += 1
+            # Persist matches, keyword counts and analytics
+            KeywordService.save_matches(db, tender, matched_keywords)
 
             # Send notifications for matches
             NotificationService.send_keyword_match_notification(
@@ -52,7 +51,7 @@ class TenderService:
         db.commit()
         db.refresh(tender)
 
-        logger.info(f"Created tender: {tender.reference_id} with {tender.keyword_match_count} keyword matches")
+        logger.info(f"Created tender: {tender.reference_id} with {len(matched_keywords)} keyword matches")
 
         return tender
 
@@ -86,7 +85,7 @@ class TenderService:
 
             if matched_keywords:
                 tender.matched_keywords = [k.id for k in matched_keywords]
-                tender.keyword_match_count = len(matched_keywords)
+                KeywordService.save_matches(db, tender, matched_keywords, late=True)
 
         db.commit()
         db.refresh(tender)
@@ -94,33 +93,25 @@ class TenderService:
         return tender
 
     @staticmethod
-    def check_duplicate(db: Session, reference_id: str, source_id: int) -> Optional[Tender]:
+    def duplicate_query(db: Session, reference_id: str, source_id: int):
 
         return db.query(Tender).filter(
             Tender.reference_id == reference_id,
             Tender.source_id == source_id,
             Tender.is_deleted == False
-        ).first()
+        )
 
     @staticmethod
-    def update_expired_tenders(db: Session) -> int:
-
-        from datetime import date
-
-        today = date.today()
-
-        expired_count = db.query(Tender).filter(
-            Tender.deadline_date < today,
-            Tender.status != "expired",
-            Tender.is_deleted == False
-        ).update({"status": "expired"})
+    def check_duplicate(db: Session, reference_id: str, source_id: int) -> Optional[Tender]:
 
-        db.commit()
+        return TenderService.duplicate_query(db, reference_id, source_id).first()
 
-        if expired_count > 0:
-            logger.info(f"Marked {expired_count} tenders as expired")
+    @staticmethod
+    def update_expired_tenders(db: Session) -> int:
+        """Incremental, chunked expiry sweep (see StatusTransitionService)"""
+        from app.businessLogic.status_transition_service import StatusTransitionService
 
-        return expired_count
+        return StatusTransitionService.sweep_expired(db)
 
     @staticmethod
     def run_keyword_matching(db: Session, limit: int = 100):
@@ -128,7 +119,7 @@ class TenderService:
 
         # Get recent tenders without keyword matches
         tenders = db.query(Tender).filter(
-            Tender.keyword_match_count == 0,
+            ~exists().where(TenderKeywordMatch.tender_id == Tender.id),
             Tender.is_deleted == False
         ).order_by(Tender.created_at.desc()).limit(limit).all()
 
@@ -143,13 +134,9 @@ class TenderService:
 
             if matched_keywords:
                 tender.matched_keywords = [k.id for k in matched_keywords]
-                tender.keyword_match_count = len(matched_keywords)
+                KeywordService.save_matches(db, tender, matched_keywords, late=True)
                 matched_count += 1
 
-                # Update keyword counts
-                for keyword in matched_keywords:
-                    keyword.match_count += 1
-
         db.commit()
 
         logger.info(f"Keyword matching completed: {matched_count}/{len(tenders)} tenders matched")
@@ -0,0 +1,144 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional, Tuple, Type
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+# Entity tags used for invalidation
+TENDERS = "tenders"
+SOURCES = "sources"
+KEYWORDS = "keywords"
+
+MAX_ENTRIES = 500
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: str
+    tags: Tuple[str, ...]
+    stored_at: float
+
+
+class ResponseCache:
+    """
+    In-process cache of serialized JSON responses.
+
+    Entries are keyed on route path + query string and tagged with the
+    entities they were built from; writes invalidate by tag. Each entry
+    carries a strong ETag (hash of the exact body) so clients revalidating
+    with If-None-Match get a 304 without a body.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int = MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(request: Request) -> str:
+        params = sorted(request.query_params.multi_items())
+        return f"{request.url.path}?{'&'.join(f'{k}={v}' for k, v in params)}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry.stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, body: bytes, tags: Iterable[str]) -> CachedResponse:
+        entry = CachedResponse(
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            tags=tuple(tags),
+            stored_at=time.monotonic()
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, *tags: str):
+        """Drop every entry tagged with any of `tags`"""
+        wanted = set(tags)
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if wanted.intersection(e.tags)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = len(self._entries)
+        return {"entries": size, "hits": self.hits, "misses": self.misses}
+
+
+# SINGLE INSTANCE
+response_cache = ResponseCache(ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in [tag.strip() for tag in header.split(",")]
+
+
+def cached_response(
+        request: Request,
+        tags: Iterable[str],
+        build: Callable[[], Any],
+        response_model: Optional[Type[BaseModel]] = None
+) -> Response:
+    """
+    Serve an endpoint's JSON from the response cache.
+
+    On a miss, `build()` produces the payload, which is shaped through
+    `response_model` (when given) exactly as FastAPI would, serialized and
+    stored. Either way a matching If-None-Match gets 304 Not Modified.
+    """
+    key = ResponseCache.key_for(request)
+    entry = response_cache.get(key)
+
+    if entry is None:
+        response_cache.misses += 1
+        payload = build()
+        if response_model is not None:
+            payload = response_model.model_validate(payload, from_attributes=True).model_dump(mode="json")
+        body = json.dumps(jsonable_encoder(payload), separators=(",", ":")).encode()
+        entry = response_cache.set(key, body, tags)
+    else:
+        response_cache.hits += 1
+
+    headers = {
+        "ETag": entry.etag,
+        # Let browsers keep the body but always revalidate
+        "Cache-Control": "private, no-cache"
+    }
+
+    if _etag_matches(request, entry.etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=entry.body, media_type="application/json", headers=headers)
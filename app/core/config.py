@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -17,11 +17,19 @@ class Settings(BaseSettings):
     DATABASE_USER: str = "root"
     DATABASE_PASSWORD: str
     DATABASE_NAME: str = "tender_intel"
+    # Connections per engine for request/job sessions; lease connections
+    # get their own headroom on top (see app.core.database)
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    # Log full table scans of every distinct SELECT (see app.core.query_plan)
+    QUERY_PLAN_CHECK: bool = False
 
     # Security
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    AUTH_CACHE_TTL_SECONDS: int = 60
+    PASSWORD_HASH_WORKERS: int = 4
 
     # Email (Gmail)
     SMTP_HOST: str = "smtp.gmail.com"
@@ -33,17 +41,47 @@ class Settings(BaseSettings):
 
     # Scraping
     SCRAPING_TIMEOUT: int = 30
-    MAX_CONCURRENT_SCRAPES: int = 5
+    MAX_CONCURRENT_SCRAPES: int = 5  # Fetches running at once per process
     USER_AGENT: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
 
     # Notifications
     ENABLE_DESKTOP_NOTIFICATIONS: bool = True
     ENABLE_EMAIL_NOTIFICATIONS: bool = True
+    DEADLINE_REMINDER_DAYS: List[int] = [7, 3, 1]
 
     # Scheduler
     SCHEDULER_TIMEZONE: str = "US/Eastern"
     DEFAULT_FETCH_INTERVAL_HOURS: int = 6
 
+    # Scrape workers (python -m app.worker). When enabled the API and the
+    # scheduler only enqueue fetch jobs; scraping happens in the workers.
+    FETCH_WORKER_ENABLED: bool = False
+    FETCH_WORKER_PROCESSES: int = 4
+    FETCH_WORKER_POLL_SECONDS: int = 5
+    FETCH_JOB_TIMEOUT_MINUTES: int = 60
+
+    # Retention (days kept; deleted in chunks of RETENTION_CHUNK_SIZE)
+    RETENTION_FETCH_LOG_DAYS: int = 90
+    RETENTION_READ_NOTIFICATION_DAYS: int = 90
+    RETENTION_REFRESH_TOKEN_DAYS: int = 7
+    RETENTION_DELETED_TENDER_DAYS: int = 30
+    RETENTION_FETCH_JOB_DAYS: int = 7
+    RETENTION_CHUNK_SIZE: int = 5000
+
+    # Archival: tenders whose deadline passed this long ago move to tenders_archive
+    ARCHIVE_AFTER_DAYS: int = 180
+    ARCHIVE_CHUNK_SIZE: int = 1000
+
+    # Expiry sweep
+    EXPIRY_SWEEP_CHUNK_SIZE: int = 1000
+
+    # Response cache
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+
+    # Exports
+    EXPORT_DIR: str = "exports"
+    EXPORT_RETENTION_HOURS: int = 24
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,18 +1,42 @@
+import asyncio
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine
 )
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import declarative_base, sessionmaker
 from app.core.config import settings
 
+# -------------------------
+# POOL SIZING
+# -------------------------
+# Leases (app.core.lease) keep a connection checked out for as long as they
+# are held: one for the scheduler leader plus one per running fetch, of
+# which a process runs at most MAX_CONCURRENT_SCRAPES. Reserve those on top
+# of the pool so leases never starve request sessions.
+LEASE_CONNECTIONS = settings.MAX_CONCURRENT_SCRAPES + 1
+
+
+def pool_options(url: str, reserved: int = 0) -> dict:
+    # SQLite's default pools are not sized
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "pool_size": settings.DATABASE_POOL_SIZE + reserved,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+    }
+
+
 # -------------------------
 # ASYNC ENGINE
 # -------------------------
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.ENVIRONMENT == "development",
-    pool_pre_ping=True
+    pool_pre_ping=True,
+    **pool_options(settings.DATABASE_URL, reserved=LEASE_CONNECTIONS)
 )
 
 # -------------------------
@@ -24,6 +48,47 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False
 )
 
+# -------------------------
+# SYNC ENGINE
+# -------------------------
+# Scraping, PDF parsing and bulk jobs are blocking code; they run in worker
+# threads on their own sync connections instead of inside the event loop.
+SYNC_DRIVERS = {
+    "mysql+asyncmy": "mysql+pymysql",
+    "mysql+aiomysql": "mysql+pymysql",
+    "sqlite+aiosqlite": "sqlite",
+    "postgresql+asyncpg": "postgresql+psycopg2",
+}
+
+
+def sync_database_url(url: str):
+    url = make_url(url)
+    return url.set(drivername=SYNC_DRIVERS.get(url.drivername, url.drivername))
+
+
+sync_engine = create_engine(
+    sync_database_url(settings.DATABASE_URL),
+    echo=settings.ENVIRONMENT == "development",
+    pool_pre_ping=True,
+    # One session per running fetch on top of jobs and exports
+    **pool_options(settings.DATABASE_URL, reserved=settings.MAX_CONCURRENT_SCRAPES)
+)
+
+SessionLocal = sessionmaker(
+    bind=sync_engine,
+    expire_on_commit=False
+)
+
+
+async def run_in_thread(fn, *args, **kwargs):
+    """Run fn(db, *args, **kwargs) with its own sync session in a worker thread"""
+
+    def call():
+        with SessionLocal() as db:
+            return fn(db, *args, **kwargs)
+
+    return await asyncio.to_thread(call)
+
 # -------------------------
 # BASE
 # -------------------------
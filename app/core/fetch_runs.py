@@ -0,0 +1,156 @@
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+# Finished runs kept in memory for the status endpoint
+MAX_FINISHED_RUNS = 20
+
+# Per-source states
+QUEUED = "queued"
+FETCHING = "fetching"
+DONE = "done"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+FINISHED_STATES = (DONE, FAILED, SKIPPED)
+
+
+@dataclass
+class SourceProgress:
+    source_id: int
+    source_name: Optional[str] = None
+    state: str = QUEUED
+    pages_fetched: int = 0
+    rows_parsed: int = 0
+    rows_upserted: int = 0
+    message: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+@dataclass
+class FetchRun:
+    run_id: str
+    trigger: str                      # "manual" or "scheduled"
+    started_at: datetime
+    sources: Dict[int, SourceProgress] = field(default_factory=dict)
+    finished_at: Optional[datetime] = None
+
+    @property
+    def in_flight(self) -> bool:
+        return self.finished_at is None
+
+    def to_dict(self) -> dict:
+        sources = [asdict(progress) for progress in self.sources.values()]
+        return {
+            "run_id": self.run_id,
+            "trigger": self.trigger,
+            "in_flight": self.in_flight,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "sources_total": len(sources),
+            "sources_finished": sum(1 for s in sources if s["state"] in FINISHED_STATES),
+            "pages_fetched": sum(s["pages_fetched"] for s in sources),
+            "rows_parsed": sum(s["rows_parsed"] for s in sources),
+            "rows_upserted": sum(s["rows_upserted"] for s in sources),
+            "sources": sources
+        }
+
+
+class FetchRunRegistry:
+    """
+    In-memory progress of fetch runs in this process.
+
+    A run covers one or more sources; SourceService reports each source's
+    state and counters as it goes and the run closes itself when every
+    source has finished. The same run_id is written to each FetchLog, so
+    a run's outcome survives a restart or a fetch done by another process.
+    """
+
+    def __init__(self):
+        self._runs: "OrderedDict[str, FetchRun]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def new_run_id() -> str:
+        return uuid.uuid4().hex
+
+    def start(self, sources: Iterable, trigger: str = "manual", run_id: Optional[str] = None) -> FetchRun:
+        """`sources` are (source_id, source_name) pairs"""
+        run = FetchRun(
+            run_id=run_id or self.new_run_id(),
+            trigger=trigger,
+            started_at=datetime.utcnow(),
+            sources={
+                source_id: SourceProgress(source_id=source_id, source_name=name)
+                for source_id, name in sources
+            }
+        )
+
+        with self._lock:
+            self._runs[run.run_id] = run
+            self._prune()
+
+        if not run.sources:
+            run.finished_at = run.started_at
+
+        return run
+
+    def _prune(self):
+        finished = [run_id for run_id, run in self._runs.items() if not run.in_flight]
+        for run_id in finished[:max(0, len(finished) - MAX_FINISHED_RUNS)]:
+            del self._runs[run_id]
+
+    def get(self, run_id: str) -> Optional[FetchRun]:
+        with self._lock:
+            return self._runs.get(run_id)
+
+    def active(self, trigger: Optional[str] = None) -> List[FetchRun]:
+        with self._lock:
+            return [
+                run for run in self._runs.values()
+                if run.in_flight and (trigger is None or run.trigger == trigger)
+            ]
+
+    def latest(self) -> Optional[FetchRun]:
+        with self._lock:
+            return next(reversed(self._runs.values()), None)
+
+    def update(self, run_id: Optional[str], source_id: int, **fields):
+        """Set fields on a source's progress; finishing the last source closes the run"""
+        if not run_id:
+            return
+
+        with self._lock:
+            run = self._runs.get(run_id)
+            if run is None:
+                return
+
+            progress = run.sources.setdefault(source_id, SourceProgress(source_id=source_id))
+            for name, value in fields.items():
+                setattr(progress, name, value)
+
+            if fields.get("state") == FETCHING and progress.started_at is None:
+                progress.started_at = datetime.utcnow()
+
+            if fields.get("state") in FINISHED_STATES:
+                progress.finished_at = datetime.utcnow()
+                if all(p.state in FINISHED_STATES for p in run.sources.values()):
+                    run.finished_at = progress.finished_at
+
+    def increment(self, run_id: Optional[str], source_id: int, name: str, amount: int = 1):
+        if not run_id:
+            return
+
+        with self._lock:
+            run = self._runs.get(run_id)
+            progress = run.sources.get(source_id) if run else None
+            if progress is not None:
+                setattr(progress, name, getattr(progress, name) + amount)
+
+
+# SINGLE INSTANCE
+fetch_runs = FetchRunRegistry()
@@ -0,0 +1,248 @@
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.database import engine
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+LEASE_PREFIX = "tender_intel"
+
+# Lock files for the non-MySQL fallback (single host only)
+LOCK_DIR = os.path.join(tempfile.gettempdir(), "tender_intel_locks")
+
+
+class Lease(ABC):
+    """
+    A named, non-blocking, process-wide lock.
+
+    acquire() returns immediately; a lease is held until release() or until
+    the holding process (or its database connection) dies, so a crashed
+    leader never blocks the others for longer than it takes the server to
+    notice.
+    """
+
+    def __init__(self, name: str):
+        self.name = f"{LEASE_PREFIX}:{name}"
+        self.held = False
+
+    @abstractmethod
+    async def acquire(self) -> bool:
+        pass
+
+    async def is_held(self) -> bool:
+        """Re-check that the lease is still ours (e.g. the connection didn't drop)"""
+        return self.held
+
+    @abstractmethod
+    async def release(self):
+        pass
+
+    async def __aenter__(self) -> bool:
+        return await self.acquire()
+
+    async def __aexit__(self, *exc):
+        await self.release()
+
+
+class MySQLLease(Lease):
+    """
+    MySQL user-level lock (GET_LOCK) on a dedicated connection.
+
+    The lock belongs to the connection, so the connection is kept checked
+    out for as long as the lease is held and runs in autocommit so it never
+    sits in an open transaction. The engine pool reserves room for these
+    (database.LEASE_CONNECTIONS).
+    """
+
+    def __init__(self, name: str, bind: AsyncEngine):
+        super().__init__(name)
+        # MySQL limits lock names to 64 characters
+        if len(self.name) > 64:
+            self.name = f"{LEASE_PREFIX}:{hashlib.sha1(self.name.encode()).hexdigest()}"
+        self.bind = bind
+        self._conn: Optional[AsyncConnection] = None
+
+    async def acquire(self) -> bool:
+        if self.held:
+            return True
+
+        conn = await self.bind.connect()
+        try:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            result = await conn.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": self.name})
+            acquired = result.scalar() == 1
+        except Exception:
+            await conn.close()
+            raise
+
+        if not acquired:
+            await conn.close()
+            return False
+
+        self._conn = conn
+        self.held = True
+        return True
+
+    async def is_held(self) -> bool:
+        if not self.held:
+            return False
+
+        try:
+            result = await self._conn.execute(
+                text("SELECT IS_USED_LOCK(:name) = CONNECTION_ID()"), {"name": self.name}
+            )
+            still_held = result.scalar() == 1
+        except Exception as e:
+            logger.warning(f"Lost lease {self.name}: {e}")
+            still_held = False
+
+        if not still_held:
+            await self._discard()
+
+        return still_held
+
+    async def release(self):
+        if not self.held:
+            return
+
+        try:
+            await self._conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": self.name})
+        except Exception as e:
+            logger.warning(f"Error releasing lease {self.name}: {e}")
+        finally:
+            await self._discard()
+
+    async def _discard(self):
+        self.held = False
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                await conn.close()
+            except Exception:
+                pass
+
+
+class FileLease(Lease):
+    """
+    Exclusive lock on a file in LOCK_DIR, for SQLite/dev setups.
+
+    Only coordinates processes on the same host; the OS drops the lock when
+    the process exits.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        digest = hashlib.sha1(self.name.encode()).hexdigest()[:16]
+        self.path = os.path.join(LOCK_DIR, f"{digest}.lock")
+        self._fd: Optional[int] = None
+
+    async def acquire(self) -> bool:
+        if self.held:
+            return True
+
+        os.makedirs(LOCK_DIR, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            os.close(fd)
+            return False
+
+        self._fd = fd
+        self.held = True
+        return True
+
+    async def release(self):
+        if not self.held:
+            return
+
+        fd, self._fd = self._fd, None
+        self.held = False
+
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+
+def make_lease(name: str) -> Lease:
+    """GET_LOCK on MySQL, a file lock on anything else"""
+    if engine.dialect.name == "mysql":
+        return MySQLLease(name, engine)
+    return FileLease(name)
+
+
+class LeaderElection:
+    """
+    Keeps trying to hold one lease and reports changes of leadership.
+
+    Every `interval` seconds the leader re-checks its lease and followers
+    retry acquiring it, so when the leader dies another process takes over
+    within about one interval.
+    """
+
+    def __init__(self, name: str, interval: int, on_elected, on_lost):
+        self.lease = make_lease(name)
+        self.interval = interval
+        self.on_elected = on_elected
+        self.on_lost = on_lost
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self.lease.held
+
+    async def _check(self):
+        if self.lease.held:
+            if not await self.lease.is_held():
+                logger.warning(f"Lost leadership of {self.lease.name}")
+                self.on_lost()
+        elif await self.lease.acquire():
+            logger.info(f"Acquired leadership of {self.lease.name} (pid {os.getpid()})")
+            self.on_elected()
+
+    async def _run(self):
+        while True:
+            try:
+                await self._check()
+            except Exception as e:
+                logger.error(f"Leader election error for {self.lease.name}: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self.lease.held:
+            self.on_lost()
+            await self.lease.release()
@@ -0,0 +1,262 @@
+"""
+Query-plan checks (MySQL).
+
+    python -m app.core.query_plan
+
+EXPLAINs the queries behind the list endpoints, lookups and background
+jobs and exits with status 1 if any of them scans a whole table, so an
+index regression shows up before it reaches production data sizes.
+
+With QUERY_PLAN_CHECK=true the API additionally EXPLAINs every distinct
+SELECT it runs and logs full scans, which covers query shapes the list
+below does not know about.
+"""
+import asyncio
+import logging
+import sys
+import threading
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, engine
+from app.businessLogic.archive_service import ArchiveService
+from app.businessLogic.fetch_job_service import FetchJobService
+from app.businessLogic.retention_service import RetentionService
+from app.businessLogic.stats_service import StatsService
+from app.businessLogic.status_transition_service import StatusTransitionService
+from app.businessLogic.tender_service import TenderService
+from app.models.fetch_log import FetchLog, FetchStatus
+from app.models.notification import Notification
+from app.models.tender import Tender
+from app.routers import fetch, notifications, tenders
+from app.utils.pagination import encode_cursor, keyset_query
+
+logger = logging.getLogger(__name__)
+
+# Lookup tables that stay small; scanning them is cheaper than an index
+SMALL_TABLES = {
+    "sources", "users", "keywords", "notification_preferences",
+    "notification_subscriptions", "job_states"
+}
+
+# On near-empty tables MySQL picks a scan even when a usable index exists;
+# scans estimated below this many rows are not reported
+FULL_SCAN_MIN_ROWS = 100
+
+# Representative parameters
+PAGE_SIZE = 25
+SAMPLE_ID = 1
+
+
+def explain(db: Session, statement) -> List[Dict]:
+    """Plan rows (id, select_type, table, type, key, rows, Extra, ...)"""
+    connection = db.connection()
+    sql = statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+    return [dict(row) for row in connection.exec_driver_sql(f"EXPLAIN {sql}").mappings()]
+
+
+def full_scans(plan: List[Dict]) -> List[Dict]:
+    """Plan rows that read a whole (non-trivial) table"""
+    return [
+        row for row in plan
+        if row.get("type") == "ALL"
+        and row.get("table")
+        and not row["table"].startswith("<")          # <derived2>, <union1,2>
+        and row["table"] not in SMALL_TABLES
+        and (row.get("rows") or 0) >= FULL_SCAN_MIN_ROWS
+    ]
+
+
+# ---------------- HOT QUERIES ----------------
+
+def _next_page(query, created_column, id_column):
+    # Second page of a newest-first listing, as keyset_page issues it
+    cursor = encode_cursor(datetime.utcnow() - timedelta(days=1), SAMPLE_ID)
+    return keyset_query(query, created_column, id_column, PAGE_SIZE, cursor)[0]
+
+
+def _first_page(query, created_column, id_column):
+    return keyset_query(query, created_column, id_column, PAGE_SIZE)[0]
+
+
+def _tender_page(db: Session, **filters):
+    query = tenders.with_source_name(tenders.list_query(db, **filters))
+    return _first_page(query, Tender.created_at, Tender.id)
+
+
+def _retention_queries() -> Dict[str, Callable[[Session], object]]:
+    return {
+        f"retention_{name}": (
+            lambda db, policy=policy: RetentionService.chunk_query(
+                policy, datetime.utcnow() - timedelta(days=policy.days)
+            )
+        )
+        for name, policy in RetentionService.policies().items()
+    }
+
+
+# Name -> builder of the statement, from the same helpers the app runs
+HOT_QUERIES: Dict[str, Callable[[Session], object]] = {
+    # GET /api/tenders
+    "tenders_page": lambda db: _tender_page(db).statement,
+    "tenders_next_page": lambda db: _next_page(
+        tenders.with_source_name(tenders.list_query(db)), Tender.created_at, Tender.id
+    ).statement,
+    "tenders_by_status": lambda db: _tender_page(db, status="new").statement,
+    "tenders_by_source": lambda db: _tender_page(db, source_id=SAMPLE_ID).statement,
+
+    # TenderService.check_duplicate (per scraped tender)
+    "tender_duplicate": lambda db: TenderService.duplicate_query(
+        db, "REF-1", SAMPLE_ID
+    ).limit(1).statement,
+
+    # GET /api/notifications, /api/notifications/count/unread
+    "notifications_page": lambda db: _first_page(
+        notifications.list_query(db, SAMPLE_ID), Notification.created_at, Notification.id
+    ).statement,
+    "notifications_unread_page": lambda db: _first_page(
+        notifications.list_query(db, SAMPLE_ID, is_read=False),
+        Notification.created_at, Notification.id
+    ).statement,
+    "notifications_unread_count": lambda db: notifications.unread_count_query(SAMPLE_ID),
+
+    # GET /api/fetch/logs, /api/fetch/status
+    "fetch_logs_page": lambda db: _next_page(
+        fetch.logs_query(db), FetchLog.created_at, FetchLog.id
+    ).statement,
+    "fetch_logs_by_status": lambda db: _first_page(
+        fetch.logs_query(db, status=FetchStatus.ERROR), FetchLog.created_at, FetchLog.id
+    ).statement,
+    "fetch_logs_by_source": lambda db: _first_page(
+        fetch.logs_query(db, source_id=SAMPLE_ID), FetchLog.created_at, FetchLog.id
+    ).statement,
+    "fetch_last_success": lambda db: fetch.last_success_query(db).limit(1).statement,
+
+    # Scrape worker claim
+    "fetch_jobs_claim": lambda db: FetchJobService.queued_query(
+        db, settings.MAX_CONCURRENT_SCRAPES
+    ).statement,
+
+    # Expiry sweep, archival, keyword analytics
+    "expiry_sweep": lambda db: StatusTransitionService.expiry_query(
+        db, date.today()
+    ).statement,
+    "archive_candidates": lambda db: ArchiveService.candidates(ArchiveService.cutoff()),
+    "top_keywords": lambda db: StatsService.top_keywords_query(db).statement,
+
+    # Retention, one per policy
+    **_retention_queries(),
+}
+
+
+def check(db: Session) -> Dict[str, List[Dict]]:
+    """
+    EXPLAIN every hot query.
+
+    Returns:
+        {query name: full-scan plan rows} for the queries that failed
+    """
+    failures = {}
+
+    for name, build in HOT_QUERIES.items():
+        scans = full_scans(explain(db, build(db)))
+        if scans:
+            failures[name] = scans
+
+    return failures
+
+
+# ---------------- RUNTIME GUARD ----------------
+
+class PlanGuard:
+    """
+    Explains each distinct SELECT the process runs (once) and logs full
+    table scans. Development aid: every new statement costs an extra
+    round trip.
+    """
+
+    MAX_SEEN = 5000
+
+    def __init__(self):
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def install(self, sync_engine):
+
+        if sync_engine.dialect.name != "mysql":
+            logger.info("Query plan check needs MySQL; not installed")
+            return
+
+        event.listen(sync_engine, "before_cursor_execute", self._before_execute)
+        logger.info("Query plan check installed")
+
+    def _first_time(self, statement: str) -> bool:
+        with self._lock:
+            if statement in self._seen:
+                return False
+            if len(self._seen) >= self.MAX_SEEN:
+                self._seen.clear()
+            self._seen.add(statement)
+            return True
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+
+        if executemany or not statement.lstrip()[:6].upper() == "SELECT":
+            return
+        if not self._first_time(statement):
+            return
+
+        try:
+            # Separate DBAPI cursor: nothing is pending on the connection yet
+            explain_cursor = conn.connection.cursor()
+            try:
+                explain_cursor.execute("EXPLAIN " + statement, parameters)
+                columns = [column[0] for column in explain_cursor.description]
+                plan = [dict(zip(columns, row)) for row in explain_cursor.fetchall()]
+            finally:
+                explain_cursor.close()
+        except Exception as e:
+            logger.debug(f"Could not EXPLAIN statement: {e}")
+            return
+
+        for row in full_scans(plan):
+            logger.warning(
+                f"Full scan of {row['table']} (~{row['rows']} rows): {' '.join(statement.split())}"
+            )
+
+
+# SINGLE INSTANCE
+plan_guard = PlanGuard()
+
+
+async def main() -> int:
+
+    if engine.dialect.name != "mysql":
+        logger.error(f"Query plan check needs MySQL, not {engine.dialect.name}")
+        return 2
+
+    try:
+        async with AsyncSessionLocal() as db:
+            failures = await db.run_sync(check)
+    finally:
+        await engine.dispose()
+
+    for name, scans in failures.items():
+        for row in scans:
+            logger.error(f"{name}: full scan of {row['table']} (~{row['rows']} rows)")
+
+    logger.info(f"Checked {len(HOT_QUERIES)} queries, {len(failures)} with full scans")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    sys.exit(asyncio.run(main()))
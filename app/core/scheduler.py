@@ -1,54 +1,357 @@
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from app.core.config import settings
+import asyncio
 import logging
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import AsyncSessionLocal
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.core.database import AsyncSessionLocal, run_in_thread
+from app.core.lease import LeaderElection, make_lease
+from app.core.fetch_runs import fetch_runs, FAILED, SKIPPED
 
 logger = logging.getLogger(__name__)
 
-scheduler = BackgroundScheduler(timezone=settings.SCHEDULER_TIMEZONE)
+# How often followers retry for leadership and the leader re-checks its lease
+LEADER_CHECK_SECONDS = 30
 
+# Spread scheduled fetches a little so replicas/sources don't all fire on the same second
+FETCH_JITTER_SECONDS = 120
 
-async def fetch_all_sources_job():
-    from app.businessLogic.source_service import fetch_from_all_sources
+# One engine for every scheduled job. A job never runs twice at once,
+# missed runs collapse into a single catch-up run, and runs later than the
+# grace time are skipped rather than queued.
+scheduler = AsyncIOScheduler(
+    timezone=settings.SCHEDULER_TIMEZONE,
+    job_defaults={
+        "max_instances": 1,
+        "coalesce": True,
+        "misfire_grace_time": 300,
+    }
+)
+
+# Per-source guards shared by scheduled and manual fetches
+_source_locks: Dict[int, asyncio.Lock] = {}
+
+# Fetches that may scrape at the same time in this process
+_fetch_slots = asyncio.Semaphore(settings.MAX_CONCURRENT_SCRAPES)
+
+
+def _source_lock(source_id: int) -> asyncio.Lock:
+    lock = _source_locks.get(source_id)
+    if lock is None:
+        lock = _source_locks[source_id] = asyncio.Lock()
+    return lock
+
+
+def is_source_fetching(source_id: int) -> bool:
+    lock = _source_locks.get(source_id)
+    return bool(lock and lock.locked())
+
+
+def fetching_count() -> int:
+    """Sources being fetched (or waiting for a fetch slot) in this process"""
+    return sum(1 for lock in _source_locks.values() if lock.locked())
+
+
+async def run_source_fetch(
+        source_id: int,
+        force: bool = False,
+        run_id: Optional[str] = None
+) -> Optional[dict]:
+    """
+    Fetch one source unless a fetch for it is already running. At most
+    MAX_CONCURRENT_SCRAPES fetches scrape at once; others wait for a slot.
+    `force` bypasses an open circuit breaker (manual fetches); progress is
+    reported to the fetch run `run_id`.
+
+    Returns:
+        The fetch result, or None if skipped because one was in flight
+    """
+    from app.businessLogic.source_service import SourceService
+
+    lock = _source_lock(source_id)
+    if lock.locked():
+        logger.info(f"Fetch for source {source_id} already running, skipping")
+        fetch_runs.update(run_id, source_id, state=SKIPPED, message="Already being fetched")
+        return None
+
+    async with lock, _fetch_slots:
+        # Other replicas (e.g. a manual fetch on a non-leader) use the same lease
+        async with make_lease(f"source:{source_id}") as acquired:
+            if not acquired:
+                logger.info(f"Fetch for source {source_id} running in another process, skipping")
+                fetch_runs.update(run_id, source_id, state=SKIPPED, message="Being fetched by another process")
+                return None
+
+            # Scraping and PDF parsing block; keep them off the event loop
+            return await run_in_thread(SourceService.fetch_from_source, source_id, force, run_id)
+
+
+async def dispatch_source_fetch(
+        source_id: int,
+        force: bool = False,
+        run_id: Optional[str] = None,
+        requested_by: Optional[int] = None
+):
+    """
+    Fetch a source in this process, or queue it for the scrape workers
+    when FETCH_WORKER_ENABLED is set.
+    """
+    if settings.FETCH_WORKER_ENABLED:
+        from app.businessLogic.fetch_job_service import FetchJobService
+
+        return await run_in_thread(FetchJobService.enqueue, source_id, force, requested_by, run_id)
+
+    return await run_source_fetch(source_id, force, run_id)
+
+
+def start_fetch_run(
+        db: Session,
+        source_ids: List[int],
+        trigger: str,
+        requested_by: Optional[int] = None
+) -> Optional[str]:
+    """
+    Open a fetch run and return its id, or None for a manual run while
+    another manual run is in flight (on any replica).
 
-    async with AsyncSessionLocal() as db:
+    The run is recorded in fetch_runs for every replica; live per-page
+    progress is only kept by the process executing it, so runs handled by
+    scrape workers or another replica report per-source outcomes from
+    their fetch jobs and logs.
+    """
+    from app.businessLogic.fetch_run_service import FetchRunService
+
+    run_id = fetch_runs.new_run_id()
+    if not FetchRunService.start(db, run_id, source_ids, trigger, requested_by):
+        return None
+
+    if not settings.FETCH_WORKER_ENABLED:
+        fetch_runs.start([(source_id, None) for source_id in source_ids], trigger, run_id)
+    return run_id
+
+
+async def execute_fetch_run(
+        run_id: str,
+        source_ids: List[int],
+        force: bool = False,
+        requested_by: Optional[int] = None
+):
+    """Fetch the sources concurrently, MAX_CONCURRENT_SCRAPES at a time"""
+    from app.businessLogic.fetch_run_service import FetchRunService
+
+    async def fetch(source_id: int):
         try:
-            logger.info("Starting scheduled fetch job...")
-            await fetch_from_all_sources(db)
-            logger.info("Scheduled fetch job completed")
+            await dispatch_source_fetch(source_id, force, run_id, requested_by)
         except Exception as e:
-            logger.error(f"Error in scheduled fetch job: {str(e)}")
+            logger.error(f"Error fetching source {source_id}: {str(e)}")
+            fetch_runs.update(run_id, source_id, state=FAILED, message=str(e))
+
+    try:
+        await asyncio.gather(*(fetch(source_id) for source_id in source_ids))
+    finally:
+        if settings.FETCH_WORKER_ENABLED:
+            # Only queued here; the run finishes with its last job
+            await run_in_thread(FetchRunService.finish_if_complete, run_id)
+        else:
+            await run_in_thread(FetchRunService.finish, run_id)
+
+
+async def fetch_all_sources_job():
+    from app.models.source import Source
+
+    try:
+        logger.info("Starting scheduled fetch job...")
+
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(select(Source.id).where(Source.is_active == True))
+            source_ids = result.scalars().all()
+
+        run_id = await run_in_thread(start_fetch_run, source_ids, "scheduled")
+        await execute_fetch_run(run_id, source_ids)
+
+        logger.info("Scheduled fetch job completed")
+    except Exception as e:
+        logger.error(f"Error in scheduled fetch job: {str(e)}")
 
 
 async def keyword_matching_job():
-    from app.businessLogic.tender_service import run_keyword_matching
+    from app.businessLogic.tender_service import TenderService
+
+    try:
+        logger.info("Starting keyword matching job...")
+        await run_in_thread(TenderService.run_keyword_matching)
+        logger.info("Keyword matching job completed")
+    except Exception as e:
+        logger.error(f"Error in keyword matching job: {str(e)}")
+
+
+async def deadline_reminder_job():
+    from app.businessLogic.notification_service import NotificationService
+
+    try:
+        logger.info("Starting deadline reminder sweep...")
+        await run_in_thread(NotificationService.check_approaching_deadlines)
+        logger.info("Deadline reminder sweep completed")
+    except Exception as e:
+        logger.error(f"Error in deadline reminder job: {str(e)}")
+
+
+async def release_deferred_notifications_job():
+    from app.businessLogic.notification_service import NotificationService
+
+    try:
+        await run_in_thread(NotificationService.release_deferred)
+    except Exception as e:
+        logger.error(f"Error releasing deferred notifications: {str(e)}")
+
+
+# Pause between retention chunks so hot tables and replicas keep up
+RETENTION_CHUNK_PAUSE_SECONDS = 0.5
 
-    async with AsyncSessionLocal() as db:
+
+def _chunk_pause():
+    # Runs in the job's worker thread, between chunk transactions
+    time.sleep(RETENTION_CHUNK_PAUSE_SECONDS)
+
+
+async def retention_job():
+    from app.businessLogic.retention_service import RetentionService
+
+    now = datetime.utcnow()
+
+    for policy in RetentionService.policies().values():
         try:
-            logger.info("Starting keyword matching job...")
-            await run_keyword_matching(db)
-            logger.info("Keyword matching job completed")
+            total = await run_in_thread(RetentionService.purge, policy, now, pause=_chunk_pause)
+            logger.info(f"Retention {policy.name}: deleted {total} rows")
         except Exception as e:
-            logger.error(f"Error in keyword matching job: {str(e)}")
+            logger.error(f"Error in retention job for {policy.name}: {str(e)}")
+
+
+async def expiry_sweep_job():
+    from app.businessLogic.status_transition_service import StatusTransitionService
+
+    try:
+        total = await run_in_thread(StatusTransitionService.sweep_expired, pause=_chunk_pause)
+        logger.info(f"Expiry sweep marked {total} tenders as expired")
+    except Exception as e:
+        logger.error(f"Error in expiry sweep job: {str(e)}")
+
+
+async def archive_job():
+    from app.businessLogic.archive_service import ArchiveService
+
+    try:
+        total = await run_in_thread(ArchiveService.archive_expired, pause=_chunk_pause)
+        logger.info(f"Archived {total} long-expired tenders")
+    except Exception as e:
+        logger.error(f"Error in archive job: {str(e)}")
+
+
+async def dispatch_due_sources_job():
+    from app.scheduler.adaptive import dispatch_due_sources_job as dispatch
+
+    try:
+        await dispatch()
+    except Exception as e:
+        logger.error(f"Error dispatching due sources: {str(e)}")
 
 
 # Add jobs to scheduler
 scheduler.add_job(
-    fetch_all_sources_job,
-    CronTrigger(hour='*/6'),  # Every 6 hours
-    id='fetch_all_sources',
-    name='Fetch all tender sources',
+    dispatch_due_sources_job,
+    CronTrigger(minute='*', jitter=FETCH_JITTER_SECONDS // 4),  # Each source runs on its own interval
+    id='dispatch_due_sources',
+    name='Fetch sources that are due',
     replace_existing=True
 )
 
 scheduler.add_job(
     keyword_matching_job,
-    CronTrigger(hour='*/1'),  # Every hour
+    CronTrigger(minute=30, jitter=FETCH_JITTER_SECONDS),  # Every hour, away from fetches
     id='keyword_matching',
     name='Run keyword matching',
     replace_existing=True
 )
 
+scheduler.add_job(
+    deadline_reminder_job,
+    CronTrigger(hour=8, minute=0),  # Daily
+    id='deadline_reminders',
+    name='Send deadline reminders',
+    replace_existing=True
+)
+
+scheduler.add_job(
+    retention_job,
+    CronTrigger(hour=3, minute=15),  # Daily, off-peak
+    id='retention',
+    name='Purge expired rows',
+    replace_existing=True
+)
+
+scheduler.add_job(
+    expiry_sweep_job,
+    CronTrigger(minute=5),  # Hourly; each run only touches what changed since the last
+    id='expiry_sweep',
+    name='Expire tenders past their deadline',
+    replace_existing=True
+)
+
+scheduler.add_job(
+    archive_job,
+    CronTrigger(hour=3, minute=45),  # Daily, after retention
+    id='archive_tenders',
+    name='Archive long-expired tenders',
+    replace_existing=True
+)
+
+scheduler.add_job(
+    release_deferred_notifications_job,
+    CronTrigger(minute='*'),  # Every minute
+    id='release_deferred_notifications',
+    name='Release notifications deferred by silent hours',
+    replace_existing=True
+)
+
+
+def _on_elected():
+    scheduler.resume()
+    logger.info("Scheduler jobs resumed (leader)")
+
+
+def _on_lost():
+    scheduler.pause()
+    logger.info("Scheduler jobs paused (not leader)")
+
+
+# SINGLE INSTANCE
+leader = LeaderElection("scheduler", LEADER_CHECK_SECONDS, _on_elected, _on_lost)
+
+
+def start_scheduler():
+    """
+    Start the scheduler paused and join leader election (call from a
+    running event loop). Only the process holding the lease runs jobs, so
+    any number of API workers/replicas can be started.
+    """
+    if not scheduler.running:
+        scheduler.start(paused=True)
+        leader.start()
+        logger.info("Scheduler started, waiting for leadership")
+
+
+async def stop_scheduler():
+    await leader.stop()
+    if scheduler.running:
+        scheduler.shutdown()
+        logger.info("Scheduler stopped")
+
 
+def scheduler_status() -> str:
+    if not scheduler.running:
+        return "stopped"
+    return "running" if leader.is_leader else "standby"
@@ -1,14 +1,20 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional, TypeVar
+from concurrent.futures import ThreadPoolExecutor
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
+import asyncio
 import secrets
 import hashlib
+import threading
+import time
 from datetime import datetime, timedelta
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+T = TypeVar("T")
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
@@ -18,6 +24,74 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+class PasswordHashPool:
+    """
+    Bounded thread pool for bcrypt work.
+
+    bcrypt releases the GIL, so a few threads hash in parallel while the
+    event loop keeps serving other requests. At most `workers` hashes run
+    at once; the rest wait in the pool queue, which is what the metrics
+    report.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        submitted = time.monotonic()
+
+        with self._lock:
+            self.queued += 1
+
+        def task():
+            wait = time.monotonic() - submitted
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, task)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "avg_wait_ms": round(self._total_wait / self.completed * 1000, 1) if self.completed else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000, 1),
+            }
+
+
+# SINGLE INSTANCE
+password_hash_pool = PasswordHashPool(workers=settings.PASSWORD_HASH_WORKERS)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password off the event loop"""
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash off the event loop"""
+    return await password_hash_pool.run(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
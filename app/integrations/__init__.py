@@ -0,0 +1,9 @@
+from app.integrations.excel_export import export_jobs, ExportJobRegistry
+from app.integrations.powerbi import PowerBIExporter, DATASETS
+
+__all__ = [
+    "export_jobs",
+    "ExportJobRegistry",
+    "PowerBIExporter",
+    "DATASETS"
+]
@@ -0,0 +1,294 @@
+import csv
+import io
+import os
+import shutil
+import tempfile
+import uuid
+from datetime import date, datetime, timedelta
+from typing import IO, Dict, Iterator, List, Optional
+
+import openpyxl
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.export_job import ExportJob
+from app.models.source import Source
+from app.models.tender import Tender
+from app.utils.logger import setup_logger
+
+logger = setup_logger("excel_export")
+
+# Rows fetched per round trip from the server-side cursor
+CHUNK_SIZE = 1000
+
+# Workbooks up to this size stay in memory before spilling to disk
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+# Bytes per chunk when streaming a finished file to the client
+STREAM_CHUNK_BYTES = 64 * 1024
+
+EXPORT_HEADERS = [
+    "Title", "Reference ID", "Agency", "Location",
+    "Source", "Published Date", "Deadline",
+    "Days Until Deadline", "Status", "Description"
+]
+
+
+def export_query(
+        db: Session,
+        status: Optional[str] = None,
+        source_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+):
+    """
+    Column projection of the tenders to export.
+
+    Selecting plain columns keeps ORM objects (and the identity map) out of
+    the export; yield_per makes the driver fetch through a server-side
+    cursor CHUNK_SIZE rows at a time.
+    """
+    query = db.query(
+        Tender.title,
+        Tender.reference_id,
+        Tender.agency_name,
+        Tender.agency_location,
+        Source.name,
+        Tender.published_date,
+        Tender.deadline_date,
+        Tender.status,
+        Tender.description
+    ).outerjoin(Source, Tender.source_id == Source.id).filter(Tender.is_deleted == False)
+
+    if status:
+        query = query.filter(Tender.status == status)
+    if source_id:
+        query = query.filter(Tender.source_id == source_id)
+    if date_from:
+        query = query.filter(Tender.published_date >= date_from)
+    if date_to:
+        query = query.filter(Tender.published_date <= date_to)
+
+    return query.order_by(Tender.published_date.desc(), Tender.id.desc()).yield_per(CHUNK_SIZE)
+
+
+def iter_export_rows(query) -> Iterator[List]:
+    today = datetime.utcnow().date()
+
+    for (title, reference_id, agency_name, agency_location, source_name,
+         published_date, deadline_date, status, description) in query:
+        days_until_deadline = (deadline_date - today).days if deadline_date else None
+
+        yield [
+            title,
+            reference_id,
+            agency_name or "",
+            agency_location or "",
+            source_name or "",
+            published_date.strftime("%Y-%m-%d") if published_date else "",
+            deadline_date.strftime("%Y-%m-%d") if deadline_date else "",
+            days_until_deadline if days_until_deadline else "",
+            status,
+            description or ""
+        ]
+
+
+def write_xlsx(rows: Iterator[List], output: IO[bytes]) -> int:
+    """
+    Write rows to a write-only workbook, which flushes each row instead of
+    keeping the sheet in memory.
+
+    Returns:
+        Number of data rows written
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Tenders")
+    ws.append(EXPORT_HEADERS)
+
+    count = 0
+    for row in rows:
+        ws.append(row)
+        count += 1
+
+    wb.save(output)
+    return count
+
+
+def xlsx_file(rows: Iterator[List]) -> IO[bytes]:
+    """Workbook in a spooled temp file, rewound and ready to stream"""
+    output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    write_xlsx(rows, output)
+    output.seek(0)
+    return output
+
+
+def export_xlsx_file(db: Session, *filters) -> IO[bytes]:
+    """Whole export as a workbook (blocking; run it in a thread)"""
+    return xlsx_file(iter_export_rows(export_query(db, *filters)))
+
+
+def iter_file(output: IO[bytes]) -> Iterator[bytes]:
+    try:
+        while True:
+            chunk = output.read(STREAM_CHUNK_BYTES)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        output.close()
+
+
+def iter_csv(rows: Iterator[List]) -> Iterator[bytes]:
+    """
+    CSV straight into the response stream, one chunk of rows at a time.
+
+    Starts with a UTF-8 BOM so Excel opens it with the right encoding.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    buffer.write("\ufeff")
+    writer.writerow(EXPORT_HEADERS)
+
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= CHUNK_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    yield buffer.getvalue().encode("utf-8")
+
+
+def stream_csv(*filters) -> Iterator[bytes]:
+    """
+    CSV export read on its own session, closed when the stream ends. A sync
+    generator, so StreamingResponse iterates it in its threadpool.
+    """
+    with SessionLocal() as db:
+        yield from iter_csv(iter_export_rows(export_query(db, *filters)))
+
+
+# ---------------- BACKGROUND EXPORT JOBS ----------------
+
+# Date filters are stored as ISO strings in ExportJob.filters
+DATE_FILTERS = ("date_from", "date_to")
+
+
+class ExportJobRegistry:
+    """
+    Tracks background exports and the files they produce.
+
+    Jobs are ExportJob rows, so status and progress are visible from every
+    replica. Finished files live in settings.EXPORT_DIR, which must be
+    shared storage when the API runs on several hosts, and are removed
+    after settings.EXPORT_RETENTION_HOURS.
+    """
+
+    def create(self, db: Session, user_id: int, export_format: str, filters: Dict) -> ExportJob:
+        self.purge_expired(db)
+
+        job = ExportJob(
+            id=uuid.uuid4().hex,
+            user_id=user_id,
+            format=export_format,
+            filters={
+                name: value.isoformat() if name in DATE_FILTERS and value else value
+                for name, value in filters.items()
+            }
+        )
+        db.add(job)
+        db.commit()
+
+        return job
+
+    def get(self, db: Session, job_id: str) -> Optional[ExportJob]:
+        return db.query(ExportJob).filter(ExportJob.id == job_id).first()
+
+    def purge_expired(self, db: Session):
+        cutoff = datetime.utcnow() - timedelta(hours=settings.EXPORT_RETENTION_HOURS)
+
+        expired = db.query(ExportJob).filter(ExportJob.completed_at < cutoff).all()
+
+        for job in expired:
+            if job.path and os.path.exists(job.path):
+                os.remove(job.path)
+            db.delete(job)
+
+        if expired:
+            db.commit()
+
+    def run(self, db: Session, job_id: str):
+        """Build the export file for a job (sync, give it its own session)"""
+        job = self.get(db, job_id)
+        if job is None:
+            return
+
+        job.status = "running"
+        db.commit()
+
+        os.makedirs(settings.EXPORT_DIR, exist_ok=True)
+        path = os.path.join(settings.EXPORT_DIR, f"{job.id}.{job.format}")
+        partial = f"{path}.part"
+
+        filters = {
+            name: date.fromisoformat(value) if name in DATE_FILTERS and value else value
+            for name, value in (job.filters or {}).items()
+        }
+
+        row_count = 0
+
+        def counted(rows: Iterator[List]) -> Iterator[List]:
+            # Progress for the status endpoint, written on its own session so
+            # the export's server-side cursor stays open
+            nonlocal row_count
+            for row in rows:
+                row_count += 1
+                if row_count % CHUNK_SIZE == 0:
+                    self._save_progress(job_id, row_count)
+                yield row
+
+        try:
+            rows = counted(iter_export_rows(export_query(db, **filters)))
+
+            with open(partial, "wb") as output:
+                if job.format == "csv":
+                    for chunk in iter_csv(rows):
+                        output.write(chunk)
+                else:
+                    write_xlsx(rows, output)
+
+            shutil.move(partial, path)
+            job.path = path
+            job.status = "completed"
+
+        except Exception as e:
+            db.rollback()
+            job.status = "failed"
+            job.error = str(e)
+            logger.error(f"Export {job.id} failed: {e}")
+            if os.path.exists(partial):
+                os.remove(partial)
+
+        job.row_count = row_count
+        job.completed_at = datetime.utcnow()
+        db.commit()
+
+        if job.status == "completed":
+            logger.info(f"Export {job.id} completed: {job.row_count} rows")
+
+    @staticmethod
+    def _save_progress(job_id: str, count: int):
+        with SessionLocal() as db:
+            db.query(ExportJob).filter(ExportJob.id == job_id).update(
+                {ExportJob.row_count: count}, synchronize_session=False
+            )
+            db.commit()
+
+
+# SINGLE INSTANCE
+export_jobs = ExportJobRegistry()
@@ -0,0 +1,256 @@
+import enum
+import io
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, IO, Iterator, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.fetch_log import FetchLog
+from app.models.keyword import Keyword, TenderKeywordMatch
+from app.models.source import Source
+from app.models.tender import Tender
+from app.integrations.excel_export import CHUNK_SIZE, SPOOL_MAX_BYTES
+from app.utils.logger import setup_logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional, only needed for the BI feed
+    pa = None
+    pq = None
+
+logger = setup_logger("powerbi")
+
+# Rows per Parquet row group / Arrow record batch
+ROW_GROUP_SIZE = 50000
+
+# Delta extracts re-read this much before `since`: a row stamped before the
+# previous watermark but committed after that extract ran is picked up by
+# the next one. Rows in the overlap are sent twice; load them by id.
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+
+@dataclass
+class Dataset:
+    """
+    One exportable table.
+
+    columns: (output name, SQL column, arrow type name)
+    watermark: column a `since` delta extract is filtered and ordered on
+    """
+    name: str
+    columns: List[Tuple[str, object, str]]
+    watermark: object
+    order_id: object
+    base_query: Callable[[Session, List[object]], object]
+
+    def schema(self):
+        return pa.schema([
+            (name, _ARROW_TYPES[type_name]()) for name, _, type_name in self.columns
+        ])
+
+
+def _arrow_types() -> Dict[str, Callable]:
+    if pa is None:
+        return {}
+    return {
+        "int": pa.int64,
+        "str": pa.string,
+        "bool": pa.bool_,
+        "date": pa.date32,
+        "datetime": lambda: pa.timestamp("s"),
+    }
+
+
+_ARROW_TYPES = _arrow_types()
+
+
+DATASETS: Dict[str, Dataset] = {
+    "tenders": Dataset(
+        name="tenders",
+        columns=[
+            ("id", Tender.id, "int"),
+            ("reference_id", Tender.reference_id, "str"),
+            ("title", Tender.title, "str"),
+            ("agency_name", Tender.agency_name, "str"),
+            ("agency_location", Tender.agency_location, "str"),
+            ("source_id", Tender.source_id, "int"),
+            ("source_name", Source.name, "str"),
+            ("published_date", Tender.published_date, "date"),
+            ("deadline_date", Tender.deadline_date, "date"),
+            ("status", Tender.status, "str"),
+            ("version", Tender.version, "int"),
+            ("is_deleted", Tender.is_deleted, "bool"),
+            ("created_at", Tender.created_at, "datetime"),
+            ("updated_at", Tender.updated_at, "datetime"),
+        ],
+        # Updates and soft deletes must reach the BI model too
+        watermark=Tender.updated_at,
+        order_id=Tender.id,
+        base_query=lambda db, cols: db.query(*cols).outerjoin(
+            Source, Tender.source_id == Source.id
+        )
+    ),
+    "keyword_matches": Dataset(
+        name="keyword_matches",
+        columns=[
+            ("id", TenderKeywordMatch.id, "int"),
+            ("tender_id", TenderKeywordMatch.tender_id, "int"),
+            ("keyword_id", TenderKeywordMatch.keyword_id, "int"),
+            ("keyword", Keyword.keyword, "str"),
+            ("category", Keyword.category, "str"),
+            ("priority", Keyword.priority, "str"),
+            ("match_location", TenderKeywordMatch.match_location, "str"),
+            ("created_at", TenderKeywordMatch.created_at, "datetime"),
+        ],
+        watermark=TenderKeywordMatch.created_at,
+        order_id=TenderKeywordMatch.id,
+        base_query=lambda db, cols: db.query(*cols).outerjoin(
+            Keyword, TenderKeywordMatch.keyword_id == Keyword.id
+        )
+    ),
+    "fetch_logs": Dataset(
+        name="fetch_logs",
+        columns=[
+            ("id", FetchLog.id, "int"),
+            ("source_id", FetchLog.source_id, "int"),
+            ("source_name", FetchLog.source_name, "str"),
+            ("status", FetchLog.status, "str"),
+            ("tenders_found", FetchLog.tenders_found, "int"),
+            ("new_tenders", FetchLog.new_tenders, "int"),
+            ("updated_tenders", FetchLog.updated_tenders, "int"),
+            ("started_at", FetchLog.started_at, "datetime"),
+            ("completed_at", FetchLog.completed_at, "datetime"),
+            ("duration_seconds", FetchLog.duration_seconds, "int"),
+            ("created_at", FetchLog.created_at, "datetime"),
+        ],
+        watermark=FetchLog.created_at,
+        order_id=FetchLog.id,
+        base_query=lambda db, cols: db.query(*cols)
+    ),
+}
+
+
+class PowerBIExporter:
+    """
+    Columnar extracts for BI refreshes.
+
+    Rows are read through a server-side cursor and turned into Arrow record
+    batches of ROW_GROUP_SIZE rows, so memory stays flat however large the
+    table is. A `since` watermark limits the extract to rows changed after
+    the previous refresh (less WATERMARK_OVERLAP); the new watermark is
+    returned with every extract.
+    """
+
+    @staticmethod
+    def available() -> bool:
+        return pa is not None
+
+    @staticmethod
+    def watermark(db: Session, dataset: Dataset, since: Optional[datetime]) -> Optional[datetime]:
+        """Upper bound for this extract; pass it back as `since` next time"""
+        query = db.query(func.max(dataset.watermark))
+        if since:
+            query = query.filter(dataset.watermark > since)
+        return query.scalar() or since
+
+    @staticmethod
+    def iter_batches(
+            db: Session,
+            dataset: Dataset,
+            since: Optional[datetime],
+            until: Optional[datetime]
+    ) -> Iterator["pa.RecordBatch"]:
+
+        schema = dataset.schema()
+        query = dataset.base_query(db, [column for _, column, _ in dataset.columns])
+
+        if since:
+            query = query.filter(dataset.watermark > since - WATERMARK_OVERLAP)
+        if until:
+            query = query.filter(dataset.watermark <= until)
+
+        query = query.order_by(dataset.watermark, dataset.order_id).yield_per(CHUNK_SIZE)
+
+        names = [name for name, _, _ in dataset.columns]
+        columns: Dict[str, list] = {name: [] for name in names}
+        pending = 0
+
+        for row in query:
+            for name, value in zip(names, row):
+                columns[name].append(value.value if isinstance(value, enum.Enum) else value)
+            pending += 1
+
+            if pending >= ROW_GROUP_SIZE:
+                yield pa.RecordBatch.from_pydict(columns, schema=schema)
+                columns = {name: [] for name in names}
+                pending = 0
+
+        if pending:
+            yield pa.RecordBatch.from_pydict(columns, schema=schema)
+
+    @staticmethod
+    def parquet_file(batches: Iterator["pa.RecordBatch"], schema) -> IO[bytes]:
+        """Parquet file with one row group per batch, rewound and ready to stream"""
+        output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+
+        writer = pq.ParquetWriter(output, schema, compression="snappy")
+        try:
+            for batch in batches:
+                writer.write_table(pa.Table.from_batches([batch], schema=schema))
+        finally:
+            writer.close()
+
+        output.seek(0)
+        return output
+
+    @staticmethod
+    def extract_parquet(
+            db: Session,
+            dataset: Dataset,
+            since: Optional[datetime],
+            until: Optional[datetime]
+    ) -> IO[bytes]:
+        """Whole extract as a Parquet file (blocking; run it in a thread)"""
+        schema = dataset.schema()
+        return PowerBIExporter.parquet_file(
+            PowerBIExporter.iter_batches(db, dataset, since, until), schema
+        )
+
+    @staticmethod
+    def stream_ipc(
+            dataset: Dataset,
+            since: Optional[datetime],
+            until: Optional[datetime]
+    ) -> Iterator[bytes]:
+        """
+        Arrow IPC stream of an extract read on its own session. A sync
+        generator, so StreamingResponse iterates it in its threadpool.
+        """
+        with SessionLocal() as db:
+            yield from PowerBIExporter.iter_ipc_stream(
+                PowerBIExporter.iter_batches(db, dataset, since, until), dataset.schema()
+            )
+
+    @staticmethod
+    def iter_ipc_stream(batches: Iterator["pa.RecordBatch"], schema) -> Iterator[bytes]:
+        """Arrow IPC stream, one message per record batch as it is built"""
+        sink = io.BytesIO()
+        writer = pa.ipc.new_stream(sink, schema)
+
+        def take() -> bytes:
+            data = sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+            return data
+
+        for batch in batches:
+            writer.write_batch(batch)
+            yield take()  # Schema (first time) + batch
+
+        writer.close()
+        yield take()  # End-of-stream marker (and schema if there were no rows)
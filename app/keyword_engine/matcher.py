@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.keyword import Keyword, TenderKeywordMatch
 from app.models.tender import Tender
+from app.businessLogic.stats_service import StatsService
 from app.utils.logger import setup_logger
 
 logger = setup_logger()
@@ -115,6 +116,8 @@ class KeywordMatcher:
             tender: Tender object
             matches: List of (Keyword, location) tuples
         """
+        new_keyword_ids = []
+
         for keyword, location in matches:
             # Check if match already exists
             existing_query = select(TenderKeywordMatch).where(
@@ -136,6 +139,7 @@ class KeywordMatcher:
                 # Update keyword statistics
                 keyword.match_count += 1
                 keyword.last_match_date = tender.created_at
+                new_keyword_ids.append(keyword.id)
 
                 logger.info(
                     f"Matched keyword '{keyword.keyword}' "
@@ -146,6 +150,12 @@ class KeywordMatcher:
         if matches:
             tender.is_matched = True
 
+        # Rolling keyword analytics
+        if new_keyword_ids:
+            await self.db.run_sync(
+                lambda session: StatsService.record_keyword_matches(session, new_keyword_ids)
+            )
+
         await self.db.commit()
 
     async def match_and_save(self, tender: Tender) -> int:
@@ -5,11 +5,15 @@ from contextlib import asynccontextmanager
 import logging
 
 from app.core.config import settings
-from app.core.database import engine, Base
-from app.core.scheduler import scheduler
+from app.core.database import engine, sync_engine, Base
+from app.core.scheduler import start_scheduler, stop_scheduler, scheduler_status
+from app.core.cache import response_cache
+from app.core.security import password_hash_pool
+from app.notifications.desktop import desktop_worker
+from app.notifications.relay import notification_relay
 
 # Import routers
-from app.routers import auth, tenders, keywords, sources, fetch, notifications
+from app.routers import auth, tenders, keywords, sources, fetch, notifications, powerbi, dashboard
 
 # Configure logging
 logging.basicConfig(
@@ -29,20 +33,28 @@ async def lifespan(app: FastAPI):
 
     logger.info("Database tables created/verified")
 
+    if settings.QUERY_PLAN_CHECK:
+        # Development aid; query_plan pulls in every router and service
+        from app.core.query_plan import plan_guard
+
+        plan_guard.install(engine.sync_engine)
+        plan_guard.install(sync_engine)
+
     # Start scheduler
-    if not scheduler.running:
-        scheduler.start()
-        logger.info("Scheduler started")
+    start_scheduler()
+
+    # Live streams get notifications created by any process
+    notification_relay.start()
 
     yield
 
     # Shutdown
     logger.info("Shutting down Tender Intel System...")
-    if scheduler.running:
-        scheduler.shutdown()
-        logger.info("Scheduler stopped")
+    await notification_relay.stop()
+    await stop_scheduler()
 
     await engine.dispose()
+    sync_engine.dispose()
 
 
 
@@ -70,6 +82,8 @@ app.include_router(keywords.router, prefix="/api/keywords", tags=["Keywords"])
 app.include_router(sources.router, prefix="/api/sources", tags=["Sources"])
 app.include_router(fetch.router, prefix="/api/fetch", tags=["Fetch"])
 app.include_router(notifications.router, prefix="/api/notifications", tags=["Notifications"])
+app.include_router(powerbi.router, prefix="/api/powerbi", tags=["Power BI"])
+app.include_router(dashboard.router, prefix="/api", tags=["Dashboard"])
 
 
 @app.get("/")
@@ -86,7 +100,10 @@ async def health_check():
     return {
         "status": "healthy",
         "database": "connected",
-        "scheduler": "running" if scheduler.running else "stopped"
+        "scheduler": scheduler_status(),
+        "desktop_notifications": desktop_worker.status(),
+        "response_cache": response_cache.stats(),
+        "password_hashing": password_hash_pool.stats()
     }
 
 
@@ -3,7 +3,15 @@ from app.models.tender import Tender
 from app.models.keyword import Keyword
 from app.models.source import Source
 from app.models.fetch_log import FetchLog
-from app.models.notification import Notification
+from app.models.fetch_job import FetchJob
+from app.models.fetch_run import FetchRunRecord
+from app.models.export_job import ExportJob
+from app.models.notification import Notification, DeadlineReminder
+from app.models.subscription import NotificationSubscription
+from app.models.notification_preference import NotificationPreference
+from app.models.stats import DailyTenderStats, KeywordDailyMatch
+from app.models.archive import TenderArchive, TenderKeywordMatchArchive
+from app.models.job_state import JobState
 
 __all__ = [
     "User",
@@ -11,5 +19,16 @@ __all__ = [
     "Keyword",
     "Source",
     "FetchLog",
+    "FetchJob",
+    "FetchRunRecord",
+    "ExportJob",
     "Notification",
+    "DeadlineReminder",
+    "NotificationSubscription",
+    "NotificationPreference",
+    "DailyTenderStats",
+    "KeywordDailyMatch",
+    "TenderArchive",
+    "TenderKeywordMatchArchive",
+    "JobState",
 ]
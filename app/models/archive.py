@@ -0,0 +1,64 @@
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Date, Text, JSON, Index
+from datetime import datetime
+from app.core.database import Base
+
+
+class TenderArchive(Base):
+    """
+    Cold storage for tenders whose deadline passed long ago.
+
+    Same columns (and ids) as `tenders`, so rows are moved with
+    INSERT ... SELECT and can be read back through the Tender mapping
+    (see ArchiveService.tender_entity). Keep in sync with Tender.
+    No foreign keys: archived history must not block deleting sources.
+    """
+    __tablename__ = "tenders_archive"
+    __table_args__ = (
+        Index("ix_tenders_archive_created_id", "created_at", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+
+    title = Column(String(500), nullable=False)
+    reference_id = Column(String(255), nullable=False, index=True)
+    description = Column(Text)
+
+    agency_name = Column(String(255))
+    agency_location = Column(String(255))
+
+    published_date = Column(Date)
+    deadline_date = Column(Date, index=True)
+
+    source_id = Column(Integer, nullable=False, index=True)
+    source_url = Column(String(1000))
+
+    status = Column(String(50))
+
+    attachments = Column(JSON)
+
+    content_hash = Column(String(64))
+    version = Column(Integer, default=1)
+
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    is_deleted = Column(Boolean, default=False)
+
+    archived_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f"<TenderArchive {self.reference_id}>"
+
+
+class TenderKeywordMatchArchive(Base):
+    """Keyword matches of archived tenders (same columns as tender_keyword_matches)"""
+    __tablename__ = "tender_keyword_matches_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+
+    tender_id = Column(Integer, index=True)
+    keyword_id = Column(Integer, index=True)
+
+    match_location = Column(String(50))
+    created_at = Column(DateTime)
+
+    archived_at = Column(DateTime, default=datetime.utcnow)
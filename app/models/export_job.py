@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON
+from datetime import datetime
+from app.core.database import Base
+
+
+class ExportJob(Base):
+    """
+    A background tender export (app.integrations.excel_export).
+
+    Kept in the database so any replica can report its status; the file
+    itself is written to settings.EXPORT_DIR.
+    """
+    __tablename__ = "export_jobs"
+
+    id = Column(String(32), primary_key=True)
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    format = Column(String(10), nullable=False)     # xlsx / csv
+    filters = Column(JSON)                          # export_query arguments, dates as ISO strings
+
+    status = Column(String(20), default="pending", nullable=False)  # pending -> running -> completed | failed
+    row_count = Column(Integer, default=0)
+    path = Column(String(500))
+    error = Column(Text)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    completed_at = Column(DateTime, index=True)
+
+    @property
+    def filename(self) -> str:
+        return f"tenders_{self.created_at.strftime('%Y%m%d_%H%M%S')}.{self.format}"
+
+    def __repr__(self):
+        return f"<ExportJob {self.id} ({self.status})>"
@@ -0,0 +1,49 @@
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Enum, JSON, Index
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.core.database import Base
+import enum
+
+
+class FetchJobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    SKIPPED = "skipped"      # Source already being fetched elsewhere
+    FAILED = "failed"
+
+
+class FetchJob(Base):
+    """A fetch request waiting for, or handled by, a scrape worker (app.worker)"""
+    __tablename__ = "fetch_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    source_id = Column(Integer, ForeignKey("sources.id", ondelete="CASCADE"), nullable=False, index=True)
+    force = Column(Boolean, default=False)  # Bypass the source's circuit breaker
+    requested_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"))  # None = scheduled
+    run_id = Column(String(32), index=True)  # Fetch run, copied to the FetchLog
+
+    # Queue state
+    status = Column(Enum(FetchJobStatus), default=FetchJobStatus.QUEUED, nullable=False)
+    attempts = Column(Integer, default=0)
+    worker_id = Column(String(255))
+
+    # Outcome
+    result = Column(JSON)
+    error = Column(Text)
+
+    # Timing
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime, index=True)
+
+    source = relationship("Source")
+
+    __table_args__ = (
+        # Claim order: oldest queued first
+        Index("ix_fetch_jobs_status_created", "status", "created_at"),
+    )
+
+    def __repr__(self):
+        return f"<FetchJob {self.id} source={self.source_id} ({self.status})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.core.database import Base
@@ -14,6 +14,11 @@ class FetchStatus(str, enum.Enum):
 
 class FetchLog(Base):
     __tablename__ = "fetch_logs"
+    __table_args__ = (
+        # Log listing filtered by status / source, keyset-paged on (created_at, id)
+        Index("ix_fetch_logs_status_created", "status", "created_at", "id"),
+        Index("ix_fetch_logs_source_created", "source_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -29,6 +34,10 @@ class FetchLog(Base):
     tenders_found = Column(Integer, default=0)
     new_tenders = Column(Integer, default=0)
     updated_tenders = Column(Integer, default=0)
+    pages_fetched = Column(Integer, default=0)
+
+    # Fetch run this log belongs to (see app.core.fetch_runs)
+    run_id = Column(String(32), index=True)
 
     # Error Details
     error_details = Column(Text)
@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
+from datetime import datetime
+from app.core.database import Base
+
+# FetchRunRecord.manual_slot while a manual run is in flight
+MANUAL_SLOT = "manual"
+
+
+class FetchRunRecord(Base):
+    """
+    A fetch run (one or more sources fetched together), shared by every
+    replica. Per-source outcomes are the run's FetchLogs and FetchJobs.
+
+    manual_slot is unique: only one in-flight manual run can hold it, so
+    starting a second one fails on insert rather than on a racy check.
+    """
+    __tablename__ = "fetch_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(String(32), unique=True, nullable=False)
+
+    trigger = Column(String(20), nullable=False)    # "manual" or "scheduled"
+    requested_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"))
+    source_ids = Column(JSON)
+    manual_slot = Column(String(20), unique=True)   # MANUAL_SLOT until finished, else NULL
+
+    started_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    finished_at = Column(DateTime, index=True)
+
+    @property
+    def in_flight(self) -> bool:
+        return self.finished_at is None
+
+    def __repr__(self):
+        return f"<FetchRunRecord {self.run_id} ({self.trigger})>"
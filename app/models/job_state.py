@@ -0,0 +1,16 @@
+from sqlalchemy import Column, String, DateTime
+from datetime import datetime
+from app.core.database import Base
+
+
+class JobState(Base):
+    """Progress marker of an incremental background job (e.g. last sweep time)"""
+    __tablename__ = "job_states"
+
+    name = Column(String(100), primary_key=True)
+    watermark = Column(DateTime)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<JobState {self.name} @ {self.watermark}>"
@@ -5,7 +5,8 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     Enum,
-    ForeignKey
+    ForeignKey,
+    Index
 )
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -91,6 +92,10 @@ class Keyword(Base):
 
 class TenderKeywordMatch(Base):
     __tablename__ = "tender_keyword_matches"
+    __table_args__ = (
+        # Windowed keyword analytics and the daily aggregate backfill
+        Index("ix_tender_keyword_matches_created_keyword", "created_at", "keyword_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
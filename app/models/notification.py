@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Enum, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.core.database import Base
@@ -20,6 +20,12 @@ class NotificationChannel(str, enum.Enum):
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Keyset pagination of a user's notifications
+        Index("ix_notifications_user_created", "user_id", "created_at", "id"),
+        # Read/unread filter and the unread badge count (index-only)
+        Index("ix_notifications_user_read_created", "user_id", "is_read", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -45,6 +51,11 @@ class Notification(Base):
     desktop_sent = Column(Boolean, default=False)
     sent_at = Column(DateTime)
 
+    # Held back by silent hours until this time (UTC); cleared on release
+    deliver_after = Column(DateTime, nullable=True, index=True)
+    # When live streams may show it (UTC): creation, or release from silent hours
+    available_at = Column(DateTime, default=datetime.utcnow, index=True)
+
     # Error Tracking
     error_message = Column(Text)
     retry_count = Column(Integer, default=0)
@@ -57,4 +68,23 @@ class Notification(Base):
     tender = relationship("Tender", back_populates="notifications")
 
     def __repr__(self):
-        return f"<Notification {self.type} - {self.title}>"
\ No newline at end of file
+        return f"<Notification {self.type} - {self.title}>"
+
+
+class DeadlineReminder(Base):
+    """One row per (tender, threshold) reminder already issued"""
+    __tablename__ = "deadline_reminders"
+    __table_args__ = (
+        UniqueConstraint("tender_id", "threshold_days", name="uq_deadline_reminder_tender_threshold"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    tender_id = Column(Integer, ForeignKey("tenders.id", ondelete="CASCADE"), nullable=False)
+    threshold_days = Column(Integer, nullable=False)
+
+    # Metadata
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<DeadlineReminder tender={self.tender_id} threshold={self.threshold_days}d>"
@@ -0,0 +1,45 @@
+from sqlalchemy import Column, Integer, Boolean, DateTime, Time, ForeignKey, JSON
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.core.database import Base
+
+
+class NotificationPreference(Base):
+    __tablename__ = "notification_preferences"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # One row per user
+    user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        unique=True,
+        nullable=False,
+        index=True
+    )
+
+    # Channels
+    enable_desktop = Column(Boolean, default=True)
+    enable_email = Column(Boolean, default=True)
+    email_recipients = Column(JSON, default=list)  # Extra addresses
+
+    # Alert Triggers
+    new_tender_published = Column(Boolean, default=True)
+    keyword_match_found = Column(Boolean, default=True)
+    deadline_approaching = Column(Boolean, default=True)
+    system_errors = Column(Boolean, default=False)
+
+    # Silent Hours
+    enable_silent_hours = Column(Boolean, default=False)
+    silent_start_time = Column(Time)
+    silent_end_time = Column(Time)
+
+    # Metadata
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    user = relationship("User", back_populates="notification_preference")
+
+    def __repr__(self):
+        return f"<NotificationPreference user={self.user_id}>"
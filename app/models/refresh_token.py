@@ -17,7 +17,7 @@ class RefreshToken(Base):
     user = relationship("User", back_populates="refresh_tokens")
 
     # Token lifecycle
-    expires_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
     revoked = Column(Boolean, default=False)
 
     # Metadata
@@ -12,6 +12,12 @@ class SourceStatus(str, enum.Enum):
     WARNING = "warning"
 
 
+class BreakerState(str, enum.Enum):
+    CLOSED = "closed"          # Fetching normally
+    OPEN = "open"              # Skipped until breaker_opened_until
+    HALF_OPEN = "half_open"    # One trial fetch allowed
+
+
 class LoginType(str, enum.Enum):
     PUBLIC = "public"
     REQUIRED = "required"
@@ -47,6 +53,15 @@ class Source(Base):
     last_success_at = Column(DateTime)
     consecutive_failures = Column(Integer, default=0)
 
+    # Adaptive scheduling
+    fetch_interval_minutes = Column(Integer)            # None = DEFAULT_FETCH_INTERVAL_HOURS
+    next_fetch_at = Column(DateTime, index=True)        # None = due now
+
+    # Circuit breaker (see app.scraping.utils.circuit_breaker)
+    breaker_state = Column(Enum(BreakerState), default=BreakerState.CLOSED)
+    breaker_opened_until = Column(DateTime)
+    breaker_cooldown_minutes = Column(Integer)
+
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
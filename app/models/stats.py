@@ -0,0 +1,58 @@
+from sqlalchemy import Column, Integer, Date, DateTime, ForeignKey, Index, UniqueConstraint
+from datetime import datetime
+from app.core.database import Base
+
+
+class DailyTenderStats(Base):
+    """
+    Per-day, per-source ingest counters.
+
+    Maintained incrementally by the fetch pipeline so dashboards read a
+    handful of rows instead of counting the tenders table.
+    """
+    __tablename__ = "daily_tender_stats"
+    __table_args__ = (
+        UniqueConstraint("day", "source_id", name="uq_daily_tender_stats_day_source"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    day = Column(Date, nullable=False, index=True)
+    source_id = Column(Integer, ForeignKey("sources.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    # Counters
+    new_tenders = Column(Integer, default=0, nullable=False)
+    matched_tenders = Column(Integer, default=0, nullable=False)
+    updated_tenders = Column(Integer, default=0, nullable=False)
+    expired_tenders = Column(Integer, default=0, nullable=False)
+
+    # Metadata
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<DailyTenderStats {self.day} source={self.source_id}>"
+
+
+class KeywordDailyMatch(Base):
+    """
+    Per-day match counter for each keyword.
+
+    Incremented whenever a keyword matches a tender, so top-keyword
+    widgets sum at most (window days x keywords) small rows.
+    """
+    __tablename__ = "keyword_daily_matches"
+    __table_args__ = (
+        UniqueConstraint("day", "keyword_id", name="uq_keyword_daily_match_day_keyword"),
+        # Covers the windowed top-N: range on day, group by keyword, sum counts
+        Index("ix_keyword_daily_matches_day_keyword_count", "day", "keyword_id", "match_count"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    day = Column(Date, nullable=False)
+    keyword_id = Column(Integer, ForeignKey("keywords.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    match_count = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<KeywordDailyMatch {self.day} keyword={self.keyword_id}: {self.match_count}>"
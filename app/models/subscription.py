@@ -0,0 +1,46 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Enum
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.core.database import Base
+from app.models.keyword import KeywordCategory, KeywordPriority
+
+
+class NotificationSubscription(Base):
+    """
+    A user's interest in keyword-match alerts.
+
+    Scope is the keyword when keyword_id is set, otherwise the category when
+    category is set, otherwise every keyword. min_priority narrows any scope
+    to keywords at or above that priority.
+    """
+    __tablename__ = "notification_subscriptions"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Subscriber
+    user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+
+    # Scope
+    keyword_id = Column(
+        Integer,
+        ForeignKey("keywords.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True
+    )
+    category = Column(Enum(KeywordCategory), nullable=True)
+    min_priority = Column(Enum(KeywordPriority), nullable=True)
+
+    # Metadata
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    user = relationship("User", back_populates="subscriptions")
+    keyword = relationship("Keyword")
+
+    def __repr__(self):
+        return f"<NotificationSubscription user={self.user_id} keyword={self.keyword_id} category={self.category}>"
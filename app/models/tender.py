@@ -11,12 +11,26 @@ from sqlalchemy import (
     Text,
     ForeignKey,
     JSON,
+    Index,
 )
 
 
-
 class Tender(Base):
     __tablename__ = "tenders"
+    __table_args__ = (
+        # Backs the relevance-ranked search on GET /api/tenders
+        Index(
+            "ft_tenders_search",
+            "title", "reference_id", "agency_name", "description",
+            mysql_prefix="FULLTEXT"
+        ),
+        # Expiry sweep: status IN (...) AND deadline_date range
+        Index("ix_tenders_status_deadline", "status", "deadline_date"),
+        # Listing keyset pages (created_at, id) under each filter of GET /api/tenders
+        Index("ix_tenders_deleted_created", "is_deleted", "created_at", "id"),
+        Index("ix_tenders_status_created", "status", "created_at", "id"),
+        Index("ix_tenders_source_created", "source_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -49,7 +63,7 @@ class Tender(Base):
 
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     is_deleted = Column(Boolean, default=False)
 
     # --------------------
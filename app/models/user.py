@@ -38,6 +38,17 @@ class User(Base):
         back_populates="user",
         cascade="all, delete-orphan"
     )
+    subscriptions = relationship(
+        "NotificationSubscription",
+        back_populates="user",
+        cascade="all, delete-orphan"
+    )
+    notification_preference = relationship(
+        "NotificationPreference",
+        back_populates="user",
+        uselist=False,
+        cascade="all, delete-orphan"
+    )
 
     def __repr__(self):
         return f"<User {self.email}>"
\ No newline at end of file
@@ -1,14 +1,192 @@
-from plyer import notification
+import os
+import queue
+import sys
+import threading
+import time
+from typing import List, Optional, Tuple
+
 from app.utils.logger import setup_logger
 
+try:
+    from plyer import notification
+except ImportError:  # Optional on servers
+    notification = None
+
 logger = setup_logger("desktop_notification")
 
+# Worker tuning
+QUEUE_SIZE = 100
+MIN_INTERVAL_SECONDS = 5       # At most one toast per interval
+HANG_TIMEOUT_SECONDS = 15      # A notify() call running longer than this disables the channel
+MAX_CONSECUTIVE_FAILURES = 3
+
+
+def _backend_missing_reason() -> Optional[str]:
+    """Cheap checks that rule out a desktop backend without calling it"""
+    if notification is None:
+        return "plyer is not installed"
+    if sys.platform.startswith("linux") and not (
+            os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")
+    ):
+        return "no display available (headless server)"
+    return None
+
+
+class DesktopNotificationWorker:
+    """
+    Dedicated thread that owns all calls into the desktop backend.
+
+    Callers only enqueue. The worker rate-limits toasts, collapses whatever
+    piled up during the wait into one summary toast, and turns the channel
+    off when the backend is missing, keeps failing or hangs.
+    """
+
+    def __init__(self, app_name: str, app_icon: Optional[str] = None):
+        self.app_name = app_name
+        self.app_icon = app_icon
+        self._queue: "queue.Queue[Tuple[str, str, int]]" = queue.Queue(maxsize=QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._busy_since: Optional[float] = None
+        self._consecutive_failures = 0
+        self.dropped = 0
+        self.sent = 0
+
+        self.disabled_reason = _backend_missing_reason()
+        if self.disabled_reason:
+            logger.warning(f"Desktop notifications disabled: {self.disabled_reason}")
+
+    @property
+    def available(self) -> bool:
+        if self.disabled_reason:
+            return False
+
+        busy_since = self._busy_since
+        if busy_since and time.monotonic() - busy_since > HANG_TIMEOUT_SECONDS:
+            self._disable(f"backend call hung for more than {HANG_TIMEOUT_SECONDS}s")
+            return False
+
+        return True
+
+    def _disable(self, reason: str):
+        if not self.disabled_reason:
+            self.disabled_reason = reason
+            logger.error(f"Desktop notifications disabled: {reason}")
+
+    def _ensure_started(self):
+        if self._thread and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name="desktop-notifications",
+                daemon=True
+            )
+            self._thread.start()
+
+    def enqueue(self, title: str, message: str, timeout: int = 10) -> bool:
+        """
+        Queue a toast without blocking.
+
+        Returns:
+            False if the channel is disabled or the queue is full
+        """
+        if not self.available:
+            return False
+
+        self._ensure_started()
+
+        try:
+            self._queue.put_nowait((title, message, timeout))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _drain(self, first: Tuple[str, str, int]) -> List[Tuple[str, str, int]]:
+        items = [first]
+        while True:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                return items
+
+    def _run(self):
+        last_sent = 0.0
+
+        while not self.disabled_reason:
+            item = self._queue.get()
+
+            # Rate limit, letting a burst accumulate meanwhile
+            wait = MIN_INTERVAL_SECONDS - (time.monotonic() - last_sent)
+            if wait > 0:
+                time.sleep(wait)
+
+            items = self._drain(item)
+
+            if len(items) == 1:
+                title, message, timeout = items[0]
+            else:
+                title = f"{len(items)} new alerts"
+                message = "\n".join(t for t, _, _ in items[:3])
+                if len(items) > 3:
+                    message += f"\n+{len(items) - 3} more"
+                timeout = max(t for _, _, t in items)
+
+            self._notify(title, message, timeout)
+            last_sent = time.monotonic()
+
+    def _notify(self, title: str, message: str, timeout: int):
+        self._busy_since = time.monotonic()
+        try:
+            notification.notify(
+                title=title,
+                message=message,
+                app_name=self.app_name,
+                app_icon=self.app_icon,
+                timeout=timeout
+            )
+            self._consecutive_failures = 0
+            self.sent += 1
+            logger.info(f"Desktop notification sent: {title}")
+
+        except NotImplementedError:
+            self._disable("no notification backend for this platform")
+
+        except Exception as e:
+            self._consecutive_failures += 1
+            logger.error(f"Failed to send desktop notification: {e}")
+            if self._consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+                self._disable(f"{self._consecutive_failures} consecutive failures ({e})")
+
+        finally:
+            self._busy_since = None
+
+    def status(self) -> dict:
+        return {
+            "available": self.available,
+            "disabled_reason": self.disabled_reason,
+            "queued": self._queue.qsize(),
+            "sent": self.sent,
+            "dropped": self.dropped,
+        }
+
+
+# SINGLE INSTANCE
+desktop_worker = DesktopNotificationWorker(app_name="Tender Intelligence System")
+
+
 class DesktopNotificationService:
     """Service for sending desktop notifications"""
 
     def __init__(self):
-        self.app_name = "Tender Intelligence System"
-        self.app_icon = None  # Path to icon file if available
+        self.worker = desktop_worker
+
+    @property
+    def available(self) -> bool:
+        return self.worker.available
 
     def send_notification(
             self,
@@ -16,29 +194,20 @@ class DesktopNotificationService:
             message: str,
             tender_url: str = None,
             timeout: int = 10
-    ):
+    ) -> bool:
         """
-        Send desktop notification.
+        Queue a desktop notification. Never blocks the caller.
 
         Args:
             title: Notification title
             message: Notification message
             tender_url: Optional URL to open on click
             timeout: Notification display duration in seconds
-        """
-        try:
-            notification.notify(
-                title=title,
-                message=message,
-                app_name=self.app_name,
-                app_icon=self.app_icon,
-                timeout=timeout
-            )
-
-            logger.info(f"Desktop notification sent: {title}")
 
-        except Exception as e:
-            logger.error(f"Failed to send desktop notification: {e}")
+        Returns:
+            True if queued for delivery
+        """
+        return self.worker.enqueue(title, message, timeout)
 
     def send_tender_alert(self, tender_title: str, keywords: str):
         """Send tender match alert"""
@@ -77,4 +246,4 @@ def send_desktop_notification(
         title=title,
         message=message,
         timeout=timeout
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,126 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.models.notification import Notification, NotificationChannel
+from app.models.user import User
+from app.notifications.desktop import DesktopNotificationService
+from app.notifications.email_sender import send_alert_digest
+from app.schemas.notification_schema import NotificationSettings
+from app.utils.logger import setup_logger
+
+logger = setup_logger("notification_dispatcher")
+
+
+class NotificationDispatcher:
+    """
+    Batched delivery of already-persisted notifications.
+
+    Sends one email per recipient and one desktop toast per batch, no matter
+    how many notifications the batch holds.
+    """
+
+    def __init__(self):
+        self.desktop_service = DesktopNotificationService()
+
+    def dispatch(
+            self,
+            notifications: List[Notification],
+            users: Dict[int, User],
+            subject: str,
+            preferences: Optional[Dict[int, NotificationSettings]] = None
+    ) -> int:
+        """
+        Deliver a batch of notifications.
+
+        Args:
+            notifications: Notification rows (flushed, not yet sent)
+            users: Recipients keyed by user ID
+            subject: Email subject for the per-user digest
+            preferences: Per-user channel settings (defaults when missing)
+
+        Returns:
+            Number of notifications marked as sent
+        """
+        if not notifications:
+            return 0
+
+        preferences = preferences or {}
+        defaults = NotificationSettings()
+
+        by_user: Dict[int, List[Notification]] = defaultdict(list)
+        for notification in notifications:
+            by_user[notification.user_id].append(notification)
+
+        # EMAIL - one digest per user
+        if settings.ENABLE_EMAIL_NOTIFICATIONS:
+            for user_id, user_notifications in by_user.items():
+                user = users.get(user_id)
+                user_settings = preferences.get(user_id, defaults)
+                emailable = [
+                    n for n in user_notifications
+                    if n.channel in (NotificationChannel.EMAIL, NotificationChannel.BOTH)
+                ]
+                if not user or not emailable or not user_settings.enable_email:
+                    continue
+
+                recipients = [user.email] + [
+                    str(e) for e in user_settings.email_recipients if str(e) != user.email
+                ]
+
+                try:
+                    for recipient in recipients:
+                        send_alert_digest(
+                            to_email=recipient,
+                            subject=subject,
+                            items=[(n.title, n.message) for n in emailable],
+                            user_name=user.full_name or "User"
+                        )
+                    for n in emailable:
+                        n.email_sent = True
+                except Exception as e:
+                    logger.error(f"Digest email to user {user_id} failed: {e}")
+                    for n in emailable:
+                        n.error_message = str(e)
+
+        # DESKTOP - one summary toast for the whole batch
+        desktop = [
+            n for n in notifications
+            if n.channel in (NotificationChannel.DESKTOP, NotificationChannel.BOTH)
+            and preferences.get(n.user_id, defaults).enable_desktop
+        ]
+        if settings.ENABLE_DESKTOP_NOTIFICATIONS and desktop and self.desktop_service.available:
+            distinct_titles = {n.title for n in desktop}
+            if len(distinct_titles) == 1:
+                queued = self.desktop_service.send_notification(
+                    title=desktop[0].title,
+                    message=desktop[0].message
+                )
+            else:
+                queued = self.desktop_service.send_notification(
+                    title=subject,
+                    message=f"{len(distinct_titles)} new alerts"
+                )
+            if queued:
+                for n in desktop:
+                    n.desktop_sent = True
+
+        sent_at = datetime.utcnow()
+        sent = 0
+        for notification in notifications:
+            notification.is_sent = bool(notification.email_sent or notification.desktop_sent)
+            if notification.is_sent:
+                notification.sent_at = sent_at
+                sent += 1
+
+        logger.info(
+            f"Dispatched {len(notifications)} notifications to {len(by_user)} users "
+            f"({sent} sent)"
+        )
+
+        return sent
+
+
+# SINGLE INSTANCE
+notification_dispatcher = NotificationDispatcher()
@@ -1,7 +1,7 @@
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional
+from typing import List, Optional, Tuple
 from app.core.config import settings
 from app.utils.logger import setup_logger
 
@@ -60,3 +60,35 @@ async def send_password_reset_otp(
     text = f"Your OTP is {otp} (valid for 10 minutes)"
 
     _send_email(to_email, subject, html, text)
+
+
+# ---------------- ALERT DIGESTS ----------------
+
+def send_alert_digest(
+    to_email: str,
+    subject: str,
+    items: List[Tuple[str, str]],
+    user_name: Optional[str] = "User"
+):
+    """
+    Send several alerts to one recipient as a single email.
+
+    Args:
+        to_email: Recipient address
+        subject: Email subject
+        items: List of (title, message) tuples
+        user_name: Greeting name
+    """
+    rows = "".join(
+        f"<li><strong>{title}</strong><br>{message}</li>" for title, message in items
+    )
+
+    html = f"""
+    <h2>Hello {user_name},</h2>
+    <p>You have {len(items)} new alert(s):</p>
+    <ul>{rows}</ul>
+    """
+
+    text = "\n\n".join(f"{title}\n{message}" for title, message in items)
+
+    _send_email(to_email, subject, html, text)
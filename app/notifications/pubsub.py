@@ -0,0 +1,100 @@
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Dict, Set, Tuple
+
+from app.utils.logger import setup_logger
+
+logger = setup_logger("notification_pubsub")
+
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class NotificationBroker(ABC):
+    """
+    Fan-out of per-user notification events to connected clients.
+
+    Events are plain dicts: {"event": <name>, "data": <json-serializable>}.
+    """
+
+    @abstractmethod
+    def publish(self, user_id: int, event: dict):
+        """Publish an event to every stream of a user. Safe to call from any thread."""
+
+    @abstractmethod
+    def subscribe(self, user_id: int) -> AsyncIterator[dict]:
+        """Async iterator of events for a user until the consumer stops iterating"""
+
+    @abstractmethod
+    def connection_count(self) -> int:
+        """Streams currently subscribed in this process"""
+
+
+class InProcessBroker(NotificationBroker):
+    """
+    Broker for a single API process.
+
+    Each subscriber gets a bounded asyncio.Queue bound to its event loop;
+    publishers hand events over with call_soon_threadsafe, so sync service
+    code running in a thread pool can publish directly. Slow consumers
+    drop events rather than block publishers.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[int, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _offer(q: asyncio.Queue, event: dict):
+        try:
+            q.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning("Notification stream queue full, dropping event")
+
+    def publish(self, user_id: int, event: dict):
+        with self._lock:
+            targets = list(self._subscribers.get(user_id, ()))
+
+        for loop, q in targets:
+            if loop.is_closed():
+                continue
+            loop.call_soon_threadsafe(self._offer, q, event)
+
+    async def subscribe(self, user_id: int) -> AsyncIterator[dict]:
+        entry = (asyncio.get_running_loop(), asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE))
+
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(entry)
+
+        try:
+            while True:
+                yield await entry[1].get()
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(user_id)
+                if subscribers is not None:
+                    subscribers.discard(entry)
+                    if not subscribers:
+                        del self._subscribers[user_id]
+
+    def connection_count(self) -> int:
+        with self._lock:
+            return sum(len(s) for s in self._subscribers.values())
+
+
+_broker: NotificationBroker = InProcessBroker()
+
+
+def get_broker() -> NotificationBroker:
+    return _broker
+
+
+def set_broker(broker: NotificationBroker):
+    """Swap the broker, e.g. for one backed by a local message broker shared by workers"""
+    global _broker
+    _broker = broker
+
+
+def publish_unread_delta(user_id: int, delta: int):
+    if delta:
+        get_broker().publish(user_id, {"event": "unread_delta", "data": {"delta": delta}})
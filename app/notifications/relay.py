@@ -0,0 +1,120 @@
+import asyncio
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.database import run_in_thread
+from app.models.notification import Notification
+from app.notifications.pubsub import get_broker, publish_unread_delta
+from app.schemas.notification_schema import NotificationResponse
+from app.utils.logger import setup_logger
+
+logger = setup_logger("notification_relay")
+
+RELAY_POLL_SECONDS = 2
+
+# Each poll re-reads this far behind the previous one, for rows committed
+# after a later-stamped row was already seen (and small clock skew)
+RELAY_OVERLAP = timedelta(seconds=60)
+
+
+class NotificationRelay:
+    """
+    Publishes notifications created by any process - scrape workers, the
+    scheduler leader, other replicas - to the streams connected here.
+
+    Services only write rows; every API process polls the notifications
+    table by available_at and hands new rows to its own broker. Rows held
+    for silent hours are skipped until release_deferred makes them
+    available. IDs seen within the overlap window are not published twice.
+    """
+
+    def __init__(self, interval: float = RELAY_POLL_SECONDS):
+        self.interval = interval
+        self._since: Optional[datetime] = None
+        self._seen: Dict[int, datetime] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._since = datetime.utcnow()
+            self._task = asyncio.create_task(self._run())
+            logger.info("Notification relay started")
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is None:
+            return
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self):
+        while True:
+            try:
+                await self.poll()
+            except Exception as e:
+                logger.error(f"Error relaying notifications: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def poll(self) -> int:
+        """Publish notifications made available since the last poll; returns how many"""
+        broker = get_broker()
+        started_at = datetime.utcnow()
+
+        if not broker.connection_count():
+            # Nobody listening here, so nothing to catch up on later either
+            self._since = started_at
+            self._seen.clear()
+            return 0
+
+        window_start = self._since - RELAY_OVERLAP
+        rows = await run_in_thread(self._available_since, window_start)
+        self._since = started_at
+
+        new_per_user = defaultdict(int)
+        for notification_id, user_id, available_at, data in rows:
+            if notification_id in self._seen:
+                continue
+            self._seen[notification_id] = available_at
+
+            broker.publish(user_id, {"event": "notification", "data": data})
+            new_per_user[user_id] += 1
+
+        for user_id, count in new_per_user.items():
+            publish_unread_delta(user_id, count)
+
+        # Forget IDs that can no longer come back inside the window
+        self._seen = {
+            notification_id: available_at
+            for notification_id, available_at in self._seen.items()
+            if available_at >= window_start
+        }
+
+        return sum(new_per_user.values())
+
+    @staticmethod
+    def _available_since(db: Session, since: datetime) -> List[tuple]:
+        notifications = db.query(Notification).filter(
+            Notification.available_at >= since,
+            Notification.deliver_after.is_(None)
+        ).order_by(Notification.available_at, Notification.id).all()
+
+        return [
+            (
+                notification.id,
+                notification.user_id,
+                notification.available_at,
+                NotificationResponse.model_validate(notification).model_dump(mode="json")
+            )
+            for notification in notifications
+        ]
+
+
+# SINGLE INSTANCE
+notification_relay = NotificationRelay()
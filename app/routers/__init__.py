@@ -1,3 +1,3 @@
-from app.routers import auth, tenders, keywords, sources, fetch, notifications
+from app.routers import auth, tenders, keywords, sources, fetch, notifications, powerbi
 
-__all__ = ["auth", "tenders", "keywords", "sources", "fetch", "notifications"]
\ No newline at end of file
+__all__ = ["auth", "tenders", "keywords", "sources", "fetch", "notifications", "powerbi"]
\ No newline at end of file
@@ -8,15 +8,15 @@ import string
 from app.models.refresh_token import RefreshToken
 from app.core.database import get_db
 from app.core.security import (
-    verify_password,
-    get_password_hash,
+    verify_password_async,
+    get_password_hash_async,
     create_access_token,
-    decode_access_token,
     create_refresh_token,
     hash_refresh_token,
     get_refresh_token_expiry,
 )
 from app.core.config import settings
+from app.auth.cache import auth_cache
 from app.models.user import User
 from app.schemas.user_schema import (
     UserCreate,
@@ -73,7 +73,7 @@ async def get_current_user(token: str, db: AsyncSession = Depends(get_db)) -> Us
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    payload = decode_access_token(token)
+    payload = auth_cache.get_claims(token)
     if payload is None:
         raise credentials_exception
 
@@ -81,10 +81,7 @@ async def get_current_user(token: str, db: AsyncSession = Depends(get_db)) -> Us
     if email is None:
         raise credentials_exception
 
-    result = await db.execute(
-        select(User).where(User.email == email)
-    )
-    user = result.scalar_one_or_none()
+    user = await auth_cache.get_user(db, email)
 
     if user is None:
         raise credentials_exception
@@ -116,7 +113,7 @@ async def register(
     user = User(
         email=user_data.email,
         full_name=user_data.full_name,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=await get_password_hash_async(user_data.password),
         is_verified=False,
         verification_token=verification_token,
         verification_token_expires=token_expires,
@@ -259,7 +256,7 @@ async def login(
     )
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(login_data.password, user.hashed_password):
+    if not user or not await verify_password_async(login_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -388,11 +385,12 @@ async def reset_password(
         )
 
     # Reset password
-    user.hashed_password = get_password_hash(reset_data.new_password)
+    user.hashed_password = await get_password_hash_async(reset_data.new_password)
     user.reset_otp = None
     user.reset_otp_expires = None
     user.reset_otp_attempts = 0
     await db.commit()
+    auth_cache.invalidate_user(email=user.email, user_id=user.id)
 
     return {"message": "Password reset successful. You can now login with your new password."}
 
@@ -410,7 +408,7 @@ async def update_email(
     db: AsyncSession = Depends(get_db),
 ):
     # Verify password
-    if not verify_password(data.current_password, current_user.hashed_password):
+    if not await verify_password_async(data.current_password, current_user.hashed_password):
         raise HTTPException(status_code=401, detail="Invalid password")
 
     # Check email uniqueness
@@ -428,11 +426,14 @@ async def update_email(
     token = generate_verification_token()
     expires = datetime.utcnow() + timedelta(hours=24)
 
+    old_email = current_user.email
+
     current_user.email = data.new_email
     current_user.is_verified = False
     current_user.verification_token = token
     current_user.verification_token_expires = expires
     await db.commit()
+    auth_cache.invalidate_user(email=old_email, user_id=current_user.id)
 
     verification_link = f"{settings.FRONTEND_URL}/verify-email?token={token}"
 
@@ -455,15 +456,16 @@ async def update_password(
     db: AsyncSession = Depends(get_db),
 ):
     # Verify current password
-    if not verify_password(data.current_password, current_user.hashed_password):
+    if not await verify_password_async(data.current_password, current_user.hashed_password):
         raise HTTPException(status_code=401, detail="Invalid current password")
 
     # Prevent password reuse
-    if verify_password(data.new_password, current_user.hashed_password):
+    if await verify_password_async(data.new_password, current_user.hashed_password):
         raise HTTPException(status_code=400, detail="New password must be different")
 
-    current_user.hashed_password = get_password_hash(data.new_password)
+    current_user.hashed_password = await get_password_hash_async(data.new_password)
     await db.commit()
+    auth_cache.invalidate_user(email=current_user.email, user_id=current_user.id)
 
     return {"message": "Password updated successfully"}
 
@@ -535,6 +537,7 @@ async def logout(
     if refresh_token:
         refresh_token.revoked = True
         await db.commit()
+        auth_cache.invalidate_user(user_id=refresh_token.user_id)
 
     # Always return success (do not reveal token state)
     return {"message": "Logged out successfully"}
@@ -1,36 +1,29 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, desc
-from datetime import datetime, timedelta
-from app.core.database import get_db
+from sqlalchemy import func, desc, case
+from datetime import timedelta
+from typing import Optional
+from app.core.database import run_in_thread
 from app.models.tender import Tender
-from app.models.keyword import Keyword
+from app.models.keyword import KeywordCategory
 from app.models.source import Source
 from app.auth.dependencies import get_current_user
+from app.businessLogic.stats_service import StatsService
 
 router = APIRouter()
 
+TOP_KEYWORD_WINDOWS = (1, 7, 30)
 
-@router.get("/dashboard/stats")
-def get_dashboard_stats(
-        db: Session = Depends(get_db),
-        current_user=Depends(get_current_user)
-):
-    """
-    Get dashboard statistics
-    Matches all cards on Dashboard page
-    """
-    today_start = datetime.now().replace(hour=0, minute=0, second=0)
-    yesterday_start = today_start - timedelta(days=1)
-
-    # New tenders today
-    new_today = db.query(Tender).filter(Tender.created_at >= today_start).count()
-    new_yesterday = db.query(Tender).filter(
-        and_(
-            Tender.created_at >= yesterday_start,
-            Tender.created_at < today_start
-        )
-    ).count()
+
+def _dashboard_stats(db: Session) -> dict:
+    today = StatsService.today()
+    yesterday = today - timedelta(days=1)
+
+    # New / matched counts from the daily rollup
+    totals = StatsService.totals_by_day(db, [today, yesterday])
+
+    new_today = totals[today]["new"]
+    new_yesterday = totals[yesterday]["new"]
 
     # Calculate percentage change
     new_change = 0
@@ -38,47 +31,24 @@ def get_dashboard_stats(
         new_change = ((new_today - new_yesterday) / new_yesterday) * 100
 
     # Keyword matches today
-    matched_today = db.query(Tender).filter(
-        and_(
-            Tender.is_matched == True,
-            Tender.created_at >= today_start
-        )
-    ).count()
-
-    matched_yesterday = db.query(Tender).filter(
-        and_(
-            Tender.is_matched == True,
-            Tender.created_at >= yesterday_start,
-            Tender.created_at < today_start
-        )
-    ).count()
+    matched_today = totals[today]["matched"]
+    matched_yesterday = totals[yesterday]["matched"]
 
     matched_change = 0
     if matched_yesterday > 0:
         matched_change = ((matched_today - matched_yesterday) / matched_yesterday) * 100
 
     # Active sources
-    active_sources = db.query(Source).filter(Source.is_active == True).count()
-    total_sources = db.query(Source).count()
+    active_sources, total_sources = db.query(
+        func.count(case((Source.is_active == True, 1))),
+        func.count(Source.id)
+    ).one()
 
     # Alerts today (new + matched)
     alerts_today = new_today + matched_today
 
-    # Top keywords with match counts
-    top_keywords = db.query(
-        Keyword.keyword,
-        Keyword.group_name,
-        func.count(Tender.id).label('match_count')
-    ).join(
-        Tender,
-        Tender.matched_keywords.like(func.concat('%', Keyword.keyword, '%'))
-    ).filter(
-        Tender.created_at >= today_start - timedelta(days=30)
-    ).group_by(
-        Keyword.id
-    ).order_by(
-        desc('match_count')
-    ).limit(5).all()
+    # Top keywords over the last 30 days from the daily aggregate
+    top_keywords = StatsService.top_keywords(db, days=30, limit=5)
 
     return {
         "new_tenders_today": new_today,
@@ -88,63 +58,98 @@ def get_dashboard_stats(
         "active_sources": active_sources,
         "total_sources": total_sources,
         "alerts_today": alerts_today,
+        "expired_today": totals[today]["expired"],
         "top_keywords": [
             {
-                "keyword": kw[0],
-                "category": kw[1],
-                "matches": kw[2]
+                "keyword": kw["keyword"],
+                "category": kw["category"],
+                "matches": kw["matches"]
             } for kw in top_keywords
         ]
     }
 
 
-@router.get("/dashboard/recent-tenders")
-def get_recent_tenders(
-        limit: int = Query(5, ge=1, le=20),
-        db: Session = Depends(get_db),
+@router.get("/dashboard/stats")
+async def get_dashboard_stats(
         current_user=Depends(get_current_user)
 ):
     """
-    Get recent tenders for dashboard
-    Shows in "Recent Tenders" section
+    Get dashboard statistics
+    Matches all cards on Dashboard page
+    """
+    return await run_in_thread(_dashboard_stats)
+
+
+@router.get("/dashboard/top-keywords")
+async def get_top_keywords(
+        days: int = Query(7, description="Window size in days (1, 7 or 30)"),
+        category: Optional[KeywordCategory] = Query(None),
+        limit: int = Query(10, ge=1, le=50),
+        current_user=Depends(get_current_user)
+):
+    """
+    Top keywords by matches over a sliding window
+    For the "Top Keywords" widget
     """
-    tenders = db.query(Tender).order_by(
-        desc(Tender.publish_date)
-    ).limit(limit).all()
+    if days not in TOP_KEYWORD_WINDOWS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"days must be one of {', '.join(map(str, TOP_KEYWORD_WINDOWS))}"
+        )
 
-    return tenders
+    return {
+        "days": days,
+        "category": category,
+        "items": await run_in_thread(
+            StatsService.top_keywords, days=days, category=category, limit=limit
+        )
+    }
 
 
-@router.get("/dashboard/source-status")
-def get_source_status_overview(
-        db: Session = Depends(get_db),
+@router.get("/dashboard/recent-tenders")
+async def get_recent_tenders(
+        limit: int = Query(5, ge=1, le=20),
         current_user=Depends(get_current_user)
 ):
     """
-    Get source status overview
-    For "Source Status Overview" section
+    Get recent tenders for dashboard
+    Shows in "Recent Tenders" section
     """
-    from app.models.fetch_log import FetchLog
+    def recent(db: Session):
+        return db.query(Tender).order_by(
+            desc(Tender.published_date)
+        ).limit(limit).all()
 
+    return await run_in_thread(recent)
+
+
+def _source_status(db: Session) -> list:
     sources = db.query(Source).filter(Source.is_active == True).all()
 
+    # Today's counters for every source in one query
+    today_stats = StatsService.by_source(db, StatsService.today())
+
     result = []
-    today_start = datetime.now().replace(hour=0, minute=0, second=0)
 
     for source in sources:
-        # Get today's tender count
-        tender_count = db.query(Tender).filter(
-            and_(
-                Tender.source_name == source.name,
-                Tender.created_at >= today_start
-            )
-        ).count()
+        stats = today_stats.get(source.id)
 
         result.append({
             "name": source.name,
-            "status": source.fetch_status,
-            "tenders_today": tender_count,
-            "last_fetch": source.last_fetch
+            "status": source.status,
+            "tenders_today": stats.new_tenders if stats else 0,
+            "last_fetch": source.last_fetch_at
         })
 
-    return result
\ No newline at end of file
+    return result
+
+
+@router.get("/dashboard/source-status")
+async def get_source_status_overview(
+        current_user=Depends(get_current_user)
+):
+    """
+    Get source status overview
+    For "Source Status Overview" section
+    """
+    return await run_in_thread(_source_status)
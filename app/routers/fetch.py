@@ -1,9 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status, BackgroundTasks
 from sqlalchemy.orm import Session
+from sqlalchemy import func
 from typing import Optional
 from datetime import datetime, timedelta
+from dataclasses import replace
 
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.fetch_runs import fetch_runs
+from app.businessLogic.fetch_job_service import FetchJobService
+from app.businessLogic.fetch_run_service import FetchRunService
+from app.businessLogic.retention_service import RetentionService
 from app.models.fetch_log import FetchLog, FetchStatus
 from app.models.source import Source
 from app.models.user import User
@@ -11,44 +18,78 @@ from app.routers.auth import get_current_user
 from app.schemas.fetch_log_schema import (
     FetchLogResponse, FetchLogList, FetchLogFilter
 )
+from app.utils.pagination import keyset_page, count_cache, InvalidCursor
 
 router = APIRouter()
 
 
+def logs_query(db: Session, status: Optional[str] = None, source_id: Optional[int] = None):
+    """Fetch logs matching the listing filters"""
+    query = db.query(FetchLog)
+
+    if status:
+        query = query.filter(FetchLog.status == status)
+
+    if source_id:
+        query = query.filter(FetchLog.source_id == source_id)
+
+    return query
+
+
+def last_success_query(db: Session):
+    return db.query(FetchLog).filter(
+        FetchLog.status == FetchStatus.SUCCESS
+    ).order_by(FetchLog.created_at.desc())
+
+
 @router.get("/logs", response_model=FetchLogList)
 async def get_fetch_logs(
         status: Optional[str] = Query(None),
         source_id: Optional[int] = Query(None),
         page: int = Query(1, ge=1),
         page_size: int = Query(25, ge=1, le=100),
+        cursor: Optional[str] = Query(None),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
-    query = db.query(FetchLog)
+    query = logs_query(db, status, source_id)
 
-    if status:
-        query = query.filter(FetchLog.status == status)
+    # Count by status in one grouped query (cached per filter combination)
+    def count_by_status():
+        rows = query.with_entities(
+            FetchLog.status, func.count(FetchLog.id)
+        ).group_by(FetchLog.status).all()
+        return {row_status: count for row_status, count in rows}
 
-    if source_id:
-        query = query.filter(FetchLog.source_id == source_id)
-
-    # Count total and by status
-    total = query.count()
-    success_count = query.filter(FetchLog.status == FetchStatus.SUCCESS).count()
-    warning_count = query.filter(FetchLog.status == FetchStatus.WARNING).count()
-    error_count = query.filter(FetchLog.status == FetchStatus.ERROR).count()
-    info_count = query.filter(FetchLog.status == FetchStatus.INFO).count()
+    counts, total_is_estimate = count_cache.get_or_compute(
+        ("fetch_logs", status, source_id), count_by_status
+    )
 
     # Pagination
-    offset = (page - 1) * page_size
-    logs = query.order_by(FetchLog.created_at.desc()).offset(offset).limit(page_size).all()
+    next_cursor = prev_cursor = None
+    if cursor or page == 1:
+        try:
+            logs, next_cursor, prev_cursor = keyset_page(
+                query, FetchLog.created_at, FetchLog.id, page_size, cursor
+            )
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        # Legacy page numbers
+        offset = (page - 1) * page_size
+        logs = query.order_by(
+            FetchLog.created_at.desc(), FetchLog.id.desc()
+        ).offset(offset).limit(page_size).all()
 
     return {
-        "total": total,
-        "success_count": success_count,
-        "warning_count": warning_count,
-        "error_count": error_count,
-        "info_count": info_count,
+        "total": sum(counts.values()),
+        "success_count": counts.get(FetchStatus.SUCCESS, 0),
+        "warning_count": counts.get(FetchStatus.WARNING, 0),
+        "error_count": counts.get(FetchStatus.ERROR, 0),
+        "info_count": counts.get(FetchStatus.INFO, 0),
+        "total_is_estimate": total_is_estimate,
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor,
         "items": logs
     }
 
@@ -61,7 +102,7 @@ async def fetch_now(
         current_user: User = Depends(get_current_user)
 ):
 
-    from app.businessLogic.source_service import fetch_from_source, fetch_from_all_sources
+    from app.core.scheduler import start_fetch_run, execute_fetch_run
 
     if source_id:
         source = db.query(Source).filter(Source.id == source_id).first()
@@ -77,38 +118,145 @@ async def fetch_now(
                 detail="Cannot fetch from disabled source"
             )
 
-        # Trigger fetch in background
-        background_tasks.add_task(fetch_from_source, db, source_id)
+        source_ids = [source_id]
+    else:
+        source_ids = [
+            row.id for row in db.query(Source.id).filter(Source.is_active == True).all()
+        ]
+
+    # One manual run at a time, across replicas (unique slot on fetch_runs)
+    run_id = start_fetch_run(db, source_ids, "manual", current_user.id)
+
+    if run_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A manual fetch is already running"
+        )
+
+    if settings.FETCH_WORKER_ENABLED:
+        # Scrape workers pick the jobs up; already queued jobs are reused
+        FetchJobService.enqueue_many(
+            db, source_ids, force=bool(source_id), requested_by=current_user.id, run_id=run_id
+        )
+        # Every source may already have a job running under another run
+        FetchRunService.finish_if_complete(db, run_id)
+    else:
+        # Own sessions, same per-source guard as the scheduler
+        background_tasks.add_task(
+            execute_fetch_run, run_id, source_ids, bool(source_id), current_user.id
+        )
 
+    if source_id:
         return {
             "message": f"Fetch started for {source.name}",
+            "run_id": run_id,
             "source_id": source_id,
             "source_name": source.name
         }
-    else:
-        # Fetch all active sources
-        background_tasks.add_task(fetch_from_all_sources, db)
 
-        active_count = db.query(Source).filter(Source.is_active == True).count()
+    return {
+        "message": "Fetch started for all active sources",
+        "run_id": run_id,
+        "active_sources": len(source_ids)
+    }
+
+
+def _run_from_db(db: Session, run_id: str) -> Optional[dict]:
+    """
+    Progress of a run this process doesn't hold in memory (started on
+    another replica, handled by scrape workers, or finished before a
+    restart), from its fetch_runs row, fetch logs and jobs. Sources show
+    their outcome once logged; live page counts are only available from
+    the process running the fetch.
+    """
+    record = FetchRunService.get(db, run_id)
+    logs = db.query(FetchLog).filter(FetchLog.run_id == run_id).all()
+    jobs = FetchJobService.run_jobs(db, run_id)
+
+    if not record and not logs and not jobs:
+        return None
 
+    def pending(source_id, state="queued", message=None, started_at=None, finished_at=None):
         return {
-            "message": "Fetch started for all active sources",
-            "active_sources": active_count
+            "source_id": source_id,
+            "source_name": None,
+            "state": state,
+            "pages_fetched": 0,
+            "rows_parsed": 0,
+            "rows_upserted": 0,
+            "message": message,
+            "started_at": started_at,
+            "finished_at": finished_at
         }
 
+    sources = {}
+    for source_id in (record.source_ids or []) if record else []:
+        sources[source_id] = pending(source_id)
+
+    for job in jobs:
+        sources[job.source_id] = pending(
+            job.source_id, job.status.value, job.error, job.started_at, job.finished_at
+        )
+
+    log_states = {
+        FetchStatus.SUCCESS: "done",
+        FetchStatus.ERROR: "failed",
+        FetchStatus.WARNING: "skipped",
+        FetchStatus.INFO: "done"
+    }
+    for log in logs:
+        sources[log.source_id] = {
+            "source_id": log.source_id,
+            "source_name": log.source_name,
+            "state": log_states[log.status],
+            "pages_fetched": log.pages_fetched or 0,
+            "rows_parsed": log.tenders_found or 0,
+            "rows_upserted": (log.new_tenders or 0) + (log.updated_tenders or 0),
+            "message": log.message,
+            "started_at": log.started_at,
+            "finished_at": log.completed_at
+        }
+
+    items = list(sources.values())
+    finished = [s for s in items if s["state"] not in ("queued", "running")]
+
+    if record:
+        trigger = record.trigger
+        in_flight = record.in_flight
+        started_at = record.started_at
+        finished_at = record.finished_at
+    else:
+        trigger = "manual" if any(job.requested_by for job in jobs) else None
+        in_flight = len(finished) < len(items)
+        started_at = min((s["started_at"] for s in items if s["started_at"]), default=None)
+        finished_at = None if in_flight else max(
+            (s["finished_at"] for s in items if s["finished_at"]), default=None
+        )
+
+    return {
+        "run_id": run_id,
+        "trigger": trigger,
+        "in_flight": in_flight,
+        "started_at": started_at,
+        "finished_at": finished_at,
+        "sources_total": len(items),
+        "sources_finished": len(finished),
+        "pages_fetched": sum(s["pages_fetched"] for s in items),
+        "rows_parsed": sum(s["rows_parsed"] for s in items),
+        "rows_upserted": sum(s["rows_upserted"] for s in items),
+        "sources": items
+    }
+
 
 @router.get("/status")
 async def get_fetch_status(
+        run_id: Optional[str] = Query(None),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
 
-    from sqlalchemy import func
-
     # Get last successful fetch
-    last_success = db.query(FetchLog).filter(
-        FetchLog.status == FetchStatus.SUCCESS
-    ).order_by(FetchLog.created_at.desc()).first()
+    last_success = last_success_query(db).first()
 
     # Get sources that haven't been fetched in 24 hours
     day_ago = datetime.utcnow() - timedelta(hours=24)
@@ -117,11 +265,65 @@ async def get_fetch_status(
         Source.last_fetch_at < day_ago
     ).count()
 
+    # Live progress from this process, else what the database recorded
+    if run_id:
+        run = fetch_runs.get(run_id)
+        run_info = run.to_dict() if run else _run_from_db(db, run_id)
+        if run_info is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Fetch run not found"
+            )
+    else:
+        active = fetch_runs.active()
+        if active:
+            run_info = active[-1].to_dict()
+        else:
+            record = FetchRunService.latest(db)
+            run_info = _run_from_db(db, record.run_id) if record else None
+
+    queue = FetchJobService.queue_counts(db) if settings.FETCH_WORKER_ENABLED else None
+
+    is_fetching = bool(fetch_runs.active()) or FetchRunService.any_active(db)
+    if queue:
+        is_fetching = is_fetching or queue["running"] > 0
+
     return {
         "last_sync": last_success.created_at if last_success else None,
         "last_sync_message": last_success.message if last_success else "No successful fetch yet",
         "stale_sources": stale_sources,
-        "is_fetching": False  # TODO: Track actual fetch status
+        "is_fetching": is_fetching,
+        "run": run_info,
+        "queue": queue
+    }
+
+
+@router.get("/jobs/{job_id}")
+async def get_fetch_job(
+        job_id: int,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+
+    job = FetchJobService.get_job(db, job_id)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Fetch job not found"
+        )
+
+    return {
+        "job_id": job.id,
+        "source_id": job.source_id,
+        "status": job.status,
+        "attempts": job.attempts,
+        "worker_id": job.worker_id,
+        "result": job.result,
+        "error": job.error,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at
     }
 
 
@@ -132,13 +334,9 @@ async def clear_old_logs(
         current_user: User = Depends(get_current_user)
 ):
 
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
-
-    deleted = db.query(FetchLog).filter(
-        FetchLog.created_at < cutoff_date
-    ).delete()
-
-    db.commit()
+    # Chunked, short transactions instead of one table-wide DELETE
+    policy = replace(RetentionService.policies()["fetch_logs"], days=days)
+    deleted = RetentionService.purge(db, policy)
 
     return {
         "message": f"Deleted {deleted} log entries older than {days} days",
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -6,6 +6,7 @@ from app.core.database import get_db
 from app.models.keyword import Keyword
 from app.models.user import User
 from app.routers.auth import get_current_user
+from app.core.cache import cached_response, response_cache, KEYWORDS
 from app.schemas.keyword_schema import (
     KeywordCreate, KeywordUpdate, KeywordResponse, KeywordList
 )
@@ -15,29 +16,33 @@ router = APIRouter()
 
 @router.get("/", response_model=KeywordList)
 async def get_keywords(
+        request: Request,
         search: Optional[str] = Query(None),
         category: Optional[str] = Query(None),
         priority: Optional[str] = Query(None),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
-    query = db.query(Keyword).filter(Keyword.is_active == True)
+    def build():
+        query = db.query(Keyword).filter(Keyword.is_active == True)
 
-    if search:
-        query = query.filter(Keyword.keyword.ilike(f"%{search}%"))
+        if search:
+            query = query.filter(Keyword.keyword.ilike(f"%{search}%"))
 
-    if category:
-        query = query.filter(Keyword.category == category)
+        if category:
+            query = query.filter(Keyword.category == category)
 
-    if priority:
-        query = query.filter(Keyword.priority == priority)
+        if priority:
+            query = query.filter(Keyword.priority == priority)
 
-    keywords = query.order_by(Keyword.created_at.desc()).all()
+        keywords = query.order_by(Keyword.created_at.desc()).all()
 
-    return {
-        "total": len(keywords),
-        "items": keywords
-    }
+        return {
+            "total": len(keywords),
+            "items": keywords
+        }
+
+    return cached_response(request, [KEYWORDS], build, KeywordList)
 
 
 @router.get("/{keyword_id}", response_model=KeywordResponse)
@@ -78,6 +83,7 @@ async def create_keyword(
     db.add(keyword)
     db.commit()
     db.refresh(keyword)
+    response_cache.invalidate(KEYWORDS)
 
     return keyword
 
@@ -102,6 +108,7 @@ async def update_keyword(
 
     db.commit()
     db.refresh(keyword)
+    response_cache.invalidate(KEYWORDS)
 
     return keyword
 
@@ -123,25 +130,30 @@ async def delete_keyword(
     # Soft delete
     keyword.is_active = False
     db.commit()
+    response_cache.invalidate(KEYWORDS)
 
     return None
 
 
 @router.get("/stats/top")
 async def get_top_keywords(
+        request: Request,
         limit: int = Query(5, ge=1, le=20),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
-    keywords = db.query(Keyword).filter(
-        Keyword.is_active == True
-    ).order_by(Keyword.match_count.desc()).limit(limit).all()
-
-    return [
-        {
-            "keyword": k.keyword,
-            "matches": k.match_count,
-            "priority": k.priority
-        }
-        for k in keywords
-    ]
\ No newline at end of file
+    def build():
+        keywords = db.query(Keyword).filter(
+            Keyword.is_active == True
+        ).order_by(Keyword.match_count.desc()).limit(limit).all()
+
+        return [
+            {
+                "keyword": k.keyword,
+                "matches": k.match_count,
+                "priority": k.priority
+            }
+            for k in keywords
+        ]
+
+    return cached_response(request, [KEYWORDS], build)
\ No newline at end of file
@@ -1,49 +1,109 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional
+import asyncio
+import json
 
-from app.core.database import get_db
+from app.core.database import get_db, run_in_thread
 from app.models.notification import Notification
+from app.models.subscription import NotificationSubscription
+from app.models.keyword import Keyword
 from app.models.user import User
 from app.routers.auth import get_current_user
+from app.businessLogic.subscription_service import SubscriptionService
+from app.businessLogic.preference_service import PreferenceService
+from app.notifications.pubsub import get_broker, publish_unread_delta
+from app.utils.pagination import keyset_page, count_cache, InvalidCursor
 from app.schemas.notification_schema import (
-    NotificationResponse, NotificationList, NotificationSettings, NotificationSettingsUpdate
+    NotificationResponse, NotificationList, NotificationSettings, NotificationSettingsUpdate,
+    SubscriptionCreate, SubscriptionResponse, SubscriptionList
 )
 
 router = APIRouter()
 
+STREAM_HEARTBEAT_SECONDS = 15
 
-@router.get("/", response_model=NotificationList)
-async def get_notifications(
-        is_read: Optional[bool] = Query(None),
-        page: int = Query(1, ge=1),
-        page_size: int = Query(25, ge=1, le=100),
-        db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
-):
-    query = db.query(Notification).filter(
-        Notification.user_id == current_user.id
-    )
+
+def list_query(db: Session, user_id: int, is_read: Optional[bool] = None):
+    """A user's notifications, optionally only read or unread ones"""
+    query = db.query(Notification).filter(Notification.user_id == user_id)
 
     if is_read is not None:
         query = query.filter(Notification.is_read == is_read)
 
-    total = query.count()
-    unread_count = db.query(Notification).filter(
-        Notification.user_id == current_user.id,
+    return query
+
+
+def unread_count_query(user_id: int):
+    return select(func.count(Notification.id)).where(
+        Notification.user_id == user_id,
         Notification.is_read == False
-    ).count()
+    )
+
+
+async def count_unread(db: AsyncSession, user_id: int) -> int:
+    return await db.scalar(unread_count_query(user_id))
+
 
-    offset = (page - 1) * page_size
-    notifications = query.order_by(Notification.created_at.desc()).offset(offset).limit(page_size).all()
+def _notification_page(
+        db: Session,
+        user_id: int,
+        is_read: Optional[bool],
+        page: int,
+        page_size: int,
+        cursor: Optional[str]
+) -> dict:
+    query = list_query(db, user_id, is_read)
+
+    total, total_is_estimate = count_cache.get_or_compute(
+        ("notifications", user_id, is_read), query.count
+    )
+
+    next_cursor = prev_cursor = None
+    if cursor or page == 1:
+        try:
+            notifications, next_cursor, prev_cursor = keyset_page(
+                query, Notification.created_at, Notification.id, page_size, cursor
+            )
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        # Legacy page numbers
+        offset = (page - 1) * page_size
+        notifications = query.order_by(
+            Notification.created_at.desc(), Notification.id.desc()
+        ).offset(offset).limit(page_size).all()
 
     return {
         "total": total,
-        "unread_count": unread_count,
+        "total_is_estimate": total_is_estimate,
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor,
         "items": notifications
     }
 
 
+@router.get("/", response_model=NotificationList)
+async def get_notifications(
+        is_read: Optional[bool] = Query(None),
+        page: int = Query(1, ge=1),
+        page_size: int = Query(25, ge=1, le=100),
+        cursor: Optional[str] = Query(None),
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    # The listing is built with the sync query helpers shared with query_plan
+    result = await run_in_thread(
+        _notification_page, current_user.id, is_read, page, page_size, cursor
+    )
+    result["unread_count"] = await count_unread(db, current_user.id)
+
+    return result
+
+
 @router.patch("/{notification_id}/read", response_model=NotificationResponse)
 async def mark_notification_read(
         notification_id: int,
@@ -61,10 +121,15 @@ async def mark_notification_read(
             detail="Notification not found"
         )
 
+    was_unread = not notification.is_read
+
     notification.is_read = True
     db.commit()
     db.refresh(notification)
 
+    if was_unread:
+        publish_unread_delta(current_user.id, -1)
+
     return notification
 
 
@@ -80,6 +145,8 @@ async def mark_all_read(
 
     db.commit()
 
+    publish_unread_delta(current_user.id, -updated)
+
     return {
         "message": f"Marked {updated} notifications as read",
         "updated_count": updated
@@ -103,31 +170,34 @@ async def delete_notification(
             detail="Notification not found"
         )
 
+    was_unread = not notification.is_read
+
     db.delete(notification)
     db.commit()
 
+    if was_unread:
+        publish_unread_delta(current_user.id, -1)
+
     return {"message": "Notification deleted"}
 
 
 @router.get("/settings", response_model=NotificationSettings)
 async def get_notification_settings(
-        db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
-    # In a real app, this would be stored in a UserSettings table
-    # For now, return default settings
-    return NotificationSettings()
+    return await run_in_thread(PreferenceService.get_settings, current_user.id)
 
 
 @router.patch("/settings", response_model=NotificationSettings)
 async def update_notification_settings(
         settings_update: NotificationSettingsUpdate,
-        db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
-    # TODO: Store in UserSettings table
-    # For now, just return the updated settings
-    return NotificationSettings(**settings_update.dict(exclude_unset=True))
+    return await run_in_thread(
+        PreferenceService.update_settings,
+        current_user.id,
+        settings_update.dict(exclude_unset=True)
+    )
 
 
 @router.get("/count/unread")
@@ -135,9 +205,128 @@ async def get_unread_count(
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
-    count = db.query(Notification).filter(
-        Notification.user_id == current_user.id,
-        Notification.is_read == False
-    ).count()
+    count = await count_unread(db, current_user.id)
+
+    return {"unread_count": count}
+
+
+@router.get("/stream")
+async def stream_notifications(
+        request: Request,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Server-Sent Events stream of new notifications and unread-count deltas.
+
+    Sends one `unread_count` snapshot on connect, then `notification` and
+    `unread_delta` events as they happen, replacing polling of
+    /count/unread and the notification list.
+    """
+    unread_count = await count_unread(db, current_user.id)
+
+    user_id = current_user.id
+
+    # The stream is long-lived; don't hold a pooled connection for it
+    await db.close()
+
+    async def event_source():
+        yield _sse("unread_count", {"unread_count": unread_count})
+
+        events = get_broker().subscribe(user_id).__aiter__()
+        next_event = asyncio.ensure_future(events.__anext__())
+
+        try:
+            while not await request.is_disconnected():
+                done, _ = await asyncio.wait({next_event}, timeout=STREAM_HEARTBEAT_SECONDS)
+
+                if not done:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+
+                event = next_event.result()
+                yield _sse(event["event"], event["data"])
+                next_event = asyncio.ensure_future(events.__anext__())
+        finally:
+            # The pending __anext__ must finish before the generator can close
+            next_event.cancel()
+            try:
+                await next_event
+            except (asyncio.CancelledError, StopAsyncIteration):
+                pass
+            await events.aclose()
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@router.get("/subscriptions", response_model=SubscriptionList)
+async def get_subscriptions(
+        current_user: User = Depends(get_current_user)
+):
+    subscriptions = await run_in_thread(SubscriptionService.get_user_subscriptions, current_user.id)
+
+    return {
+        "total": len(subscriptions),
+        "items": subscriptions
+    }
+
+
+def _create_subscription(db: Session, user_id: int, data: dict) -> NotificationSubscription:
+
+    if data["keyword_id"] is not None:
+        keyword = db.query(Keyword).filter(Keyword.id == data["keyword_id"]).first()
+        if not keyword:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Keyword not found"
+            )
+
+    if SubscriptionService.find_duplicate(db, user_id, data):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Subscription already exists"
+        )
+
+    return SubscriptionService.create_subscription(db, user_id, data)
+
+
+@router.post("/subscriptions", response_model=SubscriptionResponse, status_code=status.HTTP_201_CREATED)
+async def create_subscription(
+        subscription_data: SubscriptionCreate,
+        current_user: User = Depends(get_current_user)
+):
+    return await run_in_thread(_create_subscription, current_user.id, subscription_data.dict())
+
+
+def _delete_subscription(db: Session, user_id: int, subscription_id: int):
+
+    subscription = db.query(NotificationSubscription).filter(
+        NotificationSubscription.id == subscription_id,
+        NotificationSubscription.user_id == user_id
+    ).first()
+
+    if not subscription:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Subscription not found"
+        )
+
+    SubscriptionService.delete_subscription(db, subscription)
+
+
+@router.delete("/subscriptions/{subscription_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_subscription(
+        subscription_id: int,
+        current_user: User = Depends(get_current_user)
+):
+    await run_in_thread(_delete_subscription, current_user.id, subscription_id)
 
-    return {"unread_count": count}
\ No newline at end of file
+    return None
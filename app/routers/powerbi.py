@@ -0,0 +1,88 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from datetime import datetime
+
+from app.core.database import run_in_thread
+from app.models.user import User
+from app.routers.auth import get_current_user
+from app.integrations.excel_export import iter_file
+from app.integrations.powerbi import DATASETS, PowerBIExporter
+
+router = APIRouter()
+
+WATERMARK_HEADER = "X-Watermark"
+
+
+@router.get("/datasets")
+async def list_datasets(
+        current_user: User = Depends(get_current_user)
+):
+    return {
+        "available": PowerBIExporter.available(),
+        "datasets": [
+            {
+                "name": dataset.name,
+                "watermark_column": dataset.watermark.key,
+                "columns": [
+                    {"name": name, "type": type_name}
+                    for name, _, type_name in dataset.columns
+                ]
+            }
+            for dataset in DATASETS.values()
+        ]
+    }
+
+
+@router.get("/datasets/{dataset_name}")
+async def export_dataset(
+        dataset_name: str,
+        format: str = Query("parquet", pattern="^(parquet|arrow)$"),
+        since: Optional[datetime] = Query(None, description="Watermark from the previous extract"),
+        current_user: User = Depends(get_current_user)
+):
+    """
+    Full or delta extract of a dataset.
+
+    The response carries an X-Watermark header; send it back as `since` on
+    the next refresh to pull only rows added or changed after it. Deltas
+    overlap the previous extract slightly, so load rows by id.
+    """
+    if not PowerBIExporter.available():
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Columnar export requires pyarrow"
+        )
+
+    dataset = DATASETS.get(dataset_name)
+    if not dataset:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Dataset not found"
+        )
+
+    until = await run_in_thread(PowerBIExporter.watermark, dataset, since)
+
+    headers = {}
+    if until:
+        headers[WATERMARK_HEADER] = until.isoformat()
+
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    if format == "arrow":
+        headers["Content-Disposition"] = f"attachment; filename={dataset.name}_{stamp}.arrows"
+        return StreamingResponse(
+            PowerBIExporter.stream_ipc(dataset, since, until),
+            media_type="application/vnd.apache.arrow.stream",
+            headers=headers
+        )
+
+    # The file is written in full before streaming; build it in a worker thread
+    output = await run_in_thread(PowerBIExporter.extract_parquet, dataset, since, until)
+
+    headers["Content-Disposition"] = f"attachment; filename={dataset.name}_{stamp}.parquet"
+    return StreamingResponse(
+        iter_file(output),
+        media_type="application/vnd.apache.parquet",
+        headers=headers
+    )
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from typing import Optional
@@ -14,6 +14,7 @@ from app.schemas.source_schema import (
 )
 from cryptography.fernet import Fernet
 from app.core.config import settings
+from app.core.cache import cached_response, response_cache, SOURCES
 
 router = APIRouter()
 
@@ -37,59 +38,67 @@ def decrypt_password(encrypted: str) -> str:
 
 @router.get("/", response_model=SourceList)
 async def get_sources(
+        request: Request,
         search: Optional[str] = Query(None),
         status: Optional[str] = Query(None),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
-    query = db.query(Source)
+    def build():
+        query = db.query(Source)
 
-    if search:
-        query = query.filter(Source.name.ilike(f"%{search}%"))
+        if search:
+            query = query.filter(Source.name.ilike(f"%{search}%"))
 
-    if status:
-        query = query.filter(Source.status == status)
+        if status:
+            query = query.filter(Source.status == status)
 
-    sources = query.order_by(Source.name).all()
+        sources = query.order_by(Source.name).all()
 
-    # Calculate stats
-    total = len(sources)
-    active = sum(1 for s in sources if s.is_active and s.status == SourceStatus.ACTIVE)
-    disabled = sum(1 for s in sources if not s.is_active or s.status == SourceStatus.DISABLED)
-    errors = sum(1 for s in sources if s.status == SourceStatus.ERROR)
+        # Calculate stats
+        total = len(sources)
+        active = sum(1 for s in sources if s.is_active and s.status == SourceStatus.ACTIVE)
+        disabled = sum(1 for s in sources if not s.is_active or s.status == SourceStatus.DISABLED)
+        errors = sum(1 for s in sources if s.status == SourceStatus.ERROR)
 
-    return {
-        "total": total,
-        "active": active,
-        "disabled": disabled,
-        "errors": errors,
-        "items": sources
-    }
+        return {
+            "total": total,
+            "active": active,
+            "disabled": disabled,
+            "errors": errors,
+            "items": sources
+        }
+
+    return cached_response(request, [SOURCES], build, SourceList)
 
 
 @router.get("/stats", response_model=SourceStats)
 async def get_source_stats(
+        request: Request,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
-    total = db.query(func.count(Source.id)).scalar()
-    active = db.query(func.count(Source.id)).filter(
-        Source.is_active == True,
-        Source.status == SourceStatus.ACTIVE
-    ).scalar()
-    disabled = db.query(func.count(Source.id)).filter(
-        Source.is_active == False
-    ).scalar()
-    errors = db.query(func.count(Source.id)).filter(
-        Source.status == SourceStatus.ERROR
-    ).scalar()
-
-    return {
-        "total_sources": total,
-        "active_sources": active,
-        "disabled_sources": disabled,
-        "error_sources": errors
-    }
+    def build():
+        total = db.query(func.count(Source.id)).scalar()
+        active = db.query(func.count(Source.id)).filter(
+            Source.is_active == True,
+            Source.status == SourceStatus.ACTIVE
+        ).scalar()
+        disabled = db.query(func.count(Source.id)).filter(
+            Source.is_active == False
+        ).scalar()
+        errors = db.query(func.count(Source.id)).filter(
+            Source.status == SourceStatus.ERROR
+        ).scalar()
+
+        return {
+            "total_sources": total,
+            "active_sources": active,
+            "disabled_sources": disabled,
+            "error_sources": errors
+        }
+
+    return cached_response(request, [SOURCES], build, SourceStats)
 
 
 @router.get("/{source_id}", response_model=SourceResponse)
@@ -134,6 +143,7 @@ async def create_source(
     db.add(source)
     db.commit()
     db.refresh(source)
+    response_cache.invalidate(SOURCES)
 
     return source
 
@@ -164,6 +174,7 @@ async def update_source(
 
     db.commit()
     db.refresh(source)
+    response_cache.invalidate(SOURCES)
 
     return source
 
@@ -195,6 +206,7 @@ async def delete_source(
 
     db.delete(source)
     db.commit()
+    response_cache.invalidate(SOURCES)
 
     return None
 
@@ -221,5 +233,6 @@ async def toggle_source(
 
     db.commit()
     db.refresh(source)
+    response_cache.invalidate(SOURCES)
 
     return source
\ No newline at end of file
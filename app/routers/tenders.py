@@ -1,149 +1,226 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, func
+from sqlalchemy import and_, func, case
 from typing import List, Optional
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 
-from app.core.database import get_db
+from app.core.database import get_db, run_in_thread
+from app.core.cache import cached_response, response_cache, TENDERS, SOURCES
 from app.models.tender import Tender
 from app.models.source import Source
 from app.models.user import User
 from app.routers.auth import get_current_user
+from app.businessLogic.search_service import SearchService
+from app.businessLogic.stats_service import StatsService
+from app.businessLogic.archive_service import ArchiveService
+from app.utils.pagination import keyset_page, count_cache, InvalidCursor
 from app.schemas.tender_schema import (
     TenderCreate, TenderUpdate, TenderResponse, TenderList, TenderFilter
 )
-import openpyxl
-from io import BytesIO
-from fastapi.responses import StreamingResponse
+from app.models.export_job import ExportJob
+from app.integrations.excel_export import (
+    export_jobs, export_xlsx_file, iter_file, stream_csv
+)
+from fastapi.responses import FileResponse, StreamingResponse
+import os
 
 router = APIRouter()
 
 
-@router.get("/", response_model=TenderList)
-async def get_tenders(
-        status: Optional[str] = Query(None),
-        source_id: Optional[int] = Query(None),
-        search: Optional[str] = Query(None),
-        date_from: Optional[date] = Query(None),
-        date_to: Optional[date] = Query(None),
-        page: int = Query(1, ge=1),
-        page_size: int = Query(25, ge=1, le=100),
-        db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+def with_source_name(query, entity=Tender):
+    """Add Source.name to a Tender query with a single join"""
+    return query.outerjoin(Source, entity.source_id == Source.id).add_columns(Source.name)
+
+
+def list_query(
+        db: Session,
+        entity=Tender,
+        status: Optional[str] = None,
+        source_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
 ):
-    query = db.query(Tender).filter(Tender.is_deleted == False)
+    """Tenders matching the listing filters (search and paging are applied on top)"""
+    query = db.query(entity).filter(entity.is_deleted == False)
 
-    # Filters
     if status:
-        query = query.filter(Tender.status == status)
+        query = query.filter(entity.status == status)
 
     if source_id:
-        query = query.filter(Tender.source_id == source_id)
-
-    if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                Tender.title.ilike(search_term),
-                Tender.reference_id.ilike(search_term),
-                Tender.agency_name.ilike(search_term),
-                Tender.description.ilike(search_term)
-            )
-        )
+        query = query.filter(entity.source_id == source_id)
 
     if date_from:
-        query = query.filter(Tender.published_date >= date_from)
+        query = query.filter(entity.published_date >= date_from)
 
     if date_to:
-        query = query.filter(Tender.published_date <= date_to)
+        query = query.filter(entity.published_date <= date_to)
+
+    return query
+
+
+def _to_response(tender: Tender, source_name: Optional[str]) -> TenderResponse:
+    response = TenderResponse.model_validate(tender)
+    response.source_name = source_name
+    return response
 
-    # Count total
-    total = query.count()
+
+def _get_tender_row(db: Session, tender_id: int):
+    row = with_source_name(
+        db.query(Tender).filter(
+            Tender.id == tender_id,
+            Tender.is_deleted == False
+        )
+    ).first()
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tender not found"
+        )
+
+    return row
+
+
+def _tender_page(
+        db: Session,
+        include_archived: bool,
+        status: Optional[str],
+        source_id: Optional[int],
+        search: Optional[str],
+        date_from: Optional[date],
+        date_to: Optional[date],
+        page: int,
+        page_size: int,
+        cursor: Optional[str]
+) -> dict:
+    # Live tenders only, unless archived history is asked for
+    entity = ArchiveService.tender_entity(include_archived)
+
+    query = list_query(db, entity, status, source_id, date_from, date_to)
+    relevance = None
+    next_cursor = prev_cursor = None
+
+    if search:
+        query, relevance = SearchService.apply_search(db, query, search, entity)
+
+    # Count total (cached per filter combination)
+    count_key = ("tenders", status, source_id, search, date_from, date_to, include_archived)
+    total, total_is_estimate = count_cache.get_or_compute(count_key, query.count)
+
+    # Source names come from the same query
+    query = with_source_name(query, entity)
 
     # Pagination
-    offset = (page - 1) * page_size
-    tenders = query.order_by(Tender.created_at.desc()).offset(offset).limit(page_size).all()
+    if relevance is not None:
+        # Relevance order has no stable keyset; search results stay offset-paged
+        offset = (page - 1) * page_size
+        rows = query.order_by(
+            relevance.desc(), entity.created_at.desc()
+        ).offset(offset).limit(page_size).all()
+    elif cursor or page == 1:
+        try:
+            rows, next_cursor, prev_cursor = keyset_page(
+                query, entity.created_at, entity.id, page_size, cursor
+            )
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        # Legacy page numbers
+        offset = (page - 1) * page_size
+        rows = query.order_by(
+            entity.created_at.desc(), entity.id.desc()
+        ).offset(offset).limit(page_size).all()
 
-    # Add source names
-    items = []
-    for tender in tenders:
-        tender_dict = TenderResponse.from_orm(tender).dict()
-        tender_dict['source_name'] = tender.source.name if tender.source else None
-        items.append(TenderResponse(**tender_dict))
+    items = [_to_response(tender, source_name) for tender, source_name in rows]
 
     return {
         "total": total,
+        "total_is_estimate": total_is_estimate,
         "page": page,
         "page_size": page_size,
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor,
         "items": items
     }
 
 
-@router.get("/{tender_id}", response_model=TenderResponse)
-async def get_tender(
-        tender_id: int,
-        db: Session = Depends(get_db),
+@router.get("/", response_model=TenderList)
+async def get_tenders(
+        status: Optional[str] = Query(None),
+        source_id: Optional[int] = Query(None),
+        search: Optional[str] = Query(None),
+        date_from: Optional[date] = Query(None),
+        date_to: Optional[date] = Query(None),
+        page: int = Query(1, ge=1),
+        page_size: int = Query(25, ge=1, le=100),
+        cursor: Optional[str] = Query(None),
+        include_archived: bool = Query(False),
         current_user: User = Depends(get_current_user)
 ):
-    tender = db.query(Tender).filter(
-        Tender.id == tender_id,
-        Tender.is_deleted == False
-    ).first()
+    # The listing is built with the sync query helpers shared with query_plan
+    return await run_in_thread(
+        _tender_page, include_archived, status, source_id, search,
+        date_from, date_to, page, page_size, cursor
+    )
 
-    if not tender:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Tender not found"
-        )
+
+def _get_tender(db: Session, tender_id: int, include_archived: bool) -> TenderResponse:
+
+    if include_archived:
+        archived = ArchiveService.get_archived(db, tender_id)
+        if archived:
+            source = db.query(Source.name).filter(Source.id == archived.source_id).first()
+            return _to_response(archived, source.name if source else None)
+
+    tender, source_name = _get_tender_row(db, tender_id)
 
     # Mark as viewed if it was new
     if tender.status == "new":
         tender.status = "viewed"
         db.commit()
 
-    tender_dict = TenderResponse.from_orm(tender).dict()
-    tender_dict['source_name'] = tender.source.name if tender.source else None
-
-    return TenderResponse(**tender_dict)
+    return _to_response(tender, source_name)
 
 
-@router.patch("/{tender_id}", response_model=TenderResponse)
-async def update_tender(
+@router.get("/{tender_id}", response_model=TenderResponse)
+async def get_tender(
         tender_id: int,
-        tender_update: TenderUpdate,
-        db: Session = Depends(get_db),
+        include_archived: bool = Query(False),
         current_user: User = Depends(get_current_user)
 ):
-    tender = db.query(Tender).filter(
-        Tender.id == tender_id,
-        Tender.is_deleted == False
-    ).first()
+    return await run_in_thread(_get_tender, tender_id, include_archived)
 
-    if not tender:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Tender not found"
-        )
 
-    # Update fields
-    for field, value in tender_update.dict(exclude_unset=True).items():
+def _update_tender(db: Session, tender_id: int, update_data: dict) -> TenderResponse:
+
+    tender, source_name = _get_tender_row(db, tender_id)
+
+    # Update fields (the source can't change here, so the joined name stays valid)
+    for field, value in update_data.items():
         setattr(tender, field, value)
 
     db.commit()
     db.refresh(tender)
 
-    tender_dict = TenderResponse.from_orm(tender).dict()
-    tender_dict['source_name'] = tender.source.name if tender.source else None
-
-    return TenderResponse(**tender_dict)
+    return _to_response(tender, source_name)
 
 
-@router.delete("/{tender_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_tender(
+@router.patch("/{tender_id}", response_model=TenderResponse)
+async def update_tender(
         tender_id: int,
-        db: Session = Depends(get_db),
+        tender_update: TenderUpdate,
         current_user: User = Depends(get_current_user)
 ):
+    response = await run_in_thread(
+        _update_tender, tender_id, tender_update.dict(exclude_unset=True)
+    )
+    response_cache.invalidate(TENDERS)
+
+    return response
+
+
+def _delete_tender(db: Session, tender_id: int):
+
     tender = db.query(Tender).filter(Tender.id == tender_id).first()
 
     if not tender:
@@ -156,6 +233,15 @@ async def delete_tender(
     tender.is_deleted = True
     db.commit()
 
+
+@router.delete("/{tender_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_tender(
+        tender_id: int,
+        current_user: User = Depends(get_current_user)
+):
+    await run_in_thread(_delete_tender, tender_id)
+    response_cache.invalidate(TENDERS)
+
     return None
 
 
@@ -168,105 +254,166 @@ async def export_tenders_excel(
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
-    query = db.query(Tender).filter(Tender.is_deleted == False)
-
-    if status:
-        query = query.filter(Tender.status == status)
-    if source_id:
-        query = query.filter(Tender.source_id == source_id)
-    if date_from:
-        query = query.filter(Tender.published_date >= date_from)
-    if date_to:
-        query = query.filter(Tender.published_date <= date_to)
-
-    tenders = query.order_by(Tender.published_date.desc()).all()
-
-    # Create Excel workbook
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Tenders"
-
-    # Headers (matching your UI from image)
-    headers = [
-        "Title", "Reference ID", "Agency", "Location",
-        "Source", "Published Date", "Deadline",
-        "Days Until Deadline", "Status", "Description"
-    ]
-    ws.append(headers)
-
-    # Data rows
-    for tender in tenders:
-        ws.append([
-            tender.title,
-            tender.reference_id,
-            tender.agency_name or "",
-            tender.agency_location or "",
-            tender.source.name if tender.source else "",
-            tender.published_date.strftime("%Y-%m-%d") if tender.published_date else "",
-            tender.deadline_date.strftime("%Y-%m-%d") if tender.deadline_date else "",
-            tender.days_until_deadline if tender.days_until_deadline else "",
-            tender.status,
-            tender.description or ""
-        ])
-
-    # Save to BytesIO
-    output = BytesIO()
-    wb.save(output)
-    output.seek(0)
+    # Write-only workbook into a spooled temp file (in a worker thread, with
+    # its own session), then stream it out in chunks
+    output = await run_in_thread(export_xlsx_file, status, source_id, date_from, date_to)
 
     filename = f"tenders_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
 
     return StreamingResponse(
-        output,
+        iter_file(output),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
 
 
+@router.get("/export/csv")
+async def export_tenders_csv(
+        status: Optional[str] = Query(None),
+        source_id: Optional[int] = Query(None),
+        date_from: Optional[date] = Query(None),
+        date_to: Optional[date] = Query(None),
+        current_user: User = Depends(get_current_user)
+):
+    filename = f"tenders_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+
+    # Rows go to the client as they come off the cursor
+    return StreamingResponse(
+        stream_csv(status, source_id, date_from, date_to),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+
+async def _run_export_job(job_id: str):
+    await run_in_thread(export_jobs.run, job_id)
+
+
+def _export_job_status(job: ExportJob) -> dict:
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "format": job.format,
+        "row_count": job.row_count,
+        "error": job.error,
+        "created_at": job.created_at,
+        "completed_at": job.completed_at,
+        "download_url": f"/api/tenders/export/jobs/{job.id}/download" if job.status == "completed" else None
+    }
+
+
+def _get_export_job(db: Session, job_id: str, current_user: User) -> ExportJob:
+    job = export_jobs.get(db, job_id)
+
+    if not job or job.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export job not found"
+        )
+
+    return job
+
+
+@router.post("/export/jobs", status_code=status.HTTP_202_ACCEPTED)
+async def create_export_job(
+        background_tasks: BackgroundTasks,
+        format: str = Query("xlsx", pattern="^(xlsx|csv)$"),
+        status: Optional[str] = Query(None),
+        source_id: Optional[int] = Query(None),
+        date_from: Optional[date] = Query(None),
+        date_to: Optional[date] = Query(None),
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    """Build a large export in the background; poll the job for its download URL"""
+    job = export_jobs.create(
+        db,
+        user_id=current_user.id,
+        export_format=format,
+        filters={
+            "status": status,
+            "source_id": source_id,
+            "date_from": date_from,
+            "date_to": date_to
+        }
+    )
+
+    background_tasks.add_task(_run_export_job, job.id)
+
+    return _export_job_status(job)
+
+
+@router.get("/export/jobs/{job_id}")
+async def get_export_job(
+        job_id: str,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    return _export_job_status(_get_export_job(db, job_id, current_user))
+
+
+@router.get("/export/jobs/{job_id}/download")
+async def download_export_job(
+        job_id: str,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+):
+    job = _get_export_job(db, job_id, current_user)
+
+    if job.status != "completed" or not job.path:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Export is {job.status}"
+        )
+
+    if not os.path.exists(job.path):
+        # EXPORT_DIR is not shared with the replica that built the file
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Export file is not available on this server"
+        )
+
+    media_type = (
+        "text/csv" if job.format == "csv"
+        else "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    )
+
+    return FileResponse(job.path, media_type=media_type, filename=job.filename)
+
+
 @router.get("/stats/dashboard")
 async def get_dashboard_stats(
+        request: Request,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
-    today = date.today()
-    yesterday = date.today().replace(day=today.day - 1)
-
-    # New tenders today
-    new_today = db.query(func.count(Tender.id)).filter(
-        func.date(Tender.created_at) == today,
-        Tender.is_deleted == False
-    ).scalar()
-
-    # New tenders yesterday
-    new_yesterday = db.query(func.count(Tender.id)).filter(
-        func.date(Tender.created_at) == yesterday,
-        Tender.is_deleted == False
-    ).scalar()
-
-    # Calculate percentage change
-    if new_yesterday > 0:
-        change_percent = ((new_today - new_yesterday) / new_yesterday) * 100
-    else:
-        change_percent = 100 if new_today > 0 else 0
+    def build():
+        today = StatsService.today()
+        yesterday = today - timedelta(days=1)
 
-    # Keyword matches today
-    keyword_matches = db.query(func.count(Tender.id)).filter(
-        func.date(Tender.created_at) == today,
-        Tender.keyword_match_count > 0,
-        Tender.is_deleted == False
-    ).scalar()
+        # New and matched tenders from the daily rollup
+        totals = StatsService.totals_by_day(db, [today, yesterday])
 
-    # Active sources
-    from app.models.source import Source
-    active_sources = db.query(func.count(Source.id)).filter(
-        Source.is_active == True
-    ).scalar()
+        new_today = totals[today]["new"]
+        new_yesterday = totals[yesterday]["new"]
 
-    total_sources = db.query(func.count(Source.id)).scalar()
+        # Calculate percentage change
+        change_percent = StatsService.percent_change(new_today, new_yesterday)
 
-    return {
-        "new_tenders_today": new_today,
-        "change_from_yesterday": round(change_percent, 1),
-        "keyword_matches": keyword_matches,
-        "active_sources": f"{active_sources}/{total_sources}"
-    }
\ No newline at end of file
+        # Keyword matches today
+        keyword_matches = totals[today]["matched"]
+
+        # Active sources
+        active_sources, total_sources = db.query(
+            func.count(case((Source.is_active == True, 1))),
+            func.count(Source.id)
+        ).one()
+
+        return {
+            "new_tenders_today": new_today,
+            "change_from_yesterday": change_percent,
+            "keyword_matches": keyword_matches,
+            "active_sources": f"{active_sources}/{total_sources}"
+        }
+
+    return cached_response(request, [TENDERS, SOURCES], build)
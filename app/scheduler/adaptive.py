@@ -0,0 +1,194 @@
+import asyncio
+import heapq
+from datetime import datetime, timedelta
+from typing import List, Optional, Set, Tuple
+
+from sqlalchemy import select, or_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, run_in_thread
+from app.models.fetch_log import FetchLog, FetchStatus
+from app.models.source import Source
+from app.utils.logger import setup_logger
+
+logger = setup_logger("adaptive_scheduler")
+
+# Interval bounds
+MIN_INTERVAL_MINUTES = 15
+MAX_INTERVAL_MINUTES = 7 * 24 * 60
+
+# Fetches worth of history used to estimate a source's change rate
+HISTORY_SIZE = 10
+
+# Aim for roughly this many new/updated tenders per fetch
+TARGET_CHANGES_PER_FETCH = 5
+
+# A single step never shrinks the interval by more than this factor
+MAX_SHRINK_FACTOR = 4
+
+
+def default_interval_minutes() -> int:
+    return settings.DEFAULT_FETCH_INTERVAL_HOURS * 60
+
+
+def _clamp(minutes: float) -> int:
+    return int(min(MAX_INTERVAL_MINUTES, max(MIN_INTERVAL_MINUTES, minutes)))
+
+
+class AdaptiveFetchPlanner:
+    """
+    Per-source fetch intervals driven by observed change rate.
+
+    Quiet sources back off exponentially (the interval doubles after every
+    fetch that found nothing); busy sources move toward the interval at
+    which a fetch would find about TARGET_CHANGES_PER_FETCH changes.
+    """
+
+    @staticmethod
+    def next_interval(current_minutes: int, history: List[Tuple[datetime, int]]) -> int:
+        """
+        Args:
+            current_minutes: Interval used for the fetch that just ran
+            history: (started_at, new + updated) of recent successful
+                fetches, newest first
+
+        Returns:
+            Interval in minutes until the next fetch
+        """
+        if not history or history[0][1] == 0:
+            return _clamp(current_minutes * 2)
+
+        total_changes = sum(changes for _, changes in history)
+
+        if len(history) >= 2:
+            span_hours = (history[0][0] - history[-1][0]).total_seconds() / 3600
+            # The oldest fetch's changes accrued before the span starts
+            changes_in_span = total_changes - history[-1][1]
+        else:
+            span_hours = current_minutes / 60
+            changes_in_span = total_changes
+
+        if span_hours <= 0 or changes_in_span <= 0:
+            return _clamp(current_minutes)
+
+        rate_per_hour = changes_in_span / span_hours
+        target_minutes = TARGET_CHANGES_PER_FETCH / rate_per_hour * 60
+
+        # Tighten quickly but not all at once; loosen at most 2x per step
+        target_minutes = max(target_minutes, current_minutes / MAX_SHRINK_FACTOR)
+        target_minutes = min(target_minutes, current_minutes * 2)
+
+        return _clamp(target_minutes)
+
+    @staticmethod
+    def reschedule(db: Session, source: Source, now: Optional[datetime] = None) -> datetime:
+        """
+        Set a source's interval and next_fetch_at from its fetch history.
+        Does not commit.
+        """
+        now = now or datetime.utcnow()
+        current = source.fetch_interval_minutes or default_interval_minutes()
+
+        rows = db.query(
+            FetchLog.started_at, FetchLog.new_tenders, FetchLog.updated_tenders
+        ).filter(
+            FetchLog.source_id == source.id,
+            FetchLog.status == FetchStatus.SUCCESS
+        ).order_by(FetchLog.created_at.desc()).limit(HISTORY_SIZE).all()
+
+        history = [
+            (started_at, (new or 0) + (updated or 0))
+            for started_at, new, updated in rows
+            if started_at is not None
+        ]
+
+        interval = AdaptiveFetchPlanner.next_interval(current, history)
+
+        source.fetch_interval_minutes = interval
+        source.next_fetch_at = now + timedelta(minutes=interval)
+
+        logger.info(f"Next fetch for {source.name} in {interval} min (was {current} min)")
+
+        return source.next_fetch_at
+
+    @staticmethod
+    def postpone(source: Source, now: Optional[datetime] = None) -> datetime:
+        """Keep the current interval (e.g. after a failed fetch). Does not commit."""
+        now = now or datetime.utcnow()
+        interval = source.fetch_interval_minutes or default_interval_minutes()
+        source.next_fetch_at = now + timedelta(minutes=interval)
+        return source.next_fetch_at
+
+
+class DueSourceQueue:
+    """
+    Min-heap of (next_fetch_at, source_id).
+
+    Refreshed from the sources table every tick, so the database stays the
+    source of truth; the heap only orders what is due, most overdue first.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, int]] = []
+
+    def refresh(self, entries: List[Tuple[Optional[datetime], int]]):
+        # Never-fetched sources are due immediately
+        self._heap = [(next_at or datetime.min, source_id) for next_at, source_id in entries]
+        heapq.heapify(self._heap)
+
+    def pop_due(self, now: datetime, limit: int) -> List[int]:
+        due = []
+        while self._heap and len(due) < limit and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[1])
+        return due
+
+    def __len__(self):
+        return len(self._heap)
+
+
+# SINGLE INSTANCE
+due_sources = DueSourceQueue()
+
+# Runs started by the dispatcher; kept referenced until they finish
+_dispatched_runs: Set[asyncio.Task] = set()
+
+
+async def dispatch_due_sources_job():
+    """
+    Start fetches for the sources whose next_fetch_at has passed, most
+    overdue first, while fewer than MAX_CONCURRENT_SCRAPES are running.
+
+    Fetches run in the background rather than within the tick, so a slow
+    source only holds its own slot and the others keep being dispatched
+    every minute.
+    """
+    from app.core.scheduler import (
+        start_fetch_run, execute_fetch_run, is_source_fetching, fetching_count
+    )
+
+    free = settings.MAX_CONCURRENT_SCRAPES - fetching_count()
+    if free <= 0:
+        return
+
+    now = datetime.utcnow()
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Source.next_fetch_at, Source.id).where(
+                Source.is_active == True,
+                # Sources behind an open circuit breaker wait out their cooldown
+                or_(Source.breaker_opened_until.is_(None), Source.breaker_opened_until <= now)
+            )
+        )
+        due_sources.refresh([
+            (next_at, source_id) for next_at, source_id in result.all()
+            if not is_source_fetching(source_id)
+        ])
+
+    due = due_sources.pop_due(now, free)
+    if due:
+        run_id = await run_in_thread(start_fetch_run, due, "scheduled")
+        task = asyncio.create_task(execute_fetch_run(run_id, due))
+        _dispatched_runs.add(task)
+        task.add_done_callback(_dispatched_runs.discard)
@@ -1,28 +1,4 @@
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
-from app.scheduler.jobs import fetch_all_sources_job
-from app.core.config import settings
+# Kept for existing imports; the scheduler lives in app.core.scheduler
+from app.core.scheduler import scheduler, start_scheduler, stop_scheduler
 
-settings = settings()
-scheduler = BackgroundScheduler(timezone=settings.SCHEDULER_TIMEZONE)
-
-
-def start_scheduler():
-    """Initialize and start the scheduler"""
-
-    # Daily fetch at configured time
-    hour, minute = settings.DEFAULT_FETCH_TIME.split(':')
-    scheduler.add_job(
-        fetch_all_sources_job,
-        CronTrigger(hour=int(hour), minute=int(minute)),
-        id='daily_fetch',
-        replace_existing=True
-    )
-
-    scheduler.start()
-    print("✅ Scheduler started")
-
-
-def stop_scheduler():
-    """Stop the scheduler"""
-    scheduler.shutdown()
\ No newline at end of file
+__all__ = ["scheduler", "start_scheduler", "stop_scheduler"]
@@ -14,7 +14,8 @@ from app.schemas.fetch_log_schema import (
     FetchLogCreate, FetchLogResponse, FetchLogList
 )
 from app.schemas.notification_schema import (
-    NotificationCreate, NotificationResponse, NotificationList, NotificationSettings
+    NotificationCreate, NotificationResponse, NotificationList, NotificationSettings,
+    SubscriptionCreate, SubscriptionResponse, SubscriptionList
 )
 
 __all__ = [
@@ -23,5 +24,6 @@ __all__ = [
     "KeywordCreate", "KeywordUpdate", "KeywordResponse", "KeywordList",
     "SourceCreate", "SourceUpdate", "SourceResponse", "SourceList",
     "FetchLogCreate", "FetchLogResponse", "FetchLogList",
-    "NotificationCreate", "NotificationResponse", "NotificationList", "NotificationSettings"
+    "NotificationCreate", "NotificationResponse", "NotificationList", "NotificationSettings",
+    "SubscriptionCreate", "SubscriptionResponse", "SubscriptionList"
 ]
\ No newline at end of file
@@ -22,6 +22,8 @@ class FetchLogCreate(FetchLogBase):
     tenders_found: int = 0
     new_tenders: int = 0
     updated_tenders: int = 0
+    pages_fetched: int = 0
+    run_id: Optional[str] = None
     error_details: Optional[str] = None
     started_at: datetime
     completed_at: Optional[datetime] = None
@@ -33,6 +35,8 @@ class FetchLogResponse(FetchLogBase):
     tenders_found: int
     new_tenders: int
     updated_tenders: int
+    pages_fetched: Optional[int] = 0
+    run_id: Optional[str] = None
     error_details: Optional[str] = None
     started_at: datetime
     completed_at: Optional[datetime] = None
@@ -49,6 +53,9 @@ class FetchLogList(BaseModel):
     warning_count: int
     error_count: int
     info_count: int
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
     items: List[FetchLogResponse]
 
 
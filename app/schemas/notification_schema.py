@@ -3,6 +3,8 @@ from typing import Optional, List
 from datetime import datetime, time
 from enum import Enum
 
+from app.schemas.keyword_schema import KeywordCategory, KeywordPriority
+
 
 class NotificationType(str, Enum):
     NEW_TENDER = "new_tender"
@@ -46,7 +48,10 @@ class NotificationResponse(NotificationBase):
 
 class NotificationList(BaseModel):
     total: int
+    total_is_estimate: bool = False
     unread_count: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
     items: List[NotificationResponse]
 
 
@@ -77,4 +82,23 @@ class NotificationSettingsUpdate(BaseModel):
     system_errors: Optional[bool] = None
     enable_silent_hours: Optional[bool] = None
     silent_start_time: Optional[time] = None
-    silent_end_time: Optional[time] = None
\ No newline at end of file
+    silent_end_time: Optional[time] = None
+
+class SubscriptionCreate(BaseModel):
+    keyword_id: Optional[int] = None
+    category: Optional[KeywordCategory] = None
+    min_priority: Optional[KeywordPriority] = None
+
+
+class SubscriptionResponse(SubscriptionCreate):
+    id: int
+    user_id: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class SubscriptionList(BaseModel):
+    total: int
+    items: List[SubscriptionResponse]
@@ -52,6 +52,10 @@ class SourceResponse(SourceBase):
     last_fetch_at: Optional[datetime] = None
     last_success_at: Optional[datetime] = None
     consecutive_failures: int = 0
+    fetch_interval_minutes: Optional[int] = None
+    next_fetch_at: Optional[datetime] = None
+    breaker_state: Optional[str] = None
+    breaker_opened_until: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
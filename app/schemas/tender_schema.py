@@ -65,8 +65,11 @@ class TenderResponse(TenderBase):
 
 class TenderList(BaseModel):
     total: int
+    total_is_estimate: bool = False
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
     items: List[TenderResponse]
 
 
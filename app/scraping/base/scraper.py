@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 import logging
 import re
 import hashlib
@@ -17,6 +17,8 @@ class BaseScraper(ABC):
         self.source = source
         self.timeout = getattr(settings, "REQUEST_TIMEOUT", 30)
         self.user_agent = getattr(settings, "USER_AGENT", "Mozilla/5.0")
+        # Progress hook, called once per page downloaded
+        self.on_page: Optional[Callable[[], None]] = None
 
     @abstractmethod
     async def scrape(self) -> List[Dict]:
@@ -24,6 +26,10 @@ class BaseScraper(ABC):
 
     # ---------- SHARED HELPERS ----------
 
+    def page_fetched(self):
+        if self.on_page:
+            self.on_page()
+
     def normalize_date(self, value: str) -> Optional[date]:
         return parse_date(value)
 
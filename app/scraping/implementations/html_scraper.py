@@ -10,6 +10,7 @@ class HTMLScraper(BaseScraper):
 
         response = session.get(self.source.url, timeout=self.timeout)
         response.raise_for_status()
+        self.page_fetched()
 
         soup = BeautifulSoup(response.text, "html.parser")
         tenders = []
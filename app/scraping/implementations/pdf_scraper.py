@@ -26,6 +26,7 @@ class PDFScraper(BaseScraper):
                 headers={'User-Agent': self.user_agent}
             )
             response.raise_for_status()
+            self.page_fetched()
 
             # Parse PDF
             pdf_file = BytesIO(response.content)
@@ -1,9 +1,11 @@
 from .date_normalizer import parse_date
 from .text_cleaner import clean_text
 from .session_manager import SessionManager
+from .circuit_breaker import CircuitBreaker
 
 __all__ = [
     "parse_date",
     "clean_text",
     "SessionManager",
+    "CircuitBreaker",
 ]
@@ -0,0 +1,128 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+import requests
+
+from app.core.config import settings
+from app.models.source import BreakerState, Source
+
+logger = logging.getLogger(__name__)
+
+# Consecutive failures before the breaker opens
+FAILURE_THRESHOLD = 3
+
+# Cooldown after the first trip; doubles on every failed probe
+BASE_COOLDOWN_MINUTES = 15
+MAX_COOLDOWN_MINUTES = 24 * 60
+
+# Probes are a single request with no retries
+PROBE_TIMEOUT_SECONDS = 10
+
+
+class CircuitBreaker:
+    """
+    Per-source circuit breaker, persisted on the Source row.
+
+    CLOSED -> OPEN after FAILURE_THRESHOLD consecutive failures. While
+    OPEN the source is not fetched at all. Once the cooldown passes it goes
+    HALF_OPEN: a cheap probe is sent and, if the portal answers, one real
+    fetch is attempted. Success closes the breaker; any failure re-opens it
+    with double the cooldown. None of these methods commit.
+    """
+
+    @staticmethod
+    def state(source: Source) -> BreakerState:
+        return source.breaker_state or BreakerState.CLOSED
+
+    @staticmethod
+    def is_open(source: Source, now: Optional[datetime] = None) -> bool:
+        now = now or datetime.utcnow()
+        return (
+            CircuitBreaker.state(source) == BreakerState.OPEN
+            and source.breaker_opened_until is not None
+            and source.breaker_opened_until > now
+        )
+
+    @staticmethod
+    def allow_request(source: Source, now: Optional[datetime] = None, force: bool = False) -> bool:
+        """
+        Whether a fetch may run now. Moves an OPEN breaker whose cooldown
+        has passed (or any breaker when `force`d) to HALF_OPEN.
+        """
+        state = CircuitBreaker.state(source)
+
+        if state == BreakerState.CLOSED:
+            return True
+
+        if state == BreakerState.OPEN and not force and CircuitBreaker.is_open(source, now):
+            return False
+
+        if state == BreakerState.OPEN:
+            source.breaker_state = BreakerState.HALF_OPEN
+            logger.info(f"Circuit half-open for {source.name}")
+
+        return True
+
+    @staticmethod
+    def probe(source: Source) -> bool:
+        """
+        One HEAD request (GET if HEAD is refused) with no retries. Any
+        answer below 500 other than 404/410 counts as the portal being up.
+        """
+        headers = {"User-Agent": settings.USER_AGENT}
+
+        try:
+            response = requests.head(
+                source.url,
+                headers=headers,
+                timeout=PROBE_TIMEOUT_SECONDS,
+                allow_redirects=True
+            )
+            if response.status_code in (405, 501):
+                response = requests.get(
+                    source.url,
+                    headers=headers,
+                    timeout=PROBE_TIMEOUT_SECONDS,
+                    stream=True
+                )
+                response.close()
+        except requests.RequestException as e:
+            logger.info(f"Probe failed for {source.name}: {e}")
+            return False
+
+        alive = response.status_code < 500 and response.status_code not in (404, 410)
+        if not alive:
+            logger.info(f"Probe failed for {source.name}: HTTP {response.status_code}")
+        return alive
+
+    @staticmethod
+    def record_success(source: Source):
+        if CircuitBreaker.state(source) != BreakerState.CLOSED:
+            logger.info(f"Circuit closed for {source.name}")
+
+        source.breaker_state = BreakerState.CLOSED
+        source.breaker_opened_until = None
+        source.breaker_cooldown_minutes = None
+
+    @staticmethod
+    def record_failure(source: Source, now: Optional[datetime] = None):
+        """Call after consecutive_failures has been incremented"""
+        now = now or datetime.utcnow()
+        state = CircuitBreaker.state(source)
+
+        if state == BreakerState.HALF_OPEN:
+            cooldown = min(
+                (source.breaker_cooldown_minutes or BASE_COOLDOWN_MINUTES) * 2,
+                MAX_COOLDOWN_MINUTES
+            )
+        elif (source.consecutive_failures or 0) >= FAILURE_THRESHOLD:
+            cooldown = BASE_COOLDOWN_MINUTES
+        else:
+            return
+
+        source.breaker_state = BreakerState.OPEN
+        source.breaker_cooldown_minutes = cooldown
+        source.breaker_opened_until = now + timedelta(minutes=cooldown)
+
+        logger.warning(f"Circuit open for {source.name} for {cooldown} min")
@@ -0,0 +1,174 @@
+import base64
+import json
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Query
+
+# How long a cached total is served before it is recounted
+COUNT_CACHE_TTL_SECONDS = 60
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor cannot be decoded"""
+
+
+def encode_cursor(created_at: datetime, row_id: int, direction: str = "next") -> str:
+    """Opaque cursor pointing just past (created_at, id) in the given direction"""
+    payload = json.dumps({"c": created_at.isoformat(), "i": row_id, "d": direction})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        direction = payload.get("d", "next")
+        if direction not in ("next", "prev"):
+            raise ValueError(direction)
+        return datetime.fromisoformat(payload["c"]), int(payload["i"]), direction
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor}") from e
+
+
+def keyset_query(
+        query: Query,
+        created_column,
+        id_column,
+        page_size: int,
+        cursor: Optional[str] = None
+) -> Tuple[Query, str]:
+    """
+    The statement behind keyset_page: `query` ordered newest first on
+    (created_at, id), seeking past `cursor`, limited to one extra row.
+
+    The cursor is turned into a range predicate on the sort key, so the
+    database seeks straight to the page instead of skipping OFFSET rows.
+
+    Returns:
+        (query, direction)
+    """
+    direction = "next"
+
+    if cursor:
+        created_at, row_id, direction = decode_cursor(cursor)
+
+        if direction == "next":
+            query = query.filter(or_(
+                created_column < created_at,
+                and_(created_column == created_at, id_column < row_id)
+            ))
+        else:
+            query = query.filter(or_(
+                created_column > created_at,
+                and_(created_column == created_at, id_column > row_id)
+            ))
+
+    if direction == "next":
+        query = query.order_by(created_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(created_column.asc(), id_column.asc())
+
+    # One extra row tells us whether there is another page
+    return query.limit(page_size + 1), direction
+
+
+def keyset_page(
+        query: Query,
+        created_column,
+        id_column,
+        page_size: int,
+        cursor: Optional[str] = None
+) -> Tuple[List, Optional[str], Optional[str]]:
+    """
+    Fetch one page of `query` ordered newest first on (created_at, id).
+
+    Returns:
+        (rows, next_cursor, prev_cursor)
+    """
+    query, direction = keyset_query(query, created_column, id_column, page_size, cursor)
+
+    rows = query.all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    if direction == "prev":
+        rows.reverse()
+
+    if not rows:
+        return rows, None, None
+
+    first, last = _sort_key(rows[0]), _sort_key(rows[-1])
+
+    if direction == "next":
+        next_cursor = encode_cursor(*last, "next") if has_more else None
+        prev_cursor = encode_cursor(*first, "prev") if cursor else None
+    else:
+        next_cursor = encode_cursor(*last, "next")
+        prev_cursor = encode_cursor(*first, "prev") if has_more else None
+
+    return rows, next_cursor, prev_cursor
+
+
+def _sort_key(row) -> Tuple[datetime, int]:
+    # Rows may be entities or (entity, extra columns...) rows
+    entity = row[0] if isinstance(row, (Row, tuple)) else row
+    return entity.created_at, entity.id
+
+
+class CountCache:
+    """
+    Short-lived cache of list totals.
+
+    Totals are keyed by the endpoint and its filters, so paging through a
+    result set counts it once per TTL instead of on every page load.
+    """
+
+    def __init__(self, ttl_seconds: int = COUNT_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, Tuple[float, object]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], object]) -> Tuple[object, bool]:
+        """
+        Returns:
+            (value, True if served from cache)
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now - entry[0] < self.ttl_seconds:
+                return entry[1], True
+
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = (now, value)
+            # Drop expired keys so filter combinations don't pile up
+            if len(self._entries) > 1000:
+                self._entries = {
+                    k: v for k, v in self._entries.items()
+                    if now - v[0] < self.ttl_seconds
+                }
+
+        return value, False
+
+    def invalidate(self, prefix: Optional[str] = None):
+        """Forget every total, or those whose key starts with `prefix`"""
+        with self._lock:
+            if prefix is None:
+                self._entries.clear()
+            else:
+                self._entries = {
+                    k: v for k, v in self._entries.items()
+                    if not (isinstance(k, tuple) and k and k[0] == prefix)
+                }
+
+
+# SINGLE INSTANCE
+count_cache = CountCache()
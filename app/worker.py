@@ -0,0 +1,167 @@
+"""
+Scrape worker.
+
+    python -m app.worker [--processes N]
+
+Polls the fetch_jobs queue and runs each fetch in a pool of child
+processes, so Selenium, PDF parsing and BeautifulSoup never share a CPU
+with the API. Run as many workers on as many hosts as needed; jobs are
+claimed with SELECT ... FOR UPDATE SKIP LOCKED and each fetch still takes
+the per-source lease.
+
+Children share nothing in memory with the API: notifications reach live
+streams through the API's NotificationRelay, silent-hours deferrals are
+stored on the rows, and subscription/preference caches expire on a TTL.
+Live per-page progress of a fetch run is only visible in the process
+running it; the API reports worker runs from their jobs and fetch logs.
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, Set
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, engine, sync_engine
+from app.businessLogic.fetch_job_service import FetchJobService
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger("app.worker")
+
+# Stale-job sweep runs every this many polls
+REQUEUE_EVERY_POLLS = 12
+
+
+def _fetch_in_child(source_id: int, force: bool, run_id: Optional[str]) -> Optional[Dict]:
+    """Runs in a pool process: one fetch on a fresh event loop and connection pool"""
+    from app.core.scheduler import run_source_fetch
+
+    async def run():
+        try:
+            return await run_source_fetch(source_id, force, run_id)
+        finally:
+            # Connections are bound to this loop / process
+            await engine.dispose()
+            sync_engine.dispose()
+
+    return asyncio.run(run())
+
+
+class Worker:
+
+    def __init__(self, processes: int):
+        self.processes = processes
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.pool = self._new_pool()
+        self.running: Set[asyncio.Task] = set()
+        self.stopping = asyncio.Event()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.processes,
+            # Children must not inherit the parent's event loop or DB connections
+            mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def _replace_pool(self, broken: ProcessPoolExecutor):
+        """A child died (OOM, segfault); the executor is unusable from then on"""
+        if self.pool is broken:
+            logger.warning("Scrape process pool broken, starting a new one")
+            broken.shutdown(wait=False, cancel_futures=True)
+            self.pool = self._new_pool()
+
+    async def _db(self, fn, *args):
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(fn, *args)
+
+    async def _run_job(self, job: Dict):
+        loop = asyncio.get_running_loop()
+        pool = self.pool
+
+        try:
+            result = await loop.run_in_executor(
+                pool, _fetch_in_child, job["source_id"], job["force"], job["run_id"]
+            )
+            await self._db(FetchJobService.finish, job["id"], result)
+            logger.info(f"Job {job['id']} (source {job['source_id']}) finished")
+        except BrokenProcessPool as e:
+            # Every job in the pool fails with this; requeue them (bounded by
+            # MAX_ATTEMPTS) since we can't tell which one killed the process
+            logger.error(f"Job {job['id']} (source {job['source_id']}) lost its process: {e}")
+            self._replace_pool(pool)
+            await self._db(FetchJobService.retry, job["id"], f"Scrape process died: {e}")
+        except Exception as e:
+            logger.error(f"Job {job['id']} (source {job['source_id']}) failed: {e}")
+            await self._db(FetchJobService.fail, job["id"], str(e))
+
+    async def run(self):
+        logger.info(f"Worker {self.worker_id} started with {self.processes} processes")
+        polls = 0
+
+        while not self.stopping.is_set():
+            try:
+                if polls % REQUEUE_EVERY_POLLS == 0:
+                    await self._db(FetchJobService.requeue_stale)
+
+                free = self.processes - len(self.running)
+                jobs = await self._db(FetchJobService.claim, self.worker_id, free)
+
+                for job in jobs:
+                    task = asyncio.create_task(self._run_job(job))
+                    self.running.add(task)
+                    task.add_done_callback(self.running.discard)
+            except Exception as e:
+                logger.error(f"Error polling fetch jobs: {e}")
+
+            polls += 1
+
+            try:
+                await asyncio.wait_for(self.stopping.wait(), settings.FETCH_WORKER_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+        # Let in-flight fetches finish so their jobs aren't left RUNNING
+        if self.running:
+            logger.info(f"Waiting for {len(self.running)} running jobs...")
+            await asyncio.gather(*self.running, return_exceptions=True)
+
+        self.pool.shutdown()
+        await engine.dispose()
+        logger.info(f"Worker {self.worker_id} stopped")
+
+    def stop(self):
+        self.stopping.set()
+
+
+async def main(processes: int):
+    worker = Worker(processes)
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:  # Windows
+            pass
+
+    await worker.run()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tender Intel scrape worker")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=settings.FETCH_WORKER_PROCESSES,
+        help="Number of scrape processes"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(args.processes))
@@ -0,0 +1,10 @@
+import os
+
+# Tests run without a database server; engines are created but never
+# connected. Must be set before app.core.config is imported.
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite://"
+os.environ.setdefault("DATABASE_PASSWORD", "test")
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("SMTP_USER", "test@example.com")
+os.environ.setdefault("SMTP_PASSWORD", "test")
+os.environ.setdefault("SMTP_FROM_EMAIL", "test@example.com")
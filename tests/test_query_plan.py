@@ -0,0 +1,15 @@
+import pytest
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import Session
+
+from app.core.query_plan import HOT_QUERIES
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_query_builds(name):
+    """Every checked statement builds from the app's helpers and compiles for MySQL"""
+    statement = HOT_QUERIES[name](Session())
+
+    sql = str(statement.compile(dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}))
+
+    assert sql.lstrip().upper().startswith("SELECT")